@@ -0,0 +1,111 @@
+"""Throughput of the shipped backends (LocalCache and the framework adapters) under
+concurrent access.
+
+Each backend is exercised by a number of threads performing decorated calls against a
+fixed set of keys (mostly hits with some misses). Backends whose framework is not installed
+are skipped.
+
+Usage:
+
+    python benchmarks/bench_backends.py
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import Result
+
+from slycache import LocalCache, Resilience, Slycache, caches
+from slycache.key_generator import StringFormatKeyGenerator
+from slycache.slycache import ProxyWithDefaults
+
+CACHE_NAME = "bench_backends"
+KEYS = 1000
+CALLS_PER_THREAD = 5000
+
+
+def django_backend():
+    from django.conf import settings
+
+    if not settings.configured:
+        settings.configure(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+            }
+        )
+    from django.core.cache import caches as django_caches
+
+    from slycache.ext.django.apps import DjangoCacheAdapter
+
+    return DjangoCacheAdapter(django_caches["default"])
+
+
+def flask_backend():
+    from flask_caching.backends import SimpleCache
+
+    from slycache.ext.flask import FlaskCacheAdapter
+
+    return FlaskCacheAdapter(SimpleCache(threshold=KEYS * 2))
+
+
+def local_lru_backend():
+    return LocalCache(max_entries=KEYS * 2, policy="lru")
+
+
+def local_tinylfu_backend():
+    return LocalCache(max_entries=KEYS * 2, policy="w-tinylfu")
+
+
+BACKENDS = {
+    "local_lru": local_lru_backend,
+    "local_tinylfu": local_tinylfu_backend,
+    "django_locmem": django_backend,
+    "flask_simple": flask_backend,
+}
+
+
+def _throughput(backend, threads: int, resilience=None) -> float:
+    caches.replace(CACHE_NAME, backend, resilience=resilience)
+    cache = Slycache(ProxyWithDefaults(CACHE_NAME), StringFormatKeyGenerator())
+
+    @cache.cache_result("{key}")
+    def compute(key):
+        return key
+
+    def worker(offset):
+        for i in range(CALLS_PER_THREAD):
+            compute((i * 7 + offset) % KEYS)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(worker, range(threads)))
+    elapsed = time.perf_counter() - start
+    caches.deregister(CACHE_NAME)
+    return threads * CALLS_PER_THREAD / elapsed
+
+
+def run(repeat=3, thread_counts=(1, 4, 16)):
+    results = []
+    for name, factory in BACKENDS.items():
+        try:
+            factory()
+        except ImportError:
+            print(f"skipping {name}: not installed")
+            continue
+        for threads in thread_counts:
+            best = max(_throughput(factory(), threads) for _ in range(repeat))
+            results.append(Result("backends", f"{name}_t{threads}", best, "ops/s"))
+        best = max(
+            _throughput(factory(), thread_counts[-1], Resilience(failure_threshold=5))
+            for _ in range(repeat)
+        )
+        results.append(
+            Result("backends", f"{name}_resilient_t{thread_counts[-1]}", best, "ops/s")
+        )
+    return results
+
+
+if __name__ == "__main__":
+    from harness import report
+
+    report(run())
@@ -0,0 +1,86 @@
+"""Overhead of the decorator hot path compared to a raw function call.
+
+Usage:
+
+    python benchmarks/bench_decorator.py
+"""
+
+from harness import Result, measure
+
+from slycache import CacheResult, Slycache, caches
+from slycache.key_generator import StringFormatKeyGenerator
+from slycache.slycache import ProxyWithDefaults
+
+CACHE_NAME = "bench_decorator"
+
+
+class DictBackend:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def get_many(self, keys):
+        return {key: self.data[key] for key in keys if key in self.data}
+
+
+def run(repeat=5):
+    backend = DictBackend()
+    caches.replace(CACHE_NAME, backend)
+    cache = Slycache(ProxyWithDefaults(CACHE_NAME), StringFormatKeyGenerator())
+
+    def raw(user_id, active):
+        return user_id
+
+    cached = cache.cache_result("{user_id}_{active}")(raw)
+    skip_get = cache.cache_result("{user_id}_{active}", skip_get=True)(raw)
+    single = cache.caching(CacheResult(["{user_id}"]))(raw)
+    multi = cache.caching(
+        CacheResult(["{user_id}"]),
+        CacheResult(["{user_id}_{active}"]),
+        CacheResult(["user_{user_id}"], namespace="other"),
+    )(raw)
+
+    def miss():
+        backend.data.clear()
+        cached(1, True)
+
+    def single_miss():
+        backend.data.clear()
+        single(1, True)
+
+    def multi_miss():
+        backend.data.clear()
+        multi(1, True)
+
+    cached(1, True)
+    number = 20_000
+    results = [
+        Result(
+            "decorator", "raw_call", measure(lambda: raw(1, True), number * 10, repeat)
+        ),
+        Result("decorator", "hit", measure(lambda: cached(1, True), number, repeat)),
+        Result("decorator", "miss", measure(miss, number, repeat)),
+        Result(
+            "decorator", "skip_get", measure(lambda: skip_get(1, True), number, repeat)
+        ),
+        Result(
+            "decorator", "caching_single_miss", measure(single_miss, number, repeat)
+        ),
+        Result("decorator", "caching_multi_miss", measure(multi_miss, number, repeat)),
+    ]
+    caches.deregister(CACHE_NAME)
+    return results
+
+
+if __name__ == "__main__":
+    from harness import report
+
+    report(run())
@@ -0,0 +1,54 @@
+"""Cost of generating keys for different argument types.
+
+Usage:
+
+    python benchmarks/bench_key_generation.py
+"""
+
+import datetime
+import uuid
+
+from harness import Result, measure
+
+from slycache.key_generator import StringFormatKeyGenerator
+
+
+def get_user(user_id, when=None, filters=None):
+    pass
+
+
+CASES = {
+    "primitive": ("{user_id}", {"user_id": 1234}),
+    "uuid": ("{user_id}", {"user_id": uuid.UUID(int=1234)}),
+    "datetime": (
+        "{user_id}_{when}",
+        {"user_id": 1, "when": datetime.datetime(2021, 3, 5, 22, 9)},
+    ),
+    "hashed_complex": (
+        "{user_id}_{filters}",
+        {"user_id": 1, "filters": {"status": ["active", "pending"], "limit": 10}},
+    ),
+}
+
+
+def run(repeat=5):
+    results = []
+    for cached in (False, True):
+        generator = StringFormatKeyGenerator(key_cache_size=1024 if cached else 0)
+        suffix = "_memo" if cached else ""
+        for name, (template, call_args) in CASES.items():
+            if cached and name == "hashed_complex":
+                continue  # mutable arguments are never memoized
+            micros = measure(
+                lambda: generator.generate("ns", template, get_user, call_args),
+                20_000,
+                repeat,
+            )
+            results.append(Result("key_generation", f"{name}{suffix}", micros))
+    return results
+
+
+if __name__ == "__main__":
+    from harness import report
+
+    report(run())
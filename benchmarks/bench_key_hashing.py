@@ -0,0 +1,61 @@
+"""Compare hashing of complex key arguments against the previous ``json.dumps`` implementation.
+
+Usage:
+
+    python benchmarks/bench_key_hashing.py
+"""
+
+import base64
+import datetime
+import hashlib
+import json
+import uuid
+
+from harness import Result, measure
+
+from slycache.key_generator import KeyHasher, SlycacheJSONEncoder
+
+
+def legacy_hash_data(data):
+    serialized = json.dumps(data, sort_keys=True, cls=SlycacheJSONEncoder)
+    hashed = hashlib.sha1(serialized.encode("utf8"))
+    return base64.urlsafe_b64encode(hashed.digest()).decode().rstrip("=")
+
+
+NOW = datetime.datetime(2021, 3, 5, 22, 9)
+
+DATASETS = {
+    "small_dict": {"a": 1, "b": [1, 2, 3], "c": "x"},
+    "int_list_10k": list(range(10_000)),
+    "records_2k": [
+        {"id": i, "name": f"user{i}", "tags": ["a", "b"], "score": i * 1.5}
+        for i in range(2_000)
+    ],
+    "typed_records_2k": [
+        {"id": i, "when": NOW, "uid": uuid.UUID(int=i)} for i in range(2_000)
+    ],
+    "wide_dict_5k": {f"key{i}": i for i in range(5_000)},
+}
+
+HASHERS = {
+    "legacy_sha1": legacy_hash_data,
+    "sha1": KeyHasher().hash,
+    "blake2b_16": KeyHasher("blake2b", 16).hash,
+}
+
+
+def run(repeat=5):
+    results = []
+    for dataset, data in DATASETS.items():
+        assert HASHERS["sha1"](data) == legacy_hash_data(data)
+        number = 20_000 if dataset == "small_dict" else 20
+        for name, func in HASHERS.items():
+            micros = measure(lambda: func(data), number, repeat)
+            results.append(Result("key_hashing", f"{dataset}/{name}", micros))
+    return results
+
+
+if __name__ == "__main__":
+    from harness import report
+
+    report(run())
@@ -0,0 +1,88 @@
+"""Shared helpers for the benchmark suite: timing, result files and baseline comparison."""
+
+import json
+import platform
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+import slycache
+
+
+@dataclass
+class Result:
+    group: str
+    name: str
+    value: float
+    unit: str = "us/op"
+
+    @property
+    def id(self) -> str:
+        return f"{self.group}/{self.name}"
+
+    @property
+    def higher_is_better(self) -> bool:
+        return self.unit == "ops/s"
+
+
+def measure(func: Callable, number: int, repeat: int = 5) -> float:
+    """Return the best time per call of ``func`` in microseconds."""
+    best = min(timeit.repeat(func, number=number, repeat=repeat))
+    return best / number * 1e6
+
+
+def metadata() -> Dict:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "slycache": slycache.__version__,
+    }
+
+
+def save(results: List[Result], path: str):
+    data = {"metadata": metadata(), "results": [asdict(result) for result in results]}
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load(path: str) -> List[Result]:
+    with open(path) as f:
+        data = json.load(f)
+    return [Result(**result) for result in data["results"]]
+
+
+def change(result: Result, baseline: Result) -> float:
+    """Relative change of the result compared to the baseline where a positive value is
+    a regression."""
+    if not baseline.value:
+        return 0.0
+    delta = (result.value - baseline.value) / baseline.value
+    return -delta if result.higher_is_better else delta
+
+
+def report(
+    results: List[Result],
+    baseline: Optional[List[Result]] = None,
+    threshold: float = 0.1,
+):
+    """Print the results, compared with the baseline if given.
+
+    Returns:
+        list: the results that regressed by more than ``threshold`` compared to the baseline
+    """
+    previous = {result.id: result for result in baseline or []}
+    regressions = []
+    print(f"{'benchmark':<48} {'value':>12} {'unit':<6} {'baseline':>12} {'change':>8}")
+    for result in results:
+        line = f"{result.id:<48} {result.value:>12.2f} {result.unit:<6}"
+        base = previous.get(result.id)
+        if base is not None:
+            delta = change(result, base)
+            flag = " !" if delta > threshold else ""
+            line += f" {base.value:>12.2f} {delta:>+7.1%}{flag}"
+            if delta > threshold:
+                regressions.append(result)
+        print(line)
+    return regressions
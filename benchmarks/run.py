@@ -0,0 +1,70 @@
+"""Run the benchmark suite.
+
+Usage:
+
+    python benchmarks/run.py                          # run everything and print the results
+    python benchmarks/run.py --output results.json    # also write machine readable results
+    python benchmarks/run.py --save-baseline          # store the results as the baseline
+    python benchmarks/run.py --compare                # compare against the stored baseline
+
+The exit status is 1 when ``--compare`` finds results that regressed by more than
+``--threshold`` (default 10%). Baselines are machine specific: store one on the machine
+the comparison runs on.
+"""
+
+import argparse
+import os
+import sys
+
+import bench_backends
+import bench_decorator
+import bench_key_generation
+import bench_key_hashing
+from harness import load, report, save
+
+SUITES = {
+    "decorator": bench_decorator.run,
+    "key_generation": bench_key_generation.run,
+    "key_hashing": bench_key_hashing.run,
+    "backends": bench_backends.run,
+}
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("suites", nargs="*", help=f"suites to run: {', '.join(SUITES)}")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE, help="baseline JSON file"
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--compare", action="store_true", help="compare with the baseline"
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    results = []
+    for name in args.suites or SUITES:
+        results.extend(SUITES[name](repeat=args.repeat))
+
+    baseline = load(args.baseline) if args.compare else None
+    regressions = report(results, baseline, args.threshold)
+
+    if args.output:
+        save(results, args.output)
+    if args.save_baseline:
+        save(results, args.baseline)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,25 @@
 __author__ = """snopoke"""
 __version__ = "0.3.1"
 
+from .batch import batching
 from .exceptions import InvalidCacheError, SlycacheException
+from .hotkeys import HotKeyTracker
 from .interface import CacheInterface, KeyGenerator
 from .invocations import CachePut, CacheRemove, CacheResult
+from .local import LocalCache
+from .lookup import ParallelLookup, SerialLookup
+from .refresh import RefreshAhead
+from .resilience import Resilience
+from .scope import RequestScope, request_scope
 from .slycache import Slycache, caches, slycache
+from .tracing import CacheEvent, TracingHook, hooks
+from .ttl import AdaptiveTTL, FixedTTL, JitteredTTL, TTLPolicy
+from .warm import WarmReport
 
 register_backend = slycache.register_backend
 with_defaults = slycache.with_defaults
 cache_result = slycache.cache_result
+cache_method = slycache.cache_method
 cache_put = slycache.cache_put
 cache_remove = slycache.cache_remove
 caching = slycache.caching
@@ -25,4 +36,21 @@ __all__ = [
     "InvalidCacheError",
     "KeyGenerator",
     "register_backend",
+    "Resilience",
+    "SerialLookup",
+    "ParallelLookup",
+    "RequestScope",
+    "request_scope",
+    "batching",
+    "WarmReport",
+    "TTLPolicy",
+    "FixedTTL",
+    "JitteredTTL",
+    "AdaptiveTTL",
+    "RefreshAhead",
+    "hooks",
+    "CacheEvent",
+    "TracingHook",
+    "HotKeyTracker",
+    "LocalCache",
 ]
@@ -1,12 +1,24 @@
+import copy
 import logging
+import threading
+import time
 from abc import ABCMeta, abstractmethod
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar, Union
 
+from . import refresh
 from .const import NOTSET, NotSet
 from .exceptions import SlycacheException
-from .invocations import CacheInvocation
+from .invocations import CacheInvocation, CacheResult
+from .key_generator import freeze_args
+from .lookup import SerialLookup
+from .scope import current_scope
+from .stats import ComputeStats
+from .tracing import hooks
+from .ttl import TTLPolicy
 
 if TYPE_CHECKING:
+    from .refresh import RefreshAhead
     from .slycache import ProxyWithDefaults
 
 log = logging.getLogger("slycache")
@@ -39,11 +51,30 @@ class CacheAction(metaclass=ABCMeta):
     def formatted_keys(self, keys: List[str]):
         self._formatted_keys = keys
 
+    def admit(self, result: Any, elapsed: Optional[float]) -> Optional["CacheAction"]:
+        """Decide if the action should be executed for the result of an invocation.
+
+        Arguments:
+            result: the result of the invocation
+            elapsed: the time taken by the invocation in seconds or None if unknown
+
+        Returns:
+            the action to execute or None to skip it
+        """
+        return self
+
     @abstractmethod
     def call(self, cache_key: str, func: Callable, call_args: Dict, result: Any):
         """Override in subclasses to perform the appropriate action"""
         raise NotImplementedError
 
+    def call_keys(
+        self, cache_keys: List[str], func: Callable, call_args: Dict, result: Any
+    ):
+        """Perform the action for all the keys of an invocation"""
+        for cache_key in cache_keys:
+            self.call(cache_key, func, call_args, result)
+
 
 class CacheResultAction(CacheAction):
     """Action for ``CacheResult``
@@ -63,7 +94,11 @@ class CacheResultAction(CacheAction):
             )
             return
 
-        self.proxy.set(cache_key, value)
+        if hooks.active:
+            with hooks.timed("set", func, self.proxy.cache_name, cache_key, value):
+                self.proxy.set(cache_key, value)
+        else:
+            self.proxy.set(cache_key, value)
         log.debug(
             "cache_set: cache=%s, function=%s, key=%s",
             self.proxy.cache_name,
@@ -71,6 +106,39 @@ class CacheResultAction(CacheAction):
             cache_key,
         )
 
+    def call_keys(
+        self, cache_keys: List[str], func: Callable, call_args: Dict, result: Any
+    ):
+        if not self.invocation.dedupe or len(cache_keys) < 2:
+            super().call_keys(cache_keys, func, call_args, result)
+            return
+
+        value = self._get_value(call_args, result)
+        if value is None:
+            log.debug(
+                "ignoring None value, cache=%s, function=%s, keys=%s",
+                self.proxy.cache_name,
+                func.__name__,
+                cache_keys,
+            )
+            return
+
+        start = time.perf_counter()
+        digest_key = self.proxy.set_deduped(cache_keys, value)
+        if hooks.active:
+            elapsed = time.perf_counter() - start
+            for cache_key in cache_keys:
+                hooks.emit(
+                    "set", func, self.proxy.cache_name, cache_key, elapsed, value
+                )
+        log.debug(
+            "cache_set: cache=%s, function=%s, keys=%s, digest_key=%s",
+            self.proxy.cache_name,
+            func.__name__,
+            cache_keys,
+            digest_key,
+        )
+
     def _get_value(
         self,
         call_args: Dict,
@@ -78,6 +146,24 @@ class CacheResultAction(CacheAction):
     ) -> Any:
         return result
 
+    def admit(self, result: Any, elapsed: Optional[float]) -> Optional[CacheAction]:
+        invocation = self.invocation
+        if elapsed is None or not invocation.cost_aware:
+            return self
+
+        cost = invocation.get_cost(result, elapsed)
+        if (
+            invocation.min_compute_time is not None
+            and cost < invocation.min_compute_time
+        ):
+            return None
+
+        if invocation.timeout_for_cost is None:
+            return self
+        admitted = copy.copy(self)
+        admitted._proxy = replace(self.proxy, timeout=invocation.timeout_for_cost(cost))
+        return admitted
+
 
 class CachePutAction(CacheResultAction):
     """Action for ``CachePut``
@@ -86,6 +172,9 @@ class CachePutAction(CacheResultAction):
         [slycache.cache_put][slycache.Slycache.cache_put]
     """
 
+    def admit(self, result: Any, elapsed: Optional[float]) -> Optional[CacheAction]:
+        return self
+
     def _get_value(self, call_args: Dict, result: Any) -> Any:
         if self.invocation.cache_value is not None:
             return call_args[self.invocation.cache_value]
@@ -114,12 +203,20 @@ class CacheRemoveAction(CacheAction):
             func.__name__,
             cache_key,
         )
-        self.proxy.delete(cache_key)
+        if hooks.active:
+            with hooks.timed("delete", func, self.proxy.cache_name, cache_key):
+                self.proxy.delete(cache_key)
+        else:
+            self.proxy.delete(cache_key)
 
 
 class ActionExecutor:
     """Class responsible for executing cache actions based on the function
     and call arguments they have been decorated on.
+
+    A single executor is shared by all the calls of a decorated function, so it holds no
+    per-call state. The keys generated for a call can be reused across the lookup and the
+    store by passing the same ``key_cache`` dict to :meth:`get_cached` and :meth:`compute`.
     """
 
     def __init__(
@@ -128,29 +225,60 @@ class ActionExecutor:
         actions: List[CacheAction],
         key_generator,
         proxy: "ProxyWithDefaults",
+        lookup: Optional[SerialLookup] = None,
     ):
         self._func = func
         self._actions = actions
         self._key_generator = key_generator
         self._proxy = proxy
+        self._lookup = lookup or SerialLookup()
         self._skip_get_ = None
         self._init_done = False
-
-        # temporary cache for keys to avoid having to re-generate them on cache miss
-        self._key_cache = None
-
-    def __enter__(self):
-        self._key_cache = {}
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self._key_cache = None
+        self._init_lock = threading.Lock()
+        self.compute_stats = ComputeStats()
+        self.refresher = self._get_refresher()
 
     def _lazy_init(self):
-        if not self._init_done:
-            self._proxy = self._proxy.merge_with_global_defaults()
-            for action in self._actions:
-                action.set_proxy(self._proxy)
-            self._init_done = True
+        if self._init_done:
+            return
+        with self._init_lock:
+            if not self._init_done:
+                self._proxy = self._proxy.merge_with_global_defaults()
+                for action in self._actions:
+                    action.set_proxy(self._proxy)
+                self._init_done = True
+
+    def _get_refresher(self) -> Optional["RefreshAhead"]:
+        for action in self._actions:
+            option = getattr(action.invocation, "refresh_ahead", False)
+            if option is True:
+                return refresh.refresher
+            if option:
+                return option
+        return None
+
+    def refresh_timeout(self, call_args: Dict) -> Optional[float]:
+        """The smallest timeout of the entries stored by the ``cache_result`` operations for
+        the call arguments, or None if they have no timeout. Used to schedule refresh-ahead.
+
+        For timeout policies this is the lower bound of the timeout of each key (see
+        :meth:`slycache.TTLPolicy.min_timeout`).
+        """
+        self._lazy_init()
+        timeouts = []
+        for action in self._actions:
+            if not isinstance(action.invocation, CacheResult):
+                continue
+            timeout = action.proxy.timeout
+            if isinstance(timeout, TTLPolicy):
+                policy = timeout
+                timeouts.extend(
+                    policy.min_timeout(key)
+                    for key in self._get_action_keys(action, call_args)
+                )
+            elif timeout is not NOTSET:
+                timeouts.append(timeout)
+        return min((timeout for timeout in timeouts if timeout), default=None)
 
     def validate(self):
         """Validate actions and key templates"""
@@ -168,13 +296,22 @@ class ActionExecutor:
             self._skip_get_ = list(skip_get)[0]
         return self._skip_get_
 
-    def get_cached(self, call_args) -> Union[Any, NotSet]:
-        """Iteratively check the action caches with each key
-        until a cached entry is found or all actions & keys are exhausted.
+    def get_cached(
+        self, call_args, key_cache: Optional[Dict] = None
+    ) -> Union[Any, NotSet]:
+        """Check the action caches with each key until a cached entry is found
+        or all actions & keys are exhausted. The order in which the caches are checked
+        depends on the lookup strategy but the result always respects the order of the actions
+        and keys.
 
         If all actions have ``skip_get=True``, ``NOTSET`` is always returned and the caches
         are not checked.
 
+        Arguments:
+            call_args: Dict of arguments from the invocation of the decorated function
+            key_cache: optional dict local to the invocation in which the generated keys are
+                kept for reuse by :meth:`compute`
+
         Returns:
             [Any, NotSet]: cached value if found or ``NOTSET`` if no value is found
                            or all actions have ``skip_get=True``
@@ -184,28 +321,78 @@ class ActionExecutor:
 
         self._lazy_init()
 
+        candidate, result = self._lookup.lookup(
+            self.iter_candidates(call_args, key_cache), self._fetch
+        )
+        if candidate is not None:
+            action, key = candidate
+            log.debug(
+                "cache hit: cache=%s key=%s function=%s",
+                action.proxy.cache_name,
+                key,
+                self._func.__name__,
+            )
+        return result
+
+    def iter_candidates(self, call_args, key_cache: Optional[Dict] = None):
+        """Generate the ``(action, key)`` pairs to check for a cached value in priority order."""
+        if self._skip_get:
+            return
+
+        self._lazy_init()
         for action in self._actions:
-            for key in self._get_action_keys(action, call_args):
-                result = action.proxy.get(key, default=NOTSET)
-                if result is not NOTSET:
-                    log.debug(
-                        "cache hit: cache=%s key=%s function=%s",
-                        action.proxy.cache_name,
-                        key,
-                        self._func.__name__,
-                    )
-                    return result
-                log.debug(
-                    "cache miss: cache=%s key=%s function=%s",
-                    action.proxy.cache_name,
-                    key,
-                    self._func.__name__,
-                )
-        return NOTSET
+            for key in self._get_action_keys(action, call_args, key_cache):
+                yield action, key
+
+    def _fetch(self, candidate):
+        action, key = candidate
+        if hooks.active:
+            return self._fetch_traced(action, key)
+
+        result = action.proxy.get(key, default=NOTSET)
+        if result is NOTSET:
+            log.debug(
+                "cache miss: cache=%s key=%s function=%s",
+                action.proxy.cache_name,
+                key,
+                self._func.__name__,
+            )
+        return result
+
+    def _fetch_traced(self, action: CacheAction, key: str):
+        cache_name = action.proxy.cache_name
+        hooks.emit("before_get", self._func, cache_name, key)
+        start = time.perf_counter()
+        result = action.proxy.get(key, default=NOTSET)
+        elapsed = time.perf_counter() - start
+        if result is NOTSET:
+            log.debug(
+                "cache miss: cache=%s key=%s function=%s",
+                cache_name,
+                key,
+                self._func.__name__,
+            )
+            hooks.emit("miss", self._func, cache_name, key, elapsed)
+        else:
+            hooks.emit("hit", self._func, cache_name, key, elapsed)
+        return result
 
-    def _get_action_keys(self, action: CacheAction, call_args):
-        if self._key_cache and action in self._key_cache:
-            return self._key_cache[action]
+    def _get_action_keys(
+        self, action: CacheAction, call_args, key_cache: Optional[Dict] = None
+    ):
+        if key_cache:
+            keys = key_cache.get(action)
+            if keys is not None:
+                return keys
+
+        scope = current_scope()
+        scope_key = None
+        if scope is not None:
+            frozen = freeze_args(call_args)
+            if frozen is not None:
+                scope_key = (action, frozen)
+                if scope_key in scope.keys:
+                    return scope.keys[scope_key]
 
         keys = [
             self._key_generator.generate(
@@ -213,22 +400,58 @@ class ActionExecutor:
             )
             for key in action.invocation.keys
         ]
-        if self._key_cache is not None:
-            self._key_cache[action] = keys
+        if key_cache is not None:
+            key_cache[action] = keys
+        if scope_key is not None:
+            scope.keys[scope_key] = keys
         return keys
 
-    def call(self, result: Optional[Any], call_args: Dict):
+    def call(
+        self,
+        result: Optional[Any],
+        call_args: Dict,
+        elapsed: Optional[float] = None,
+        key_cache: Optional[Dict] = None,
+    ):
         """Execute the actions
 
         Arguments:
             result: The result returned from the invocation of the decorated function
             call_args: Dict of arguments from the invocation of the decorated function
+            elapsed: Time taken by the invocation of the decorated function (seconds)
+            key_cache: the keys generated for the invocation, see :meth:`get_cached`
         """
         self._lazy_init()
 
+        stored = True
         for action in self._actions:
-            for key in self._get_action_keys(action, call_args):
-                action.call(key, self._func, call_args, result)
+            admitted = action.admit(result, elapsed)
+            if admitted is None:
+                stored = False
+                log.debug(
+                    "cache_skip: cheap result, cache=%s, function=%s, elapsed=%s",
+                    action.proxy.cache_name,
+                    self._func.__name__,
+                    elapsed,
+                )
+                continue
+            keys = self._get_action_keys(action, call_args, key_cache)
+            admitted.call_keys(keys, self._func, call_args, result)
+
+        if elapsed is not None:
+            self.compute_stats.record(elapsed, stored)
+
+    def compute(
+        self, args, kwargs, call_args: Dict, key_cache: Optional[Dict] = None
+    ) -> Any:
+        """Invoke the decorated function and execute the actions with the result"""
+        start = time.perf_counter()
+        result = self._func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        if hooks.active:
+            hooks.emit("after_compute", self._func, elapsed=elapsed)
+        self.call(result, call_args, elapsed, key_cache)
+        return result
 
     def clear_cache(self, call_args: Dict):
         """Helper to clear the cache for a decorated function"""
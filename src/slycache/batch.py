@@ -0,0 +1,198 @@
+"""DataLoader style batching of cache reads.
+
+Inside a batching scope calls made via the ``defer`` attribute of a decorated function are
+queued instead of being executed. When the first result is requested (or the scope exits)
+all the queued calls are flushed together: the cache keys of every call are fetched with
+a single ``get_many`` per cache and only the calls that missed are executed.
+
+```python
+with slycache.batching():
+    users = [get_user_by_id.defer(user_id) for user_id in user_ids]
+    names = [user.result().name for user in users]
+```
+
+Outside of a batching scope ``defer`` executes the call immediately.
+"""
+
+import threading
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from .const import NOTSET
+from .exceptions import SlycacheException
+
+if TYPE_CHECKING:
+    from .actions import ActionExecutor
+
+_current_batch: ContextVar[Optional["Batch"]] = ContextVar(
+    "slycache_batch", default=None
+)
+
+
+class DeferredResult:
+    """The result of a deferred call. Calling :meth:`result` flushes the batch
+    if the call has not been executed yet, or waits for it if another thread is
+    already flushing it."""
+
+    def __init__(self, batch: Optional["Batch"] = None):
+        self._batch = batch
+        self._done = threading.Event()
+        self._value = None
+        self._error = None
+
+    @classmethod
+    def completed(cls, value: Any) -> "DeferredResult":
+        deferred = cls()
+        deferred.set_result(value)
+        return deferred
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def result(self) -> Any:
+        if not self._done.is_set():
+            self._batch.flush()
+            self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def set_result(self, value: Any):
+        self._value = value
+        self._done.set()
+
+    def set_error(self, error: BaseException):
+        self._error = error
+        self._done.set()
+
+
+class _Load:
+    def __init__(self, executor: "ActionExecutor", args, kwargs, call_args):
+        self.executor = executor
+        self.args = args
+        self.kwargs = kwargs
+        self.call_args = call_args
+        self.candidates = []
+        self.results: List[DeferredResult] = []
+
+
+class Batch:
+    """Collects deferred calls and resolves them with as few cache operations as possible.
+
+    Calls with the same cache keys are only executed once.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: List[_Load] = []
+        self._token = None
+
+    def __enter__(self) -> "Batch":
+        if _current_batch.get() is not None:
+            raise SlycacheException("Batching scopes can not be nested")
+        self._token = _current_batch.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                self.flush()
+        finally:
+            _current_batch.reset(self._token)
+            self._token = None
+
+    def load(
+        self, executor: "ActionExecutor", args, kwargs, call_args
+    ) -> DeferredResult:
+        result = DeferredResult(self)
+        load = _Load(executor, args, kwargs, call_args)
+        load.results.append(result)
+        with self._lock:
+            self._pending.append(load)
+        return result
+
+    def flush(self):
+        """Resolve all pending calls."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        try:
+            loads = self._dedupe(pending)
+            found = get_many_candidates(load.candidates for load in loads)
+        except Exception as e:  # pylint: disable=broad-except
+            for load in pending:
+                for result in load.results:
+                    result.set_error(e)
+            raise
+
+        for load in loads:
+            value = first_hit(load.candidates, found)
+            try:
+                if value is NOTSET:
+                    value = load.executor.compute(
+                        load.args, load.kwargs, load.call_args
+                    )
+            except Exception as e:  # pylint: disable=broad-except
+                for result in load.results:
+                    result.set_error(e)
+            else:
+                for result in load.results:
+                    result.set_result(value)
+
+    @staticmethod
+    def _dedupe(pending: List[_Load]) -> List[_Load]:
+        loads = {}
+        for load in pending:
+            load.candidates = list(load.executor.iter_candidates(load.call_args))
+            if not load.candidates:
+                # skip_get functions must always be executed
+                loads[id(load)] = load
+                continue
+
+            identity = (load.executor, tuple(key for _, key in load.candidates))
+            if identity in loads:
+                loads[identity].results.extend(load.results)
+            else:
+                loads[identity] = load
+        return list(loads.values())
+
+
+def get_many_candidates(candidate_lists: Iterable[List]) -> Dict[str, Dict[str, Any]]:
+    """Fetch the keys for multiple lists of ``(action, key)`` candidates using a single
+    ``get_many`` per cache.
+
+    Returns:
+        dict: mapping of cache name to the values found in that cache
+    """
+    keys_by_cache: Dict[str, dict] = defaultdict(dict)
+    for candidates in candidate_lists:
+        for action, key in candidates:
+            keys_by_cache[action.proxy.cache_name][key] = action.proxy
+
+    found = {}
+    for cache_name, keys in keys_by_cache.items():
+        proxy = next(iter(keys.values()))
+        found[cache_name] = proxy.get_many(list(keys))
+    return found
+
+
+def first_hit(candidates: List, found: Dict[str, Dict[str, Any]]) -> Any:
+    """Return the first value found for the candidates in priority order or ``NOTSET``."""
+    for action, key in candidates:
+        value = found[action.proxy.cache_name].get(key, NOTSET)
+        if value is not NOTSET:
+            return value
+    return NOTSET
+
+
+def batching() -> Batch:
+    """Create a new batching scope. See :mod:`slycache.batch`."""
+    return Batch()
+
+
+def current_batch() -> Optional[Batch]:
+    return _current_batch.get()
@@ -0,0 +1,63 @@
+"""Storage of large values split over multiple cache keys.
+
+The serialized value is split into chunks which are written with a single ``set_many``
+under sub-keys of the cache key. A :class:`ChunkManifest` is then written under the cache
+key itself. Reading the value fetches the manifest followed by all the chunks with a single
+``get_many``. If any chunk is missing, or the checksum of the reassembled value does not
+match the manifest (e.g. due to concurrent writes of the same key), the read is treated as a
+cache miss.
+"""
+
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+from .const import NOTSET
+from .serialization import loads
+
+
+@dataclass(frozen=True)
+class ChunkManifest:
+    """Entry stored under the cache key of a chunked value."""
+
+    count: int
+    size: int
+    checksum: int
+
+    def chunk_keys(self, key: str) -> List[str]:
+        return [chunk_key(key, index) for index in range(self.count)]
+
+    def join(self, key: str, chunks: Dict[str, Any]) -> Any:
+        """Reassemble the value from the fetched chunks.
+
+        Returns:
+            the value or ``NOTSET`` if chunks are missing or the checksum does not match
+        """
+        try:
+            payload = b"".join(chunks[chunk] for chunk in self.chunk_keys(key))
+        except (KeyError, TypeError):
+            return NOTSET
+        if len(payload) != self.size or zlib.crc32(payload) != self.checksum:
+            return NOTSET
+        return loads(payload)
+
+
+def chunk_key(key: str, index: int) -> str:
+    return f"{key}:chunk:{index}"
+
+
+def split(
+    key: str, payload: bytes, chunk_size: int
+) -> Tuple[ChunkManifest, Dict[str, bytes]]:
+    """Split a serialized value into chunks.
+
+    Returns:
+        the manifest and a mapping of chunk key to chunk
+    """
+    view = memoryview(payload)
+    chunks = {
+        chunk_key(key, index): bytes(view[offset : offset + chunk_size])
+        for index, offset in enumerate(range(0, len(payload), chunk_size))
+    }
+    manifest = ChunkManifest(len(chunks), len(payload), zlib.crc32(payload))
+    return manifest, chunks
@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 from django.apps import AppConfig
 from django.core.cache import BaseCache
@@ -32,3 +32,12 @@ class DjangoCacheAdapter(CacheInterface):
 
     def delete(self, key: str):
         self._delegate.delete(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        return self._delegate.get_many(keys)
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None):
+        self._delegate.set_many(mapping, timeout=timeout)
+
+    def delete_many(self, keys: List[str]):
+        self._delegate.delete_many(keys)
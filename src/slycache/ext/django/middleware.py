@@ -0,0 +1,20 @@
+from slycache import request_scope
+
+
+class RequestScopeMiddleware:
+    """Activate a slycache request scope for the duration of each request.
+
+    ```python
+    MIDDLEWARE = [
+        ...
+        "slycache.ext.django.middleware.RequestScopeMiddleware",
+    ]
+    ```
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with request_scope():
+            return self.get_response(request)
@@ -1,15 +1,31 @@
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
+from flask import g
 from flask_caching import BaseCache
 
 import slycache
-from slycache import CacheInterface
+from slycache import CacheInterface, request_scope
 
 
 def register_cache(cache, name="default"):
     slycache.register_backend(name, FlaskCacheAdapter(cache))
 
 
+def init_request_scope(app):
+    """Activate a slycache request scope for the duration of each request."""
+
+    @app.before_request
+    def _enter_slycache_scope():
+        g._slycache_scope = request_scope()
+        g._slycache_scope.__enter__()
+
+    @app.teardown_request
+    def _exit_slycache_scope(exc):
+        scope = g.pop("_slycache_scope", None)
+        if scope is not None:
+            scope.__exit__(None, None, None)
+
+
 class FlaskCacheAdapter(CacheInterface):
     def __init__(self, delegate: BaseCache):
         self._delegate = delegate
@@ -23,3 +39,13 @@ class FlaskCacheAdapter(CacheInterface):
 
     def delete(self, key: str):
         self._delegate.delete(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        values = self._delegate.get_dict(*keys)
+        return {key: value for key, value in values.items() if value is not None}
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None):
+        self._delegate.set_many(mapping, timeout=timeout)
+
+    def delete_many(self, keys: List[str]):
+        self._delegate.delete_many(*keys)
@@ -0,0 +1,153 @@
+"""Detection of hot keys with a Count-Min sketch.
+
+A sample of the keys read from a cache is counted in a Count-Min sketch (a fixed size table of
+counters that over-estimates, but never under-estimates, the count of each key) and the keys
+with the highest estimates are kept in a top-K heap. Counts are halved every ``window``
+samples so that keys which are no longer hot age out.
+
+```python
+slycache.register_backend("default", backend, hot_keys=HotKeyTracker(sample_rate=0.01))
+caches.stats("default")["hot_keys"]  # [{"key": ..., "count": ...}, ...]
+```
+"""
+
+import heapq
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class CountMinSketch:
+    """Count-Min sketch of ``depth`` rows of ``width`` counters."""
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self._rows = [[0] * width for _ in range(depth)]
+
+    def add(self, key: str, count: int = 1) -> int:
+        """Add to the count of the key and return its new estimate."""
+        hashed = hash(key)
+        index = hashed & 0xFFFFFFFF
+        step = (hashed >> 32) | 1
+        width = self.width
+        estimate = None
+        for row in self._rows:
+            column = index % width
+            value = row[column] = row[column] + count
+            if estimate is None or value < estimate:
+                estimate = value
+            index += step
+        return estimate
+
+    def increment(self, key: str):
+        """Add one to the count of the key."""
+        hashed = hash(key)
+        index = hashed & 0xFFFFFFFF
+        step = (hashed >> 32) | 1
+        width = self.width
+        for row in self._rows:
+            row[index % width] += 1
+            index += step
+
+    def estimate(self, key: str) -> int:
+        hashed = hash(key)
+        index = hashed & 0xFFFFFFFF
+        step = (hashed >> 32) | 1
+        width = self.width
+        estimate = None
+        for row in self._rows:
+            value = row[index % width]
+            if estimate is None or value < estimate:
+                estimate = value
+            index += step
+        return estimate
+
+    def halve(self):
+        for row in self._rows:
+            row[:] = [value >> 1 for value in row]
+
+
+class HotKeyTracker:
+    """Sampled tracking of the most frequently read keys of a cache.
+
+    Arguments:
+        sample_rate: fraction of reads that are counted
+        top_k: number of hot keys to report
+        width: number of counters per row of the sketch
+        depth: number of rows of the sketch
+        window: number of samples after which all counts are halved, or None to never decay
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        top_k: int = 20,
+        width: int = 2048,
+        depth: int = 4,
+        window: Optional[int] = 100_000,
+    ):
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in the range (0, 1]")
+        self.sample_rate = sample_rate
+        self.top_k = top_k
+        self.window = window
+        self._sketch = CountMinSketch(width, depth)
+        self._lock = threading.Lock()
+        self._top: Dict[str, int] = {}
+        self._heap = []
+        self._samples = 0
+
+    def record(self, key: str):
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        with self._lock:
+            self._samples += 1
+            if self.window and self._samples >= self.window:
+                self._decay()
+            self._update(key, self._sketch.add(key))
+
+    def _update(self, key: str, estimate: int):
+        if key not in self._top and len(self._top) >= self.top_k:
+            if estimate <= self._smallest():
+                return
+            _, evicted = heapq.heappop(self._heap)
+            del self._top[evicted]
+
+        self._top[key] = estimate
+        heapq.heappush(self._heap, (estimate, key))
+        if len(self._heap) > 4 * self.top_k:
+            self._rebuild()
+
+    def _smallest(self) -> int:
+        """Return the smallest current estimate in the heap, discarding stale entries."""
+        while self._heap:
+            estimate, key = self._heap[0]
+            if self._top.get(key) == estimate:
+                return estimate
+            heapq.heappop(self._heap)
+        return 0
+
+    def _rebuild(self):
+        self._heap = [(estimate, key) for key, estimate in self._top.items()]
+        heapq.heapify(self._heap)
+
+    def _decay(self):
+        self._samples = 0
+        self._sketch.halve()
+        self._top = {key: estimate >> 1 for key, estimate in self._top.items()}
+        self._rebuild()
+
+    def hot_keys(self) -> List[Dict[str, Any]]:
+        """Return the hot keys with their estimated read counts, hottest first."""
+        with self._lock:
+            top = sorted(self._top.items(), key=lambda item: item[1], reverse=True)
+        scale = 1 / self.sample_rate
+        return [{"key": key, "count": round(count * scale)} for key, count in top]
+
+    def reset(self):
+        with self._lock:
+            self._sketch = CountMinSketch(self._sketch.width, self._sketch.depth)
+            self._top = {}
+            self._heap = []
+            self._samples = 0
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from typing import Protocol
 
@@ -36,6 +36,41 @@ class CacheInterface(Protocol):
         """
         raise NotImplementedError
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get multiple values from the cache in a single operation. This method is optional,
+        backends that do not implement it fall back to calling ``get`` for each key.
+
+        Arguments:
+            keys: the cache keys
+
+        Returns:
+            dict: mapping of key to value for the keys that were found in the cache
+        """
+        missing = object()
+        values = {key: self.get(key, missing) for key in keys}
+        return {key: value for key, value in values.items() if value is not missing}
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None):
+        """Set multiple values in the cache in a single operation. This method is optional,
+        backends that do not implement it fall back to calling ``set`` for each key.
+
+        Arguments:
+            mapping: mapping of key to value
+            timeout: cache item timeout in seconds or None
+        """
+        for key, value in mapping.items():
+            self.set(key, value, timeout)
+
+    def delete_many(self, keys: List[str]):
+        """Delete multiple keys in a single operation. This method is optional,
+        backends that do not implement it fall back to calling ``delete`` for each key.
+
+        Arguments:
+            keys: the keys to delete
+        """
+        for key in keys:
+            self.delete(key)
+
 
 class KeyGenerator(Protocol):
     """Protocol for a key generator class."""
@@ -66,3 +101,30 @@ class KeyGenerator(Protocol):
         Returns:
             str: The generated key
         """
+
+
+def get_many(backend: CacheInterface, keys: List[str]) -> Dict[str, Any]:
+    """Call ``get_many`` on the backend, falling back to individual gets if the
+    backend does not implement it."""
+    method = getattr(backend, "get_many", None)
+    if method is not None:
+        return method(keys)
+    return CacheInterface.get_many(backend, keys)
+
+
+def set_many(backend: CacheInterface, mapping: Dict[str, Any], timeout: Optional[int]):
+    """Call ``set_many`` on the backend, falling back to individual sets if the
+    backend does not implement it."""
+    method = getattr(backend, "set_many", None)
+    if method is not None:
+        return method(mapping, timeout)
+    return CacheInterface.set_many(backend, mapping, timeout)
+
+
+def delete_many(backend: CacheInterface, keys: List[str]):
+    """Call ``delete_many`` on the backend, falling back to individual deletes if the
+    backend does not implement it."""
+    method = getattr(backend, "delete_many", None)
+    if method is not None:
+        return method(keys)
+    return CacheInterface.delete_many(backend, keys)
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, replace
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Union
 
 from slycache.const import NOTSET, NotSet
 
 if TYPE_CHECKING:
     from .slycache import ProxyWithDefaults
+    from .refresh import RefreshAhead
+    from .ttl import TTLPolicy
 
 
 @dataclass(frozen=True)
@@ -46,13 +48,31 @@ class CacheResult(CacheInvocation):
         [slycache.cache_result][slycache.Slycache.cache_result]
     """
 
-    timeout: Union[int, NotSet] = NOTSET
+    timeout: Union[int, "TTLPolicy", NotSet] = NOTSET
     skip_get: bool = False
+    min_compute_time: Optional[float] = None
+    cost: Optional[Callable[[Any, float], float]] = None
+    timeout_for_cost: Optional[Callable[[float], int]] = None
+    max_value_size: Union[int, None, NotSet] = NOTSET
+    large_value: Union[str, None, NotSet] = NOTSET
+    dedupe: bool = False
+    refresh_ahead: Union[bool, "RefreshAhead"] = False
+
+    @property
+    def cost_aware(self) -> bool:
+        return bool(self.min_compute_time or self.cost or self.timeout_for_cost)
+
+    def get_cost(self, result: Any, elapsed: float) -> float:
+        return elapsed if self.cost is None else self.cost(result, elapsed)
 
     def _get_overrides(self) -> dict:
         overrides = super()._get_overrides()
         if self.timeout is not NOTSET:
             overrides["timeout"] = self.timeout
+        if self.max_value_size is not NOTSET:
+            overrides["max_value_size"] = self.max_value_size
+        if self.large_value is not NOTSET:
+            overrides["large_value"] = self.large_value
         return overrides
 
 
@@ -66,7 +86,10 @@ class CachePut(CacheInvocation):
     """
 
     cache_value: Optional[str] = None
-    timeout: Union[int, NotSet] = NOTSET
+    timeout: Union[int, "TTLPolicy", NotSet] = NOTSET
+    max_value_size: Union[int, None, NotSet] = NOTSET
+    large_value: Union[str, None, NotSet] = NOTSET
+    dedupe: bool = False
 
     @property
     def skip_get(self):
@@ -76,6 +99,10 @@ class CachePut(CacheInvocation):
         overrides = super()._get_overrides()
         if self.timeout is not NOTSET:
             overrides["timeout"] = self.timeout
+        if self.max_value_size is not NOTSET:
+            overrides["max_value_size"] = self.max_value_size
+        if self.large_value is not NOTSET:
+            overrides["large_value"] = self.large_value
         return overrides
 
 
@@ -0,0 +1,96 @@
+"""Registry of type specific encoders for key arguments.
+
+Arguments that are not strings, numbers, dates etc are converted to key values by an
+encoder looked up by the argument type. An encoder is a callable that takes the argument
+and returns one of:
+
+* ``str``: used in the key as is
+* ``memoryview``: the raw bytes are hashed without copying
+* any other value that can be JSON encoded: hashed using the key generator's hasher
+
+```python
+generator = StringFormatKeyGenerator()
+generator.encoders.register(Point, lambda point: [point.x, point.y])
+```
+
+Encoders are resolved through the MRO of the argument type and the result is cached
+per type.
+"""
+
+import dataclasses
+import enum
+from typing import Any, Callable, Dict, Optional
+
+KeyEncoder = Callable[[Any], Any]
+
+
+def encode_enum(value: enum.Enum) -> str:
+    value_type = type(value)
+    return f"{value_type.__module__}.{value_type.__qualname__}.{value.name}"
+
+
+def encode_dataclass(value) -> dict:
+    encoded = {"__type__": type(value).__qualname__}
+    for field in dataclasses.fields(value):
+        encoded[field.name] = getattr(value, field.name)
+    return encoded
+
+
+def encode_buffer(value) -> memoryview:
+    return memoryview(value)
+
+
+class KeyEncoderRegistry:
+    """Map of types to key encoders.
+
+    Arguments:
+        builtins: include the built in encoders for enums, dataclasses and objects
+            supporting the buffer protocol (``bytearray``, ``array.array``, numpy arrays etc).
+            Named tuples are encoded as plain tuples.
+    """
+
+    def __init__(self, builtins: bool = True):
+        self.builtins = builtins
+        self._encoders: Dict[type, KeyEncoder] = {}
+        self._resolved: Dict[type, Optional[KeyEncoder]] = {}
+        if builtins:
+            self.register(enum.Enum, encode_enum)
+
+    def register(self, type_: type, encoder: KeyEncoder):
+        """Register an encoder for a type and its subclasses."""
+        self._encoders[type_] = encoder
+        self._resolved.clear()
+
+    def resolve(self, value: Any) -> Optional[KeyEncoder]:
+        """Return the encoder for the value or None if there is none."""
+        value_type = type(value)
+        try:
+            return self._resolved[value_type]
+        except KeyError:
+            pass
+
+        encoder = self._lookup(value_type)
+        if encoder is None and self.builtins:
+            encoder = self._structural(value_type, value)
+        self._resolved[value_type] = encoder
+        return encoder
+
+    def _lookup(self, value_type: type) -> Optional[KeyEncoder]:
+        for base in value_type.__mro__:
+            encoder = self._encoders.get(base)
+            if encoder is not None:
+                return encoder
+        return None
+
+    @staticmethod
+    def _structural(value_type: type, value: Any) -> Optional[KeyEncoder]:
+        """Encoders for types that can't be identified by a common base class."""
+        if dataclasses.is_dataclass(value_type):
+            return encode_dataclass
+        if issubclass(value_type, (str, bytes)):
+            return None
+        try:
+            memoryview(value).release()
+        except TypeError:
+            return None
+        return encode_buffer
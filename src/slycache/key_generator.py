@@ -1,6 +1,7 @@
 import base64
 import datetime
 import decimal
+import functools
 import hashlib
 import inspect
 import json
@@ -10,9 +11,13 @@ from numbers import Number
 from string import Formatter
 
 from slycache.exceptions import KeyFormatException, NamespaceException
+from slycache.key_encoders import KeyEncoderRegistry
 
 MUTABLE_TYPES = (list, dict, set, bytearray)
 
+# argument types whose formatted value is fully determined by (type, value)
+IMMUTABLE_TYPES = (str, int, bytes, uuid.UUID, type(None))
+
 try:
     from _string import formatter_field_name_split
 except ImportError:
@@ -24,11 +29,46 @@ except ImportError:
 class StringFormatKeyGenerator:
     """Key Generator that generates a key from a string template
     using the Python string Formatter class.
+
+    Arguments:
+        max_key_length: keys longer than this are hashed
+        max_namespace_length: generated namespaces longer than this are truncated
+        hash_algorithm: algorithm used to hash complex arguments and long keys
+        hash_digest_size: digest size for algorithms that support it (blake2)
+        encoders: registry of type specific encoders. See :mod:`slycache.key_encoders`.
+        key_cache_size: if set, the most recently generated keys are memoised in an LRU
+            cache of this size. Only keys whose template arguments are all immutable
+            (str, int, bool, None, bytes, UUID or tuples of those) are memoised.
     """
 
-    def __init__(self, max_key_length=250, max_namespace_length=60):
+    def __init__(
+        self,
+        max_key_length=250,
+        max_namespace_length=60,
+        hash_algorithm="sha1",
+        hash_digest_size=None,
+        encoders=None,
+        key_cache_size=0,
+    ):
         self.max_key_length = max_key_length
         self.max_namespace_length = max_namespace_length
+        self.encoders = encoders or KeyEncoderRegistry()
+        self.hasher = KeyHasher(hash_algorithm, hash_digest_size, self.encoders)
+        self._cached_generate = None
+        if key_cache_size:
+            self._cached_generate = functools.lru_cache(maxsize=key_cache_size)(
+                self._generate_frozen
+            )
+
+    def key_cache_info(self):
+        """Statistics for the key cache (see ``functools.lru_cache``) or None if it is disabled"""
+        if self._cached_generate is None:
+            return None
+        return self._cached_generate.cache_info()
+
+    def register_encoder(self, type_, encoder):
+        """Register a key encoder for a type. See :mod:`slycache.key_encoders`."""
+        self.encoders.register(type_, encoder)
 
     def validate(self, template, func):
         if template is None:
@@ -76,6 +116,21 @@ class StringFormatKeyGenerator:
                     )
 
     def generate(self, namespace, key_template, func, call_args) -> str:
+        if self._cached_generate is not None:
+            fields = template_fields(key_template)
+            if fields is not None:
+                frozen = freeze_args(
+                    {name: call_args[name] for name in fields if name in call_args}
+                )
+                if frozen is not None:
+                    return self._cached_generate(namespace, key_template, func, frozen)
+        return self._generate(namespace, key_template, func, call_args)
+
+    def _generate_frozen(self, namespace, key_template, func, frozen_args):
+        call_args = {name: _thaw(value) for name, value in frozen_args}
+        return self._generate(namespace, key_template, func, call_args)
+
+    def _generate(self, namespace, key_template, func, call_args) -> str:
         args = get_arg_names(func=func)
         valid_args = {name: call_args[name] for name in args if name in call_args}
         if namespace is None:
@@ -83,10 +138,57 @@ class StringFormatKeyGenerator:
         elif not namespace:
             raise NamespaceException("Namespace must not be empty")
         return generate_key(
-            namespace, key_template, valid_args, max_len=self.max_key_length
+            namespace,
+            key_template,
+            valid_args,
+            max_len=self.max_key_length,
+            hasher=self.hasher,
         )
 
 
+def freeze_args(call_args):
+    """Return a hashable representation of the call arguments or None if any
+    of the arguments are not known to be immutable.
+
+    The type of each value is included since values that compare equal may format
+    differently e.g. ``1 == True``.
+    """
+    try:
+        return tuple((name, _freeze(value)) for name, value in call_args.items())
+    except TypeError:
+        return None
+
+
+def _freeze(value):
+    if isinstance(value, IMMUTABLE_TYPES):
+        return type(value), value
+    if type(value) is tuple:
+        return tuple, tuple(_freeze(item) for item in value)
+    raise TypeError
+
+
+def _thaw(frozen):
+    value_type, value = frozen
+    if value_type is tuple:
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def template_fields(template):
+    """Return the names of the arguments referenced by a key template or None if
+    the template has nested fields in format specs."""
+    fields = set()
+    for _, field_name, format_spec, _ in Formatter().parse(template):
+        if field_name is None:
+            continue
+        if format_spec and "{" in format_spec:
+            return None
+        first, _ = formatter_field_name_split(field_name)
+        fields.add(first)
+    return frozenset(fields)
+
+
 def get_arg_names(func=None, sig=None):
     sig = sig or inspect.signature(func)
     return _get_named_args(sig)
@@ -121,20 +223,20 @@ def _hash(value, length=8):
     return hashlib.md5(value.encode("utf-8")).hexdigest()[-length:]
 
 
-def generate_key(namespace, key_template, call_args, max_len=250):
-    key = StringFormatter().format(key_template, **call_args)
+def generate_key(namespace, key_template, call_args, max_len=250, hasher=None):
+    hasher = hasher or DEFAULT_HASHER
+    key = StringFormatter(hasher).format(key_template, **call_args)
     if len(key) + len(namespace) > int(max_len):
-        key = (
-            base64.urlsafe_b64encode(hashlib.sha1(key.encode("utf8")).digest())
-            .decode()
-            .rstrip("=")
-        )
+        key = hasher.hash_bytes(key.encode("utf8"))
     return key if namespace is None else f"{namespace}:{key}"
 
 
 class StringFormatter(Formatter):
     """Custom formatter to provide more sensible default format for datetimes."""
 
+    def __init__(self, hasher=None):
+        self.hasher = hasher or DEFAULT_HASHER
+
     def format_field(self, value, format_spec):
         if not format_spec:
             return self._format_field(value)
@@ -148,21 +250,116 @@ class StringFormatter(Formatter):
         ret = handle_basic_types(value)
         if ret is not None:
             return ret
-        return hash_data(value)
+        return self.hasher.format(value)
 
 
-def hash_data(data):
-    serialized = json.dumps(data, sort_keys=True, cls=SlycacheJSONEncoder)
-    hashed = hashlib.sha1(serialized.encode("utf8"))
-    return base64.urlsafe_b64encode(hashed.digest()).decode().rstrip("=")
+class KeyHasher:
+    """Hash complex key arguments (lists, dicts, sets etc).
+
+    Values are encoded as canonical JSON (sorted keys) which is fed to the hash object
+    incrementally. Large top level lists and dicts are encoded in chunks using the
+    C accelerated JSON encoder so the JSON string for the full value is never built.
+
+    Arguments:
+        algorithm: name of the hash algorithm. Any algorithm supported by ``hashlib.new``.
+        digest_size: digest size in bytes. Only supported by the ``blake2b`` and ``blake2s``
+            algorithms.
+        encoders: registry of type specific encoders. See :mod:`slycache.key_encoders`.
+    """
+
+    chunk_size = 8192
+
+    def __init__(self, algorithm="sha1", digest_size=None, encoders=None):
+        self.algorithm = algorithm
+        self.digest_size = digest_size
+        # the named constructors are faster than ``hashlib.new``
+        constructor = getattr(hashlib, algorithm, None)
+        if constructor is None:
+            constructor = functools.partial(hashlib.new, algorithm)
+        if digest_size is None:
+            self._new = constructor
+        else:
+            self._new = functools.partial(constructor, digest_size=digest_size)
+        self._new()  # fail early for unsupported algorithms
+        self.encoders = encoders
+        self._encode = SlycacheJSONEncoder(
+            sort_keys=True, encoders=encoders, hash_buffer=self.hash_buffer
+        ).encode
+
+    def format(self, value) -> str:
+        """Convert a complex value to a string for use in a key"""
+        if self.encoders is not None:
+            encoder = self.encoders.resolve(value)
+            if encoder is not None:
+                value = encoder(value)
+                if isinstance(value, str):
+                    return value
+                if isinstance(value, memoryview):
+                    return self.hash_buffer(value)
+        return self.hash(value)
+
+    def hash_buffer(self, view: memoryview) -> str:
+        """Hash the contents of a buffer without copying it (unless it is not contiguous)."""
+        hashed = self._new()
+        hashed.update(f"buffer:{view.format}:{view.shape}:".encode())
+        hashed.update(view.cast("B") if view.c_contiguous else view.tobytes())
+        return "buffer:" + _b64(hashed.digest())
+
+    def hash(self, data) -> str:
+        hashed = self._new()
+        self._feed(data, hashed.update)
+        return _b64(hashed.digest())
+
+    def hash_bytes(self, data: bytes) -> str:
+        return _b64(self._new(data).digest())
+
+    def _feed(self, data, update):
+        encode, size = self._encode, self.chunk_size
+        data_type = type(data)
+        if data_type is dict and len(data) > size:
+            items = sorted(data.items())
+            update(b"{")
+            for start in range(0, len(items), size):
+                if start:
+                    update(b", ")
+                chunk = encode(dict(items[start : start + size]))
+                update(chunk[1:-1].encode("utf8"))
+            update(b"}")
+        elif (data_type is list or data_type is tuple) and len(data) > size:
+            update(b"[")
+            for start in range(0, len(data), size):
+                if start:
+                    update(b", ")
+                chunk = encode(list(data[start : start + size]))
+                update(chunk[1:-1].encode("utf8"))
+            update(b"]")
+        else:
+            update(encode(data).encode("utf8"))
+
+
+def _b64(digest: bytes) -> str:
+    return base64.urlsafe_b64encode(digest).decode().rstrip("=")
 
 
 class SlycacheJSONEncoder(json.JSONEncoder):
+    def __init__(self, *, encoders=None, hash_buffer=None, **kwargs):
+        super().__init__(**kwargs)
+        self.encoders = encoders
+        self.hash_buffer = hash_buffer
+
     def default(self, o):
         r = handle_basic_types(o)
         if r is not None:
             return r
 
+        if self.encoders is not None:
+            encoder = self.encoders.resolve(o)
+            if encoder is not None:
+                encoded = encoder(o)
+                if isinstance(encoded, memoryview):
+                    return self.hash_buffer(encoded)
+                return encoded
+
         if isinstance(o, (set, frozenset)):
             return ["__set__"] + sorted(list(o))
 
@@ -186,3 +383,10 @@ def handle_basic_types(o):
     if isinstance(o, (decimal.Decimal, uuid.UUID)):
         return str(o)
     return None
+
+
+DEFAULT_HASHER = KeyHasher(encoders=KeyEncoderRegistry())
+
+
+def hash_data(data):
+    return DEFAULT_HASHER.hash(data)
@@ -0,0 +1,514 @@
+"""In-process cache backend.
+
+```python
+slycache.register_backend("local", LocalCache(max_entries=10_000), default_timeout=60)
+slycache.register_backend("local", LocalCache(max_bytes=256 * 1024 * 1024))
+```
+
+Values are stored by reference (they are not copied or serialized), so cached objects must not
+be mutated by callers.
+
+Two eviction policies are available:
+
+* ``"lru"``: least recently used.
+* ``"w-tinylfu"`` (default): Window TinyLFU. New entries enter a small LRU admission window.
+  Entries leaving the window are only admitted to the main region if they have been accessed
+  more often recently than the entry the main region would evict, as estimated by a
+  frequency sketch that is periodically aged. The main region is a segmented LRU: entries
+  that are accessed again are promoted from the probation to the protected segment. This
+  keeps one-off accesses (e.g. a batch job scanning all keys) from evicting the hot set.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .hotkeys import CountMinSketch
+from .interface import CacheInterface
+from .serialization import SerializedValue, dumps
+from .snapshot import SnapshotValue, read_snapshot, write_snapshot
+from .wheel import TimingWheel
+
+log = logging.getLogger("slycache")
+
+
+class _Segment:
+    """An LRU ordered segment of keys with their weights."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.used = 0
+        self.entries: "OrderedDict[str, int]" = OrderedDict()
+
+    def add(self, key: str, weight: int):
+        self.entries[key] = weight
+        self.used += weight
+
+    def remove(self, key: str) -> int:
+        weight = self.entries.pop(key)
+        self.used -= weight
+        return weight
+
+    def touch(self, key: str):
+        self.entries.move_to_end(key)
+
+    def lru(self) -> Optional[str]:
+        return next(iter(self.entries), None)
+
+    def pop_lru(self) -> Tuple[str, int]:
+        key, weight = self.entries.popitem(last=False)
+        self.used -= weight
+        return key, weight
+
+    @property
+    def overflow(self) -> bool:
+        return self.used > self.capacity
+
+
+class LRUPolicy:
+    """Least recently used eviction."""
+
+    def __init__(self, capacity: int, expected_entries: Optional[int] = None):
+        self.capacity = capacity
+        self._segment = _Segment(capacity)
+
+    def access(self, key: str):
+        self._segment.touch(key)
+
+    def insert(self, key: str, weight: int = 1) -> List[str]:
+        """Add a new key and return the keys that were evicted to make space for it."""
+        self._segment.add(key, weight)
+        evicted = []
+        while self._segment.overflow:
+            evicted.append(self._segment.pop_lru()[0])
+        return evicted
+
+    def update(self, key: str, weight: int = 1) -> List[str]:
+        """Update the weight of an existing key and return any keys evicted."""
+        self._segment.remove(key)
+        return self.insert(key, weight)
+
+    def remove(self, key: str):
+        self._segment.remove(key)
+
+    def clear(self):
+        self._segment = _Segment(self.capacity)
+
+
+class WTinyLFUPolicy:
+    """Window TinyLFU eviction.
+
+    Arguments:
+        capacity: the total capacity
+        window_ratio: fraction of the capacity used for the admission window
+        protected_ratio: fraction of the main region used for the protected segment
+        sample_size: number of accesses after which the frequency sketch is halved.
+            Defaults to 10 times the expected number of entries.
+        expected_entries: the number of entries the cache is expected to hold, used to size
+            the frequency sketch. Defaults to the capacity.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+        sample_size: Optional[int] = None,
+        expected_entries: Optional[int] = None,
+    ):
+        self.capacity = capacity
+        self.expected_entries = expected_entries or capacity
+        self.window_ratio = window_ratio
+        self.protected_ratio = protected_ratio
+        window = max(1, round(capacity * window_ratio))
+        self.main_capacity = max(1, capacity - window)
+        self._window = _Segment(window)
+        self._probation = _Segment(self.main_capacity)
+        self._protected = _Segment(round(self.main_capacity * protected_ratio))
+        self._segments: Dict[str, _Segment] = {}
+        self.sample_size = sample_size or 10 * self.expected_entries
+        self._sketch = CountMinSketch(
+            width=_power_of_two(self.expected_entries), depth=4
+        )
+        self._samples = 0
+
+    def _record(self, key: str):
+        self._sketch.increment(key)
+        self._samples += 1
+        if self._samples >= self.sample_size:
+            self._sketch.halve()
+            self._samples = 0
+
+    def access(self, key: str):
+        self._record(key)
+        segment = self._segments[key]
+        if segment is self._probation:
+            self._promote(key)
+        else:
+            segment.touch(key)
+
+    def _promote(self, key: str):
+        weight = self._probation.remove(key)
+        self._protected.add(key, weight)
+        self._segments[key] = self._protected
+        while self._protected.overflow:
+            demoted, demoted_weight = self._protected.pop_lru()
+            self._probation.add(demoted, demoted_weight)
+            self._segments[demoted] = self._probation
+
+    def insert(self, key: str, weight: int = 1) -> List[str]:
+        self._record(key)
+        self._window.add(key, weight)
+        self._segments[key] = self._window
+        evicted = []
+        while self._window.overflow:
+            candidate, candidate_weight = self._window.pop_lru()
+            if not self._admit(candidate, candidate_weight, evicted):
+                del self._segments[candidate]
+                evicted.append(candidate)
+        return evicted
+
+    def _admit(self, candidate: str, weight: int, evicted: List[str]) -> bool:
+        """Move a candidate from the window to the main region if it is accessed more
+        frequently than the entries that have to be evicted for it."""
+        if weight > self.main_capacity:
+            return False
+        victims = []
+        free = self.main_capacity - self._probation.used - self._protected.used
+        frequency = self._sketch.estimate(candidate)
+        segments = (self._probation, self._protected)
+        for segment in segments:
+            for victim, victim_weight in segment.entries.items():
+                if free >= weight:
+                    break
+                if self._sketch.estimate(victim) >= frequency:
+                    return False
+                victims.append((segment, victim))
+                free += victim_weight
+        if free < weight:
+            return False
+
+        for segment, victim in victims:
+            segment.remove(victim)
+            del self._segments[victim]
+            evicted.append(victim)
+        self._probation.add(candidate, weight)
+        self._segments[candidate] = self._probation
+        return True
+
+    def update(self, key: str, weight: int = 1) -> List[str]:
+        self.remove(key)
+        return self.insert(key, weight)
+
+    def remove(self, key: str):
+        self._segments.pop(key).remove(key)
+
+    def clear(self):
+        self.__init__(
+            self.capacity,
+            self.window_ratio,
+            self.protected_ratio,
+            self.sample_size,
+            self.expected_entries,
+        )
+
+
+def _power_of_two(value: int) -> int:
+    return 1 << max(6, (int(value) - 1).bit_length())
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "w-tinylfu": WTinyLFUPolicy,
+}
+
+
+class _Entry(NamedTuple):
+    value: Any
+    expires_at: Optional[float]
+    size: int
+
+
+def default_sizer(value: Any) -> int:
+    """Estimate the memory used by a value from its serialized length."""
+    if isinstance(value, (bytes, bytearray, memoryview, str, SerializedValue)):
+        return len(value)
+    return len(dumps(value))
+
+
+def key_namespace(key: str) -> str:
+    """The part of the key before the first ``:``, used to break down the memory usage."""
+    return key.split(":", 1)[0] if isinstance(key, str) else ""
+
+
+class LocalCache(CacheInterface):
+    """Thread safe in-process cache.
+
+    Arguments:
+        max_entries: maximum number of entries. When ``max_bytes`` is set this is the number
+            of entries the cache is expected to hold, used to size the frequency sketch of
+            the W-TinyLFU policy.
+        max_bytes: bound the cache by the approximate memory used by the values instead of
+            the number of entries.
+        sizer: function returning the approximate size in bytes of a value. Defaults to the
+            pickled length of the value.
+        policy: the eviction policy, ``"w-tinylfu"`` or ``"lru"``
+        expiry_resolution: tick length in seconds of the timing wheel used to reclaim
+            expired entries
+        **policy_options: options passed to the policy class, see :class:`WTinyLFUPolicy`
+
+    A ``timeout`` of ``None`` never expires. Setting a value with a timeout of 0 or less
+    removes it. Expired entries are never returned and are reclaimed within a tick of
+    their expiry by the operations on the cache, without having to be read.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        policy: str = "w-tinylfu",
+        max_bytes: Optional[int] = None,
+        sizer: Optional[Callable[[Any], int]] = None,
+        expiry_resolution: float = 1.0,
+        **policy_options,
+    ):
+        try:
+            policy_class = POLICIES[policy]
+        except KeyError:
+            raise ValueError(f"Unknown eviction policy: {policy}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.policy_name = policy
+        self._sizer = sizer or default_sizer
+        self._capacity = max_entries if max_bytes is None else max_bytes
+        policy_options.setdefault("expected_entries", max_entries)
+        self._policy = policy_class(self._capacity, **policy_options)
+        self._lock = threading.RLock()
+        self._wheel = TimingWheel(expiry_resolution)
+        self._data: Dict[str, _Entry] = {}
+        self._bytes = 0
+        self._namespace_bytes: Dict[str, int] = defaultdict(int)
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "evicted_bytes": 0,
+            "expirations": 0,
+            "rejected": 0,
+        }
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            self._reclaim(time.monotonic())
+            entry = self._data.get(key)
+            if entry is not None and self._expired(entry):
+                self._remove(key)
+                self._stats["expirations"] += 1
+                entry = None
+            if entry is None:
+                self._stats["misses"] += 1
+                return default
+            self._policy.access(key)
+            self._stats["hits"] += 1
+        if isinstance(entry.value, SnapshotValue):
+            return self._load_snapshot_value(key, entry, default)
+        return entry.value
+
+    def _load_snapshot_value(self, key: str, entry: _Entry, default: Any) -> Any:
+        """Unpickle a restored value outside of the lock and keep it unless the entry was
+        changed in the meantime."""
+        try:
+            value = self._unmemoized(entry.value.load())
+        except Exception:  # pylint: disable=broad-except
+            log.warning("unable to load value from snapshot, key=%s", key)
+            with self._lock:
+                if self._data.get(key) is entry:
+                    self._remove(key)
+            return default
+        with self._lock:
+            if self._data.get(key) is entry:
+                self._data[key] = entry._replace(value=value)
+        return value
+
+    def _unmemoized(self, value: Any) -> Any:
+        if self.max_bytes is not None and isinstance(value, SerializedValue):
+            # the unpickled value would not be accounted for in max_bytes
+            return SerializedValue(value.data, memoize=False)
+        return value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        missing = object()
+        values = {key: self.get(key, missing) for key in keys}
+        return {key: value for key, value in values.items() if value is not missing}
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None):
+        if timeout is not None and timeout <= 0:
+            self.delete(key)
+            return
+        now = time.monotonic()
+        expires_at = None if timeout is None else now + timeout
+        size = 0
+        if self.max_bytes is not None:
+            value = self._unmemoized(value)
+            size = self._sizer(value) + len(key)
+            if size > self.max_bytes:
+                self.delete(key)
+                with self._lock:
+                    self._stats["rejected"] += 1
+                return
+
+        with self._lock:
+            self._reclaim(now)
+            self._store(key, value, expires_at, size)
+
+    def _store(self, key: str, value: Any, expires_at: Optional[float], size: int):
+        weight = 1 if self.max_bytes is None else size
+        previous = self._data.get(key)
+        if previous is not None:
+            self._account(key, -previous.size)
+            evicted = self._policy.update(key, weight)
+        else:
+            evicted = self._policy.insert(key, weight)
+        self._data[key] = _Entry(value, expires_at, size)
+        self._account(key, size)
+        if expires_at is not None:
+            self._wheel.schedule(key, expires_at)
+        elif previous is not None:
+            self._wheel.cancel(key)
+        for evicted_key in evicted:
+            self._wheel.cancel(evicted_key)
+            evicted_size = self._data.pop(evicted_key).size
+            self._account(evicted_key, -evicted_size)
+            self._stats["evicted_bytes"] += evicted_size
+        self._stats["evictions"] += len(evicted)
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None):
+        for key, value in mapping.items():
+            self.set(key, value, timeout)
+
+    def delete(self, key: str):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def delete_many(self, keys: List[str]):
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._policy.clear()
+            self._wheel.clear()
+            self._bytes = 0
+            self._namespace_bytes.clear()
+
+    def _remove(self, key: str):
+        entry = self._data.pop(key)
+        self._account(key, -entry.size)
+        self._policy.remove(key)
+        self._wheel.cancel(key)
+
+    def _reclaim(self, now: float):
+        """Remove the entries whose expiry tick has passed."""
+        for key in self._wheel.advance(now):
+            self._remove(key)
+            self._stats["expirations"] += 1
+
+    def _account(self, key: str, size: int):
+        if size:
+            self._bytes += size
+            namespace = key_namespace(key)
+            self._namespace_bytes[namespace] += size
+            if not self._namespace_bytes[namespace]:
+                del self._namespace_bytes[namespace]
+
+    def snapshot(self, path: str) -> int:
+        """Write the live entries with their remaining timeout to a snapshot file.
+
+        See :mod:`slycache.snapshot`.
+
+        Returns:
+            int: the number of entries written
+        """
+        with self._lock:
+            now = time.monotonic()
+            entries = [
+                (
+                    key,
+                    entry.value,
+                    None if entry.expires_at is None else entry.expires_at - now,
+                )
+                for key, entry in self._data.items()
+                if not self._expired(entry)
+            ]
+        return write_snapshot(path, entries)
+
+    def restore(self, path: str) -> int:
+        """Load the entries of a snapshot file. Values are unpickled on first access.
+
+        Keys that are already in the cache are not overwritten.
+
+        Returns:
+            int: the number of restored entries still in the cache once the snapshot is
+            loaded, i.e. excluding those evicted to make room for later entries
+        """
+        restored = []
+        for key, value, timeout in read_snapshot(path):
+            size = 0
+            if self.max_bytes is not None:
+                size = len(value) + len(key)
+                if size > self.max_bytes:
+                    continue
+            with self._lock:
+                if key in self._data:
+                    continue
+                now = time.monotonic()
+                self._reclaim(now)
+                expires_at = None if timeout is None else now + timeout
+                self._store(key, value, expires_at, size)
+                restored.append(key)
+        with self._lock:
+            return sum(1 for key in restored if key in self._data)
+
+    @staticmethod
+    def _expired(entry: _Entry) -> bool:
+        return entry.expires_at is not None and entry.expires_at <= time.monotonic()
+
+    def info(self) -> Dict[str, Any]:
+        """Return the size and hit / miss / eviction counters of the cache.
+
+        When bounded by ``max_bytes`` this includes the approximate memory used (``bytes``)
+        and its breakdown by key namespace (``namespaces``).
+        """
+        with self._lock:
+            info = {
+                "policy": self.policy_name,
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                **self._stats,
+            }
+            if self.max_bytes is not None:
+                info["bytes"] = self._bytes
+                info["max_bytes"] = self.max_bytes
+                info["namespaces"] = dict(self._namespace_bytes)
+            return info
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and not self._expired(entry)
+
+    def __repr__(self):
+        limit = (
+            f"max_bytes={self.max_bytes}"
+            if self.max_bytes
+            else f"max_entries={self.max_entries}"
+        )
+        return f"LocalCache({limit}, policy={self.policy_name!r})"
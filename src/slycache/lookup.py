@@ -0,0 +1,90 @@
+"""Strategies for looking up a cached value across multiple actions and keys.
+
+A lookup strategy receives the candidate ``(action, key)`` pairs in priority order along
+with a ``fetch`` callable which returns the cached value for a candidate or ``NOTSET``.
+It returns the first candidate (in priority order) that produced a hit.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Tuple, TypeVar
+
+from .const import NOTSET
+
+Candidate = TypeVar("Candidate")
+
+
+class SerialLookup:
+    """Check each candidate in turn, stopping at the first hit.
+
+    Keys for lower priority actions are only generated if the higher priority ones miss.
+    """
+
+    def lookup(
+        self, candidates: Iterable[Candidate], fetch: Callable[[Candidate], Any]
+    ) -> Tuple[Optional[Candidate], Any]:
+        for candidate in candidates:
+            value = fetch(candidate)
+            if value is not NOTSET:
+                return candidate, value
+        return None, NOTSET
+
+
+class ParallelLookup(SerialLookup):
+    """Issue the gets for all candidates concurrently using a thread pool.
+
+    The result still respects the declared priority order: a hit is only returned once all
+    higher priority candidates have missed. Lookups that have not started yet are cancelled
+    as soon as a hit is returned.
+
+    This is only worthwhile for remote backends where the round trip dominates. Lookups with
+    a single candidate are performed inline.
+
+    Arguments:
+        max_workers: the maximum number of threads used for lookups
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="slycache-lookup",
+                    )
+        return self._pool
+
+    def lookup(
+        self, candidates: Iterable[Candidate], fetch: Callable[[Candidate], Any]
+    ) -> Tuple[Optional[Candidate], Any]:
+        candidates = list(candidates)
+        if len(candidates) < 2:
+            return super().lookup(candidates, fetch)
+
+        pool = self.pool
+        futures = [
+            pool.submit(contextvars.copy_context().run, fetch, candidate)
+            for candidate in candidates
+        ]
+        try:
+            for candidate, future in zip(candidates, futures):
+                value = future.result()
+                if value is not NOTSET:
+                    return candidate, value
+        finally:
+            for future in futures:
+                future.cancel()
+        return None, NOTSET
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
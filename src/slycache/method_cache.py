@@ -0,0 +1,115 @@
+"""Per-instance caching of method results.
+
+Results are stored in a dictionary tied to the lifetime of the instance. Repeated calls on
+the same object with the same arguments skip key generation and backend I/O entirely and the
+memory is released when the object is garbage collected.
+
+Instances are tracked via weak references. Objects that do not support weak references must
+provide a ``_slycache_memo`` attribute (e.g. a slot) which is used to hold the results.
+"""
+
+import threading
+import weakref
+from functools import wraps
+from typing import Any, Callable, Dict, Optional
+
+from .key_generator import freeze_args
+
+MEMO_ATTRIBUTE = "_slycache_memo"
+
+
+class InstanceStore:
+    """Mapping of instance to a per-instance results dictionary."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._stores: Dict[int, tuple] = {}
+
+    def get(self, instance: Any, create: bool = True) -> Optional[dict]:
+        key = id(instance)
+        entry = self._stores.get(key)
+        if entry is not None and entry[0]() is instance:
+            return entry[1]
+        if not create:
+            return None
+
+        try:
+            ref = weakref.ref(instance, lambda _, key=key: self._discard(key))
+        except TypeError:
+            return self._get_from_attribute(instance)
+
+        store = {}
+        with self._lock:
+            self._stores[key] = (ref, store)
+        return store
+
+    def discard(self, instance: Any):
+        store = self.get(instance, create=False)
+        if store is not None:
+            store.clear()
+
+    def _discard(self, key: int):
+        with self._lock:
+            self._stores.pop(key, None)
+
+    def _get_from_attribute(self, instance: Any) -> Optional[dict]:
+        try:
+            memo = getattr(instance, MEMO_ATTRIBUTE)
+        except AttributeError:
+            memo = {}
+            try:
+                setattr(instance, MEMO_ATTRIBUTE, memo)
+            except AttributeError:
+                return None
+        return memo.setdefault(self.name, {})
+
+    def __len__(self):
+        return len(self._stores)
+
+
+def method_cache(func: Callable, compute: Callable) -> Callable:
+    """Wrap ``compute`` (``func`` or ``func`` decorated with ``cache_result``) with a
+    per-instance results store.
+
+    Calls with arguments that are not known to be immutable bypass the per-instance store.
+    ``None`` results are not stored.
+    """
+    store = InstanceStore(func.__qualname__)
+
+    @wraps(func)
+    def _inner(instance, *args, **kwargs):
+        key = _call_key(args, kwargs)
+        results = None if key is None else store.get(instance)
+        if results is None:
+            return compute(instance, *args, **kwargs)
+
+        try:
+            return results[key]
+        except KeyError:
+            pass
+
+        result = compute(instance, *args, **kwargs)
+        if result is not None:
+            results[key] = result
+        return result
+
+    def _clear(instance, *args, **kwargs):
+        key = _call_key(args, kwargs)
+        results = store.get(instance, create=False)
+        if results is not None and key is not None:
+            results.pop(key, None)
+        clear_shared = getattr(compute, "clear_cache", None)
+        if clear_shared is not None:
+            clear_shared(instance, *args, **kwargs)
+
+    _inner.clear_cache = _clear
+    _inner.clear_instance = store.discard
+    _inner.instance_store = store
+    return _inner
+
+
+def _call_key(args: tuple, kwargs: dict):
+    if not kwargs:
+        return freeze_args(dict(enumerate(args)))
+    return freeze_args({**dict(enumerate(args)), **kwargs})
@@ -0,0 +1,201 @@
+"""Refresh-ahead of hot cache entries.
+
+Functions decorated with ``refresh_ahead=True`` register the arguments of their calls with a
+:class:`RefreshAhead` scheduler. A background thread recomputes each registered entry shortly
+before its timeout ends so that reads of hot keys never see a miss. Entries that have not been
+read for ``idle_timeout`` seconds are dropped from the registry.
+
+```python
+@slycache.cache_result("{name}", timeout=60, refresh_ahead=True)
+def get_flag(name):
+    ...
+```
+
+Only calls whose arguments are known to be immutable (see :func:`slycache.key_generator.freeze_args`)
+are registered. Refreshes are scheduled from the smallest timeout of the entries stored by the
+``cache_result`` operations of the function: for timeout policies the lower bound of the
+timeout of each key (e.g. ``timeout * (1 - jitter)`` for :class:`slycache.JitteredTTL`).
+Functions without a timeout are not refreshed.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .key_generator import freeze_args
+
+if TYPE_CHECKING:
+    from .actions import ActionExecutor
+
+log = logging.getLogger("slycache")
+
+
+class _Entry:
+    __slots__ = ("executor", "args", "kwargs", "call_args", "last_read", "pending")
+
+    def __init__(self, executor, args, kwargs, call_args):
+        self.executor = executor
+        self.args = args
+        self.kwargs = kwargs
+        self.call_args = call_args
+        self.last_read = time.monotonic()
+        self.pending = False
+
+
+class RefreshAhead:
+    """Registry and scheduler for refresh-ahead entries.
+
+    Arguments:
+        max_workers: maximum number of concurrent recomputations
+        lead: fraction of the timeout before expiry at which entries are refreshed
+        idle_timeout: entries not read for this many seconds are no longer refreshed
+        max_entries: maximum number of registered entries. Calls are not registered once the
+            limit is reached.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        lead: float = 0.1,
+        idle_timeout: float = 300.0,
+        max_entries: int = 10000,
+    ):
+        if not 0 < lead < 1:
+            raise ValueError("lead must be in the range (0, 1)")
+        self.max_workers = max_workers
+        self.lead = lead
+        self.idle_timeout = idle_timeout
+        self.max_entries = max_entries
+        self._lock = threading.Condition()
+        self._entries: Dict[tuple, _Entry] = {}
+        self._schedule = []
+        self._counter = itertools.count()
+        self._pool = None
+        self._thread = None
+        self._generation = 0
+        self._stats = {"refreshed": 0, "failed": 0, "expired": 0}
+
+    def record(
+        self,
+        executor: "ActionExecutor",
+        args: tuple,
+        kwargs: dict,
+        call_args: Dict,
+        computed: bool,
+    ):
+        """Record a read of an entry, registering it if it is not known.
+
+        Arguments:
+            computed: True if the value was just computed, False if it was read from the cache.
+                Entries first seen as a cache hit are refreshed straight away since it is not
+                known when they were stored.
+        """
+        frozen = freeze_args(call_args)
+        if frozen is None:
+            return
+        identity = (executor, frozen)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(identity)
+            if entry is not None:
+                entry.last_read = now
+                return
+            if len(self._entries) >= self.max_entries:
+                return
+
+        interval = self._interval(executor, call_args)
+        if interval is None:
+            return
+        with self._lock:
+            if identity in self._entries or len(self._entries) >= self.max_entries:
+                return
+            self._entries[identity] = _Entry(executor, args, kwargs, call_args)
+            self._push(now + interval if computed else now, identity)
+            self._start()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"entries": len(self._entries), **self._stats}
+
+    def shutdown(self, wait: bool = True):
+        """Stop the scheduler and discard all entries."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._schedule.clear()
+            self._lock.notify_all()
+            thread, self._thread = self._thread, None
+            pool, self._pool = self._pool, None
+        if thread is not None and wait:
+            thread.join()
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _interval(self, executor: "ActionExecutor", call_args: Dict) -> Optional[float]:
+        timeout = executor.refresh_timeout(call_args)
+        if not timeout:
+            return None
+        return timeout * (1 - self.lead)
+
+    def _push(self, when: float, identity: tuple):
+        heapq.heappush(self._schedule, (when, next(self._counter), identity))
+        self._lock.notify()
+
+    def _start(self):
+        if self._thread is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="slycache-refresh"
+            )
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(self._generation,),
+                name="slycache-refresh-ahead",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self, generation: int):
+        with self._lock:
+            while generation == self._generation:
+                if not self._schedule:
+                    self._lock.wait()
+                    continue
+                when, _, identity = self._schedule[0]
+                delay = when - time.monotonic()
+                if delay > 0:
+                    self._lock.wait(delay)
+                    continue
+
+                heapq.heappop(self._schedule)
+                entry = self._entries.get(identity)
+                if entry is None or entry.pending:
+                    continue
+                if time.monotonic() - entry.last_read > self.idle_timeout:
+                    del self._entries[identity]
+                    self._stats["expired"] += 1
+                    continue
+                entry.pending = True
+                self._pool.submit(self._refresh, identity, entry)
+
+    def _refresh(self, identity: tuple, entry: _Entry):
+        try:
+            entry.executor.compute(entry.args, entry.kwargs, entry.call_args)
+        except Exception as e:  # pylint: disable=broad-except
+            log.warning("cache refresh failed: %r", e)
+            stat = "failed"
+        else:
+            stat = "refreshed"
+
+        interval = self._interval(entry.executor, entry.call_args)
+        with self._lock:
+            self._stats[stat] += 1
+            entry.pending = False
+            if identity in self._entries and interval is not None:
+                self._push(time.monotonic() + interval, identity)
+
+
+refresher = RefreshAhead()
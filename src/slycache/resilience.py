@@ -0,0 +1,215 @@
+"""Protection against slow or failing cache backends.
+
+A backend registered with a :class:`Resilience` policy is wrapped in a
+:class:`ResilientBackend` which enforces an operation timeout, tracks errors and latency
+and trips a circuit breaker when the backend misbehaves. While the breaker is open the
+cache is bypassed: gets are treated as misses and sets / deletes are dropped.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from .const import NOTSET
+from .interface import delete_many, get_many, set_many
+from .stats import CacheStats
+
+log = logging.getLogger("slycache")
+
+
+@dataclass(frozen=True)
+class Resilience:
+    """Resilience settings for a registered cache.
+
+    Arguments:
+        timeout: maximum time in seconds to wait for a cache operation. Operations are run on
+            a small thread pool in order to enforce the timeout. Leave unset if the backend
+            enforces its own timeouts (e.g. a Redis socket timeout).
+        slow_call_threshold: operations that take longer than this (seconds) are counted as
+            failures even if they succeed.
+        failure_threshold: number of consecutive failures after which the circuit breaker opens.
+        reset_timeout: time in seconds that the breaker stays open before a probe operation
+            is allowed through.
+        max_workers: size of the thread pool used to enforce ``timeout``.
+    """
+
+    timeout: Optional[float] = None
+    slow_call_threshold: Optional[float] = None
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    max_workers: int = 4
+
+
+class CircuitBreaker:
+    """Consecutive failure circuit breaker.
+
+    closed -> open: after ``failure_threshold`` consecutive failures
+    open -> half-open: after ``reset_timeout`` seconds, a single probe is allowed through
+    half-open -> closed: when the probe succeeds (or back to open if it fails)
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        """Return True if an operation may be sent to the backend."""
+        if self._state == self.CLOSED:
+            return True
+
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and self._clock() - self._opened_at >= self.reset_timeout
+            ):
+                self._state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        if self._state == self.CLOSED and not self._failures:
+            return
+        with self._lock:
+            self._failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> bool:
+        """Record a failed operation. Returns True if this failure opened the breaker."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                return True
+            return False
+
+
+class _Latency:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float):
+        with self._lock:
+            self.count += 1
+            self.total += elapsed
+            if elapsed > self.max:
+                self.max = elapsed
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            mean = self.total / self.count if self.count else 0.0
+            return {"count": self.count, "mean": mean, "max": self.max}
+
+
+class ResilientBackend:
+    """Wrapper around a cache backend that applies a :class:`Resilience` policy.
+
+    Backend errors are logged and swallowed: failed gets return the default value and failed
+    sets / deletes are dropped.
+    """
+
+    def __init__(self, backend, policy: Resilience, stats: Optional[CacheStats] = None):
+        self.backend = backend
+        self.policy = policy
+        self.breaker = CircuitBreaker(policy.failure_threshold, policy.reset_timeout)
+        self.stats = stats or CacheStats()
+        self._latency = _Latency()
+        self._pool = None
+        if policy.timeout is not None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=policy.max_workers, thread_name_prefix="slycache"
+            )
+        self.stats.add_provider("breaker", lambda: self.breaker.state)
+        self.stats.add_provider("latency", self._latency.snapshot)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        result = self._execute("get", self.backend.get, key, NOTSET)
+        return default if result is NOTSET else result
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None):
+        self._execute("set", self.backend.set, key, value, timeout)
+
+    def delete(self, key: str):
+        self._execute("delete", self.backend.delete, key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        result = self._execute("get", get_many, self.backend, keys)
+        return {} if result is NOTSET else result
+
+    def set_many(self, mapping: Dict[str, Any], timeout: Optional[int] = None):
+        self._execute("set", set_many, self.backend, mapping, timeout)
+
+    def delete_many(self, keys: List[str]):
+        self._execute("delete", delete_many, self.backend, keys)
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def _execute(self, operation: str, method: Callable, *args):
+        if not self.breaker.allow():
+            self.stats.incr(f"bypassed_{operation}s")
+            return NOTSET
+
+        start = time.perf_counter()
+        try:
+            if self._pool is None:
+                result = method(*args)
+            else:
+                result = self._pool.submit(method, *args).result(self.policy.timeout)
+        except FutureTimeoutError:
+            self.stats.incr("timeouts")
+            self._failed(operation, "timed out")
+            return NOTSET
+        except Exception as e:  # pylint: disable=broad-except
+            self.stats.incr("errors")
+            self._failed(operation, repr(e))
+            return NOTSET
+
+        elapsed = time.perf_counter() - start
+        self._latency.record(elapsed)
+        threshold = self.policy.slow_call_threshold
+        if threshold is not None and elapsed > threshold:
+            self.stats.incr("slow_calls")
+            self._failed(operation, f"took {elapsed:.3f}s")
+        else:
+            self.breaker.record_success()
+        return result
+
+    def _failed(self, operation: str, reason: str):
+        log.warning("cache %s failed: %s", operation, reason)
+        if self.breaker.record_failure():
+            self.stats.incr("breaker_opened")
+            log.warning(
+                "cache circuit breaker opened for %ss", self.policy.reset_timeout
+            )
+
+    def __repr__(self):
+        return f"ResilientBackend({self.backend!r}, {self.policy!r})"
@@ -0,0 +1,76 @@
+"""Request scoped memo of cache keys and values.
+
+Within a request scope the results of cache gets and the keys generated for a function
+call are memoised in process so that repeated calls with the same arguments never go back
+to the cache backend. Sets and deletes update the memo so that values read later in the same
+scope are consistent with the writes made in it.
+
+```python
+with slycache.request_scope():
+    get_user(1)  # cache lookup
+    get_user(1)  # served from the request memo
+```
+
+The scope is stored in a ``contextvars.ContextVar`` so it is local to the current thread
+or asyncio task.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from .const import NOTSET
+
+_current_scope: ContextVar[Optional["RequestScope"]] = ContextVar(
+    "slycache_request_scope", default=None
+)
+
+
+class RequestScope:
+    """Context manager that activates a request scoped memo.
+
+    Nested scopes share the memo of the outermost scope.
+    """
+
+    def __init__(self):
+        self.values: Dict[Tuple[str, str], Any] = {}
+        self.keys: Dict[Tuple, list] = {}
+        self._token = None
+
+    def __enter__(self) -> "RequestScope":
+        current = _current_scope.get()
+        if current is not None:
+            return current
+        self._token = _current_scope.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._token is not None:
+            _current_scope.reset(self._token)
+            self._token = None
+
+    def seen(self, cache_name: str, key: str) -> bool:
+        return (cache_name, key) in self.values
+
+    def get(self, cache_name: str, key: str) -> Any:
+        """Return the memoised value or ``NOTSET`` if the key was missing from the cache."""
+        return self.values.get((cache_name, key), NOTSET)
+
+    def set(self, cache_name: str, key: str, value: Any):
+        """Memoise a value. ``NOTSET`` records a cache miss."""
+        self.values[(cache_name, key)] = value
+
+    def delete(self, cache_name: str, key: str):
+        self.values[(cache_name, key)] = NOTSET
+
+    def clear(self):
+        self.values.clear()
+        self.keys.clear()
+
+
+def request_scope() -> RequestScope:
+    """Create a new request scope. See :mod:`slycache.scope`."""
+    return RequestScope()
+
+
+def current_scope() -> Optional[RequestScope]:
+    return _current_scope.get()
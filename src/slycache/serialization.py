@@ -0,0 +1,167 @@
+"""Serialization helpers used to size and transform cache values.
+
+Values are serialized with pickle, which is what the common cache backends (Django, Flask-Caching,
+python-memcached, redis-py clients etc) use, so the size reported here is a good approximation of
+the size of the stored item.
+
+Caches registered with ``lazy_values=True`` store values as a :class:`SerializedValue`. Backends
+that pickle their values only copy the bytes when reading it back, and the value is returned
+wrapped in a :class:`LazyValue` which unpickles it on first use. Scalar values (see
+:data:`SCALAR_TYPES`) are cheap to unpickle and are stored as is.
+"""
+
+import datetime
+import decimal
+import operator
+import pickle
+import uuid
+from typing import Any
+
+from .const import NOTSET
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+SCALAR_TYPES = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    decimal.Decimal,
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    uuid.UUID,
+)
+
+
+def dumps(value: Any) -> bytes:
+    return pickle.dumps(value, PROTOCOL)
+
+
+def loads(data: bytes) -> Any:
+    return pickle.loads(data)
+
+
+class SerializedValue:
+    """A pickled value. Unless ``memoize`` is false the unpickled value is kept once loaded so
+    that backends which store values by reference (e.g. :class:`slycache.LocalCache`) only
+    unpickle it once."""
+
+    __slots__ = ("data", "memoize", "_value")
+
+    def __init__(self, data: bytes, memoize: bool = True):
+        self.data = data
+        self.memoize = memoize
+        self._value = NOTSET
+
+    @classmethod
+    def of(cls, value: Any) -> Any:
+        """Return the value to store for a cache with lazy values. Scalars are returned as is."""
+        if isinstance(value, LazyValue):
+            return object.__getattribute__(value, "_serialized")
+        if isinstance(value, SCALAR_TYPES):
+            return value
+        return cls(dumps(value))
+
+    def load(self) -> Any:
+        value = self._value
+        if value is NOTSET:
+            value = loads(self.data)
+            if self.memoize:
+                self._value = value
+        return value
+
+    def __reduce__(self):
+        return SerializedValue, (self.data,)
+
+    def __len__(self):
+        return len(self.data)
+
+
+class LazyValue:
+    """Proxy for a cached value which is unpickled on first attribute or item access.
+
+    Attribute and item access, iteration, comparison and arithmetic operators are forwarded
+    to the value. ``isinstance`` and ``type`` see the proxy, use :func:`unwrap` to get the
+    value itself (e.g. for ``json.dumps``). Pickling the proxy pickles the value without
+    unpickling it.
+    """
+
+    __slots__ = ("_serialized",)
+
+    def __init__(self, serialized: SerializedValue):
+        object.__setattr__(self, "_serialized", serialized)
+
+    def __getattr__(self, name):
+        return getattr(unwrap(self), name)
+
+    def __getitem__(self, item):
+        return unwrap(self)[item]
+
+    def __iter__(self):
+        return iter(unwrap(self))
+
+    def __len__(self):
+        return len(unwrap(self))
+
+    def __contains__(self, item):
+        return item in unwrap(self)
+
+    def __bool__(self):
+        return bool(unwrap(self))
+
+    def __eq__(self, other):
+        return unwrap(self) == unwrap(other)
+
+    def __hash__(self):
+        return hash(unwrap(self))
+
+    def __str__(self):
+        return str(unwrap(self))
+
+    def __repr__(self):
+        return repr(unwrap(self))
+
+    def __reduce__(self):
+        return loads, (object.__getattribute__(self, "_serialized").data,)
+
+    def __lt__(self, other):
+        return unwrap(self) < unwrap(other)
+
+    def __le__(self, other):
+        return unwrap(self) <= unwrap(other)
+
+    def __gt__(self, other):
+        return unwrap(self) > unwrap(other)
+
+    def __ge__(self, other):
+        return unwrap(self) >= unwrap(other)
+
+
+def _forward(name: str, reflected: bool = False):
+    op = getattr(operator, name)
+    if reflected:
+        return lambda self, other: op(unwrap(other), unwrap(self))
+    return lambda self, other: op(unwrap(self), unwrap(other))
+
+
+for _name in ("add", "sub", "mul", "truediv", "floordiv", "mod", "and", "or", "xor"):
+    setattr(LazyValue, f"__{_name}__", _forward(f"__{_name}__"))
+    setattr(LazyValue, f"__r{_name}__", _forward(f"__{_name}__", reflected=True))
+
+
+def unwrap(value: Any) -> Any:
+    """Return the value of a :class:`LazyValue` or the value itself."""
+    if type(value) is LazyValue:
+        return object.__getattribute__(value, "_serialized").load()
+    return value
+
+
+def lazy(value: Any) -> Any:
+    """Wrap a value read from a cache in a :class:`LazyValue` if it was stored serialized."""
+    if type(value) is SerializedValue:
+        return LazyValue(value)
+    return value
@@ -0,0 +1,312 @@
+"""Offline cache simulator for access traces recorded with :class:`slycache.trace.TraceRecorder`.
+
+The cache lookups in a trace are replayed against simulated caches of different sizes and
+eviction policies to produce miss ratio curves:
+
+```python
+accesses = load_accesses("cache.trace")
+for policy, curve in miss_ratio_curves(accesses, [1000, 10000, 100000]).items():
+    print(policy, curve)
+```
+
+or from the command line:
+
+```shell
+$ python -m slycache.simulator cache.trace --capacities 1000,10000,100000 --ttl 300
+```
+
+Capacities are a number of entries, or a number of bytes when ``weigh_by_size`` is set
+(using the value sizes recorded with the stores of each key).
+"""
+
+import argparse
+import json
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional
+
+from .hotkeys import CountMinSketch
+from .trace import read_trace
+
+
+class Access(NamedTuple):
+    timestamp: float
+    key: int
+    size: int
+
+
+def load_accesses(path: str, function: Optional[str] = None) -> List[Access]:
+    """Load the lookups of a trace with the size of the value of each key.
+
+    Keys that were never stored are given a size of 1.
+    """
+    records = list(read_trace(path, function))
+    sizes = {}
+    for record in records:
+        if not record.is_access and record.size:
+            sizes[record.key_hash] = record.size
+    return [
+        Access(record.timestamp, record.key_hash, sizes.get(record.key_hash, 1))
+        for record in records
+        if record.is_access
+    ]
+
+
+class Policy:
+    """Base class for simulated caches.
+
+    Arguments:
+        capacity: maximum total weight of the entries
+        weigh_by_size: weigh entries by their size instead of counting them
+    """
+
+    name = ""
+
+    def __init__(self, capacity: int, weigh_by_size: bool = False):
+        self.capacity = capacity
+        self.weigh_by_size = weigh_by_size
+        self.used = 0
+
+    def weight(self, access: Access) -> int:
+        return access.size if self.weigh_by_size else 1
+
+    def access(self, access: Access) -> bool:
+        """Simulate a lookup, inserting the key on a miss. Returns True for a hit."""
+        raise NotImplementedError
+
+
+class LRU(Policy):
+    name = "lru"
+
+    def __init__(
+        self, capacity: int, weigh_by_size: bool = False, ttl: Optional[float] = None
+    ):
+        super().__init__(capacity, weigh_by_size)
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def access(self, access: Access) -> bool:
+        entry = self._entries.get(access.key)
+        if entry is not None:
+            inserted, weight = entry
+            if self.ttl is None or access.timestamp - inserted < self.ttl:
+                self._entries.move_to_end(access.key)
+                return True
+            del self._entries[access.key]
+            self.used -= weight
+
+        self.insert(access)
+        return False
+
+    def insert(self, access: Access):
+        weight = self.weight(access)
+        if weight > self.capacity:
+            return
+        while self.used + weight > self.capacity:
+            self.evict()
+        self._entries[access.key] = (access.timestamp, weight)
+        self.used += weight
+
+    def victim(self) -> int:
+        return next(iter(self._entries))
+
+    def evict(self):
+        _, (_, weight) = self._entries.popitem(last=False)
+        self.used -= weight
+
+
+class TTL(LRU):
+    """Entries expire ``ttl`` seconds after they were stored. Without a capacity this simulates
+    a cache with enough memory that entries are only removed when they expire."""
+
+    name = "ttl"
+
+    def __init__(
+        self, ttl: float, capacity: Optional[int] = None, weigh_by_size: bool = False
+    ):
+        super().__init__(capacity or float("inf"), weigh_by_size, ttl)
+
+
+class LFU(Policy):
+    """Evicts the least frequently used entry (least recently used among equals)."""
+
+    name = "lfu"
+
+    def __init__(self, capacity: int, weigh_by_size: bool = False):
+        super().__init__(capacity, weigh_by_size)
+        self._entries: Dict[int, tuple] = {}
+        self._buckets: Dict[int, OrderedDict] = defaultdict(OrderedDict)
+        self._min_count = 0
+
+    def access(self, access: Access) -> bool:
+        entry = self._entries.get(access.key)
+        if entry is not None:
+            count, weight = entry
+            bucket = self._buckets[count]
+            del bucket[access.key]
+            if not bucket:
+                del self._buckets[count]
+                if self._min_count == count:
+                    self._min_count = count + 1
+            self._buckets[count + 1][access.key] = None
+            self._entries[access.key] = (count + 1, weight)
+            return True
+
+        weight = self.weight(access)
+        if weight <= self.capacity:
+            while self.used + weight > self.capacity:
+                self._evict()
+            self._entries[access.key] = (1, weight)
+            self._buckets[1][access.key] = None
+            self._min_count = 1
+            self.used += weight
+        return False
+
+    def _evict(self):
+        while self._min_count not in self._buckets:
+            self._min_count += 1
+        bucket = self._buckets[self._min_count]
+        key, _ = bucket.popitem(last=False)
+        if not bucket:
+            del self._buckets[self._min_count]
+        _, weight = self._entries.pop(key)
+        self.used -= weight
+
+
+class TinyLFU(LRU):
+    """LRU with a TinyLFU admission filter: on a miss the new entry is only admitted if it
+    has been seen more often recently than the entry that would be evicted.
+
+    Frequencies are estimated with a Count-Min sketch that is halved every ``sample_size``
+    accesses (10 times the capacity by default).
+    """
+
+    name = "tinylfu"
+
+    def __init__(
+        self,
+        capacity: int,
+        weigh_by_size: bool = False,
+        sample_size: Optional[int] = None,
+    ):
+        super().__init__(capacity, weigh_by_size)
+        entries = capacity if not weigh_by_size else 10_000
+        self.sample_size = sample_size or max(10 * int(entries), 100)
+        self._sketch = CountMinSketch(width=max(int(entries) * 2, 64), depth=4)
+        self._samples = 0
+
+    def access(self, access: Access) -> bool:
+        self._sketch.add(access.key)
+        self._samples += 1
+        if self._samples >= self.sample_size:
+            self._sketch.halve()
+            self._samples = 0
+        return super().access(access)
+
+    def insert(self, access: Access):
+        weight = self.weight(access)
+        if self._entries and self.used + weight > self.capacity:
+            if self._sketch.estimate(access.key) <= self._sketch.estimate(
+                self.victim()
+            ):
+                return
+        super().insert(access)
+
+
+POLICIES: Dict[str, Callable[..., Policy]] = {
+    "lru": LRU,
+    "lfu": LFU,
+    "tinylfu": TinyLFU,
+}
+
+
+class SimulationResult(NamedTuple):
+    policy: str
+    capacity: Optional[float]
+    accesses: int
+    hits: int
+
+    @property
+    def miss_ratio(self) -> float:
+        return 1 - self.hits / self.accesses if self.accesses else 0.0
+
+
+def simulate(accesses: Iterable[Access], policy: Policy) -> SimulationResult:
+    hits = total = 0
+    for access in accesses:
+        total += 1
+        hits += policy.access(access)
+    capacity = None if policy.capacity == float("inf") else policy.capacity
+    return SimulationResult(policy.name, capacity, total, hits)
+
+
+def miss_ratio_curves(
+    accesses: List[Access],
+    capacities: Iterable[int],
+    policies: Iterable[str] = ("lru", "lfu", "tinylfu"),
+    ttl: Optional[float] = None,
+    weigh_by_size: bool = False,
+) -> Dict[str, List[SimulationResult]]:
+    """Simulate each policy at each capacity.
+
+    Arguments:
+        ttl: also expire entries after this many seconds (LRU only) and add a ``ttl`` curve
+            for a cache without a capacity limit
+    """
+    curves = {}
+    for name in policies:
+        factory = POLICIES[name]
+        curve = []
+        for capacity in capacities:
+            if name == "lru" and ttl is not None:
+                policy = factory(capacity, weigh_by_size, ttl)
+            else:
+                policy = factory(capacity, weigh_by_size)
+            curve.append(simulate(accesses, policy))
+        curves[name] = curve
+    if ttl is not None:
+        curves["ttl"] = [simulate(accesses, TTL(ttl, weigh_by_size=weigh_by_size))]
+    return curves
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Replay a slycache trace against simulated caches"
+    )
+    parser.add_argument("trace")
+    parser.add_argument("--capacities", default="100,1000,10000,100000")
+    parser.add_argument("--policies", default=",".join(POLICIES))
+    parser.add_argument("--ttl", type=float, help="entry timeout in seconds")
+    parser.add_argument("--function", help="only replay lookups of this function")
+    parser.add_argument("--bytes", action="store_true", help="capacities are in bytes")
+    parser.add_argument("--json", action="store_true", help="output JSON")
+    args = parser.parse_args(argv)
+
+    accesses = load_accesses(args.trace, args.function)
+    curves = miss_ratio_curves(
+        accesses,
+        [int(capacity) for capacity in args.capacities.split(",")],
+        args.policies.split(","),
+        args.ttl,
+        args.bytes,
+    )
+    if args.json:
+        data = {
+            name: [
+                {"capacity": result.capacity, "miss_ratio": result.miss_ratio}
+                for result in curve
+            ]
+            for name, curve in curves.items()
+        }
+        print(json.dumps(data, indent=2))
+        return
+
+    print(f"{len(accesses)} lookups")
+    print(f"{'policy':<10} {'capacity':>12} {'miss ratio':>10}")
+    for name, curve in curves.items():
+        for result in curve:
+            capacity = "-" if result.capacity is None else result.capacity
+            print(f"{name:<10} {capacity:>12} {result.miss_ratio:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 """Main module"""
 
+import hashlib
 import inspect
 import logging
+import math
+import time
 from dataclasses import dataclass, replace
 from functools import wraps
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from .actions import (
     ActionExecutor,
@@ -13,15 +16,51 @@ from .actions import (
     CacheRemoveAction,
     CacheResultAction,
 )
+from .batch import DeferredResult, current_batch
+from .chunking import ChunkManifest, split
 from .const import DEFAULT_CACHE_NAME, NOTSET, NotSet
 from .exceptions import InvalidCacheError, SlycacheException
-from .interface import CacheInterface, KeyGenerator
+from .interface import (
+    CacheInterface,
+    KeyGenerator,
+    delete_many,
+    get_many,
+    set_many,
+)
+from .hotkeys import HotKeyTracker
 from .invocations import CachePut, CacheRemove, CacheResult
 from .key_generator import StringFormatKeyGenerator
+from .local import LocalCache
+from .lookup import SerialLookup
+from .method_cache import method_cache
+from .refresh import RefreshAhead
+from .resilience import Resilience, ResilientBackend
+from .scope import current_scope
+from .serialization import SerializedValue, dumps, lazy
+from .stats import CacheStats
+from .ttl import TTLPolicy
+from .warm import warm
 
 log = logging.getLogger("slycache")
 
 
+@dataclass(frozen=True)
+class LargeValueRef:
+    """Marker stored in place of a value that was redirected to the ``large_value`` cache."""
+
+    cache_name: str
+
+
+@dataclass(frozen=True)
+class ValueRef:
+    """Pointer stored under each key of a deduplicated value. See ``dedupe``."""
+
+    key: str
+
+
+DIGEST_KEY_PREFIX = "slycache:digest:"
+
+
 @dataclass(frozen=True)
 class ProxyWithDefaults:
     """Proxy class that holds defaults for caching.
@@ -30,9 +69,13 @@ class ProxyWithDefaults:
     """
 
     cache_name: str
-    timeout: Union[int, NotSet] = NOTSET
+    timeout: Union[int, TTLPolicy, NotSet] = NOTSET
     namespace: Union[str, NotSet] = NOTSET
     _merged: bool = False
+    max_value_size: Union[int, None, NotSet] = NOTSET
+    large_value: Union[str, None, NotSet] = NOTSET
+    chunk_size: Union[int, None, NotSet] = NOTSET
+    lazy_values: Union[bool, NotSet] = NOTSET
 
     @property
     def key_namespace(self):
@@ -49,18 +92,264 @@ class ProxyWithDefaults:
             updates["timeout"] = defaults.timeout
         if self.namespace is NOTSET:
             updates["namespace"] = defaults.namespace
+        if self.max_value_size is NOTSET:
+            updates["max_value_size"] = defaults.max_value_size
+        if self.large_value is NOTSET:
+            updates["large_value"] = defaults.large_value
+        if self.chunk_size is NOTSET:
+            updates["chunk_size"] = defaults.chunk_size
+        if self.lazy_values is NOTSET:
+            updates["lazy_values"] = defaults.lazy_values
 
         return replace(self, **updates)
 
     def get(self, key: str, default: Any = None) -> Any:
-        return caches[self.cache_name].get(key, default)
+        scope = current_scope()
+        if scope is None:
+            value = self._fetch(key)
+            return default if value is NOTSET else value
+
+        if scope.seen(self.cache_name, key):
+            value = scope.get(self.cache_name, key)
+        else:
+            value = self._fetch(key)
+            scope.set(self.cache_name, key, value)
+        return default if value is NOTSET else value
+
+    def _fetch(self, key: str) -> Any:
+        hot_keys = caches.get_hot_keys(self.cache_name)
+        if hot_keys is not None:
+            hot_keys.record(key)
+        return lazy(self._resolve(key, caches[self.cache_name].get(key, NOTSET)))
+
+    def _resolve(self, key: str, value: Any) -> Any:
+        if isinstance(value, ValueRef):
+            return self._resolve(
+                value.key, caches[self.cache_name].get(value.key, NOTSET)
+            )
+        if isinstance(value, LargeValueRef):
+            return caches[value.cache_name].get(key, NOTSET)
+        if isinstance(value, ChunkManifest):
+            chunks = get_many(caches[self.cache_name], value.chunk_keys(key))
+            return self._join(key, value, chunks)
+        return value
+
+    def _join(self, key: str, manifest: ChunkManifest, chunks: Dict[str, Any]) -> Any:
+        value = manifest.join(key, chunks)
+        if value is NOTSET:
+            caches.get_stats(self.cache_name).incr("chunk_misses")
+        return value
+
+    def _fetch_many(self, keys: List[str]) -> Dict[str, Any]:
+        found = get_many(caches[self.cache_name], keys)
+        manifests = {
+            key: value
+            for key, value in found.items()
+            if isinstance(value, ChunkManifest)
+        }
+        chunks = {}
+        if manifests:
+            chunk_keys = [
+                chunk
+                for key, manifest in manifests.items()
+                for chunk in manifest.chunk_keys(key)
+            ]
+            chunks = get_many(caches[self.cache_name], chunk_keys)
+
+        refs = {
+            key: value.key
+            for key, value in found.items()
+            if isinstance(value, ValueRef)
+        }
+        targets = self._fetch_many(list(set(refs.values()))) if refs else {}
+
+        resolved = {}
+        for key, value in found.items():
+            if key in refs:
+                value = targets.get(refs[key], NOTSET)
+            elif key in manifests:
+                value = self._join(key, value, chunks)
+            else:
+                value = self._resolve(key, value)
+            if value is not NOTSET:
+                resolved[key] = lazy(value)
+        return resolved
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get multiple values in a single backend operation.
+
+        Returns:
+            dict: mapping of key to value for the keys that were found
+        """
+        hot_keys = caches.get_hot_keys(self.cache_name)
+        scope = current_scope()
+        if scope is None:
+            if hot_keys is not None:
+                for key in keys:
+                    hot_keys.record(key)
+            return self._fetch_many(keys)
+
+        found, missing = {}, []
+        for key in keys:
+            if scope.seen(self.cache_name, key):
+                value = scope.get(self.cache_name, key)
+                if value is not NOTSET:
+                    found[key] = value
+            else:
+                missing.append(key)
+        if missing:
+            if hot_keys is not None:
+                for key in missing:
+                    hot_keys.record(key)
+            fetched = self._fetch_many(missing)
+            for key in missing:
+                scope.set(self.cache_name, key, fetched.get(key, NOTSET))
+            found.update(fetched)
+        return found
+
+    def get_timeout(self, key: str, value: Any) -> Optional[int]:
+        """Return the timeout to use for storing the value under the key."""
+        if isinstance(self.timeout, TTLPolicy):
+            return self.timeout.get_timeout(key, value)
+        return None if self.timeout is NOTSET else self.timeout
 
     def set(self, key: str, value: Any):
-        timeout = None if self.timeout is NOTSET else self.timeout
-        caches[self.cache_name].set(key, value, timeout)
+        self._set(key, value, self.get_timeout(key, value))
+
+    def _set(self, key: str, value: Any, timeout: Optional[int]):
+        stored = SerializedValue.of(value) if self.lazy_values is True else value
+        limited = self.max_value_size not in (None, NOTSET)
+        chunked = self.chunk_size not in (None, NOTSET)
+        payload = dumps(stored) if limited or chunked else None
+        if limited and len(payload) > self.max_value_size:
+            self._set_large(key, stored, timeout, len(payload))
+            return
+
+        backend = caches[self.cache_name]
+        previous = None
+        if chunked or self.large_value not in (None, NOTSET):
+            previous = backend.get(key)
+        chunks = {}
+        if chunked and len(payload) > self.chunk_size:
+            manifest, chunks = split(key, payload, self.chunk_size)
+            set_many(backend, chunks, timeout)
+            backend.set(key, manifest, timeout)
+        else:
+            backend.set(key, stored, timeout)
+        self._release(key, previous, keep=chunks)
+        scope = current_scope()
+        if scope is not None:
+            scope.set(self.cache_name, key, value)
+
+    def set_deduped(self, keys: List[str], value: Any) -> str:
+        """Store the value once under a key derived from its content and a
+        :class:`ValueRef` pointing to it under each of the keys.
+
+        The content key is stored with the longest timeout of the pointers written to it so
+        far, so that storing a pointer with a shorter timeout does not cut short the lifetime
+        of the existing pointers. The content key is not deleted with its pointers.
+
+        Returns:
+            str: the content key
+        """
+        digest = hashlib.blake2b(dumps(value), digest_size=16).hexdigest()
+        digest_key = f"{DIGEST_KEY_PREFIX}{digest}"
+        if self.key_namespace:
+            digest_key = f"{self.key_namespace}:{digest_key}"
+        timeout = self.get_timeout(keys[0], value)
+        self._set(digest_key, value, self._digest_timeout(digest_key, timeout))
+
+        backend = caches[self.cache_name]
+        previous = {}
+        if self.chunk_size not in (None, NOTSET) or self.large_value not in (
+            None,
+            NOTSET,
+        ):
+            previous = get_many(backend, keys)
+        ref = ValueRef(digest_key)
+        set_many(backend, {key: ref for key in keys}, timeout)
+        for key, value in previous.items():
+            self._release(key, value)
+        scope = current_scope()
+        if scope is not None:
+            for key in keys:
+                scope.set(self.cache_name, key, value)
+        return digest_key
+
+    def _digest_timeout(self, digest_key: str, timeout: Optional[int]) -> Optional[int]:
+        """Extend the timeout to the expiry of the existing content entry.
+
+        The expiry time is kept under a separate small key since backends do not expose the
+        remaining timeout of an entry.
+        """
+        backend = caches[self.cache_name]
+        expiry_key = f"{digest_key}:expires"
+        now = time.time()
+        expires_at = backend.get(expiry_key)
+        if timeout is not None and expires_at is not None:
+            if expires_at == math.inf:
+                timeout = None
+            else:
+                timeout = max(timeout, math.ceil(expires_at - now))
+        backend.set(expiry_key, math.inf if timeout is None else now + timeout, timeout)
+        return timeout
+
+    def _set_large(self, key: str, value: Any, timeout: Optional[int], size: int):
+        """Redirect an oversized value to the ``large_value`` cache or skip it.
+
+        When skipped any existing value for the key is deleted so that it is not stale.
+        """
+        stats = caches.get_stats(self.cache_name)
+        if self.large_value in (None, NOTSET):
+            log.debug(
+                "cache_skip: value too large, cache=%s, key=%s, size=%s",
+                self.cache_name,
+                key,
+                size,
+            )
+            stats.incr("oversized_skipped")
+            self.delete(key)
+            return
+
+        backend = caches[self.cache_name]
+        previous = backend.get(key) if self.chunk_size not in (None, NOTSET) else None
+        caches[self.large_value].set(key, value, timeout)
+        backend.set(key, LargeValueRef(self.large_value), timeout)
+        self._release(key, previous)
+        stats.incr("oversized_redirected")
+        scope = current_scope()
+        if scope is not None:
+            scope.set(self.cache_name, key, lazy(value))
+
+    def _release(self, key: str, previous: Any, keep: Optional[Dict] = None):
+        """Delete the data referenced by the previous value of a key: the value a
+        :class:`LargeValueRef` points to or the chunks of a :class:`ChunkManifest` that are
+        not in ``keep``."""
+        if isinstance(previous, LargeValueRef):
+            caches[previous.cache_name].delete(key)
+        elif isinstance(previous, ChunkManifest):
+            keep = keep or {}
+            surplus = [chunk for chunk in previous.chunk_keys(key) if chunk not in keep]
+            if surplus:
+                delete_many(caches[self.cache_name], surplus)
 
     def delete(self, key: str):
-        caches[self.cache_name].delete(key)
+        backend = caches[self.cache_name]
+        keys = [key]
+        options = (self.max_value_size, self.large_value, self.chunk_size)
+        if any(option not in (None, NOTSET) for option in options):
+            previous = backend.get(key)
+            if isinstance(previous, ChunkManifest):
+                keys.extend(previous.chunk_keys(key))
+            else:
+                self._release(key, previous)
+        if len(keys) > 1:
+            delete_many(backend, keys)
+        else:
+            backend.delete(key)
+        scope = current_scope()
+        if scope is not None:
+            scope.delete(self.cache_name, key)
 
 
 class CacheHolder:
@@ -71,37 +360,104 @@ class CacheHolder:
     def __init__(self):
         self._caches = {}
         self._proxies = {}
+        self._stats = {}
+        self._hot_keys = {}
 
     def register(
         self,
         name: str,
         backend: CacheInterface,
-        default_timeout: int = None,
+        default_timeout: Union[int, TTLPolicy, None] = None,
         default_namespace: Union[str, NotSet] = NOTSET,
+        resilience: Optional[Resilience] = None,
+        max_value_size: Optional[int] = None,
+        large_value: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        hot_keys: Optional[HotKeyTracker] = None,
+        lazy_values: bool = False,
     ):
         if name in self._caches:
             raise InvalidCacheError(f"Cache '{name}' is already registered")
-        self.replace(name, backend, default_timeout, default_namespace)
+        self.replace(
+            name,
+            backend,
+            default_timeout,
+            default_namespace,
+            resilience,
+            max_value_size,
+            large_value,
+            chunk_size,
+            hot_keys,
+            lazy_values,
+        )
 
     def replace(
         self,
         name: str,
         backend: CacheInterface,
-        default_timeout: int = None,
+        default_timeout: Union[int, TTLPolicy, None] = None,
         default_namespace: Union[str, NotSet] = NOTSET,
+        resilience: Optional[Resilience] = None,
+        max_value_size: Optional[int] = None,
+        large_value: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        hot_keys: Optional[HotKeyTracker] = None,
+        lazy_values: bool = False,
     ):
+        self._close(name)
+        stats = CacheStats()
+        if isinstance(backend, LocalCache):
+            stats.add_provider("local", backend.info)
+        if hot_keys is not None:
+            stats.add_provider("hot_keys", hot_keys.hot_keys)
+        if resilience is not None:
+            backend = ResilientBackend(backend, resilience, stats)
         self._caches[name] = backend
+        self._stats[name] = stats
+        self._hot_keys[name] = hot_keys
         self._proxies[name] = ProxyWithDefaults(
-            name, timeout=default_timeout, namespace=default_namespace, _merged=True
+            name,
+            timeout=default_timeout,
+            namespace=default_namespace,
+            _merged=True,
+            max_value_size=max_value_size,
+            large_value=large_value,
+            chunk_size=chunk_size,
+            lazy_values=lazy_values,
         )
 
     def deregister(self, name: str):
+        self._close(name)
         try:
             del self._caches[name]
             del self._proxies[name]
+            del self._stats[name]
+            del self._hot_keys[name]
+        except KeyError:
+            raise InvalidCacheError(f"Slycache {name} not configured")
+
+    def _close(self, name):
+        backend = self._caches.get(name)
+        if isinstance(backend, ResilientBackend):
+            backend.close()
+
+    def stats(self, name: str) -> dict:
+        """Return a snapshot of the runtime statistics for a registered cache."""
+        try:
+            return self._stats[name].snapshot()
+        except KeyError:
+            raise InvalidCacheError(f"Slycache {name} not configured")
+
+    def get_stats(self, name: str) -> CacheStats:
+        try:
+            return self._stats[name]
         except KeyError:
             raise InvalidCacheError(f"Slycache {name} not configured")
 
+    def get_hot_keys(self, name: str) -> Optional[HotKeyTracker]:
+        """Return the hot key tracker of a registered cache, if it has one."""
+        return self._hot_keys.get(name)
+
     def registered_names(self):
         return list(self._caches)
 
@@ -136,17 +492,27 @@ class Slycache:
     """
 
     def __init__(
-        self, proxy: ProxyWithDefaults = None, key_generator: KeyGenerator = None
+        self,
+        proxy: ProxyWithDefaults = None,
+        key_generator: KeyGenerator = None,
+        lookup: SerialLookup = None,
     ):
         self._proxy = proxy or ProxyWithDefaults(DEFAULT_CACHE_NAME)
         self._key_generator = key_generator or StringFormatKeyGenerator()
+        self._lookup = lookup or SerialLookup()
 
     @staticmethod
     def register_backend(
         name: str,
         backend: CacheInterface,
-        default_timeout: Optional[int] = None,
+        default_timeout: Union[int, TTLPolicy, None] = None,
         default_namespace: Optional[Union[str, NotSet]] = NOTSET,
+        resilience: Optional[Resilience] = None,
+        max_value_size: Optional[int] = None,
+        large_value: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        hot_keys: Optional[HotKeyTracker] = None,
+        lazy_values: bool = False,
     ):
         """Register a cache backend.
 
@@ -154,11 +520,37 @@ class Slycache:
             name: (str): the name of the cache
             backend: (:obj:`slycache.interface.CacheInterface`): An instance of the backend class.
                 This must conform to the interface defined by :class:`slycache.interface.CacheInterface`
-            default_timeout: (int, optional): the default timeout for this backend (seconds). Defaults to no timeout.
+            default_timeout: (int or TTLPolicy, optional): the default timeout for this backend (seconds)
+                or a timeout policy such as :class:`slycache.JitteredTTL`. Defaults to no timeout.
             default_namespace: (str, optional): the default namespace for this backend. Defaults to None.
                 See :ref:`namespaces`
+            resilience: (Resilience, optional): timeout and circuit breaker settings for this backend.
+                When set, backend errors are logged and the cache is bypassed while the backend is unhealthy.
+                See :class:`slycache.Resilience`
+            max_value_size: (int, optional): maximum size in bytes of a serialized value. Larger values
+                are not stored in this cache. Defaults to no limit.
+            large_value: (str, optional): name of a registered cache to store values larger than
+                ``max_value_size`` in. A small marker is stored in this cache in their place.
+            chunk_size: (int, optional): split serialized values larger than this many bytes over
+                multiple keys. Use this for backends with a per item size limit.
+            hot_keys: (HotKeyTracker, optional): track the most frequently read keys of this cache.
+                The hot keys are reported under ``hot_keys`` in ``caches.stats(name)``.
+                See :class:`slycache.HotKeyTracker`
+            lazy_values: (bool, optional): store values pickled and return them wrapped in a proxy
+                that unpickles them on first use. See :class:`slycache.serialization.LazyValue`
         """
-        caches.register(name, backend, default_timeout, default_namespace)
+        caches.register(
+            name,
+            backend,
+            default_timeout,
+            default_namespace,
+            resilience,
+            max_value_size,
+            large_value,
+            chunk_size,
+            hot_keys,
+            lazy_values,
+        )
 
     def with_defaults(self, **defaults):
         """Return a new Slycache object with updated defaults.
@@ -169,24 +561,38 @@ class Slycache:
                 and validating keys.
             timeout: (int, optional): default timeout to use for keys
             namespace: (str, optional): key namespace to use
+            max_value_size: (int, optional): maximum size in bytes of a serialized value
+            large_value: (str, optional): name of the cache to store oversized values in
+            chunk_size: (int, optional): size in bytes above which values are split over multiple keys
+            lazy_values: (bool, optional): store values pickled and unpickle them on first use
+            lookup: (SerialLookup, optional): strategy used to check the caches for a value. Use
+                :class:`slycache.ParallelLookup` to check multiple caches and keys concurrently.
         """
         cache_name = defaults.pop("cache_name", None)
         key_generator = defaults.pop("key_generator", self._key_generator)
+        lookup = defaults.pop("lookup", self._lookup)
         if not cache_name and self._proxy:
             new_proxy = replace(self._proxy, **defaults)
         else:
             new_proxy = ProxyWithDefaults(cache_name or DEFAULT_CACHE_NAME, **defaults)
 
-        return Slycache(new_proxy, key_generator)
+        return Slycache(new_proxy, key_generator, lookup)
 
     def cache_result(
         self,
         keys: KeysType,
         *,
         cache_name: Optional[str] = None,
-        timeout: Union[int, NotSet] = NOTSET,
+        timeout: Union[int, TTLPolicy, NotSet] = NOTSET,
         namespace: Union[str, NotSet] = NOTSET,
         skip_get: bool = False,
+        min_compute_time: Optional[float] = None,
+        cost: Optional[Callable[[Any, float], float]] = None,
+        timeout_for_cost: Optional[Callable[[float], int]] = None,
+        max_value_size: Union[int, None, NotSet] = NOTSET,
+        large_value: Union[str, None, NotSet] = NOTSET,
+        dedupe: bool = False,
+        refresh_ahead: Union[bool, RefreshAhead] = False,
     ):
         """
         This is a function level decorator function used to mark methods whose returned value is cached,
@@ -222,8 +628,8 @@ class Slycache:
                 to actual cache keys using the currently active key generator. See :ref:`key-generator`
             cache_name (str, optional): If set this overrides the currently configured cache for this specific
                 operation.
-            timeout (int, optional): If set this overrides the currently configured timeout for this specific
-                operation.
+            timeout (int or TTLPolicy, optional): If set this overrides the currently configured timeout
+                for this specific operation. See :class:`slycache.ttl.TTLPolicy`.
             namespace (str, optional): If set this overrides the currently configured namespace for this specific
                 operation.
             skip_get (bool, optional): If set to true the pre-invocation is
@@ -232,10 +638,104 @@ class Slycache:
                 should always be executed and have their returned value placed in the cache.
 
                 Defaults to False.
+            min_compute_time (float, optional): Only cache results that took at least this
+                long (seconds) to compute. Cheap results are returned but not cached.
+            cost (callable, optional): Function of ``(result, elapsed)`` returning the cost of a
+                result. If set, the cost is compared to ``min_compute_time`` instead of the
+                elapsed time.
+            timeout_for_cost (callable, optional): Function of the cost (or elapsed time)
+                returning the timeout to use for the result, e.g. to cache expensive results
+                for longer.
+            max_value_size (int, optional): If set this overrides the maximum serialized size of
+                values for this specific operation.
+            large_value (str, optional): If set this overrides the cache that oversized values
+                are redirected to for this specific operation.
+            dedupe (bool, optional): If set and there are multiple keys the value is stored once
+                under a key derived from its content with each key holding a small pointer to it.
+            refresh_ahead (bool or RefreshAhead, optional): If set the arguments of calls are
+                registered and the values are recomputed in the background shortly before their
+                timeout ends. Pass a :class:`slycache.RefreshAhead` instance to use a scheduler
+                other than the default. See :mod:`slycache.refresh`.
+
+        Timing statistics for the decorated function are available via
+        ``func.compute_stats.snapshot()``.
         """
         if isinstance(keys, str):
             keys = [keys]
-        return self.caching(CacheResult(keys, cache_name, namespace, timeout, skip_get))
+        return self.caching(
+            CacheResult(
+                keys,
+                cache_name,
+                namespace,
+                timeout,
+                skip_get,
+                min_compute_time=min_compute_time,
+                cost=cost,
+                timeout_for_cost=timeout_for_cost,
+                max_value_size=max_value_size,
+                large_value=large_value,
+                dedupe=dedupe,
+                refresh_ahead=refresh_ahead,
+            )
+        )
+
+    def cache_method(
+        self,
+        keys: Optional[KeysType] = None,
+        *,
+        cache_name: Optional[str] = None,
+        timeout: Union[int, TTLPolicy, NotSet] = NOTSET,
+        namespace: Union[str, NotSet] = NOTSET,
+    ):
+        """
+        A method level decorator that caches the returned value per instance. Results are kept
+        in a store tied to the lifetime of the instance so repeated calls on the same object
+        with the same arguments do not need to generate keys or access a cache backend.
+
+        If ``keys`` are given the results are also cached in the configured cache as with
+        ``cache_result``, which acts as a second tier shared between instances and processes.
+
+        Per-instance caching is only applied to calls where all the arguments are immutable
+        (str, int, bool, None, bytes, UUID or tuples of those). ``None`` values are not cached.
+
+        ```python
+        class Report:
+            @slycache.cache_method()
+            def totals(self, year: int):
+                ...
+
+            @slycache.cache_method("{self.id}_{year}", timeout=300)
+            def summary(self, year: int):
+                ...
+        ```
+
+        Use ``clear_cache(instance, *args)`` to remove a single result or
+        ``clear_instance(instance)`` to remove all the results for an instance.
+
+        Args:
+            keys (str or List[str], optional): key template or list of key templates for the
+                shared cache tier. If omitted results are only cached per instance.
+            cache_name (str, optional): If set this overrides the currently configured cache
+                for the shared tier.
+            timeout (int, optional): If set this overrides the currently configured timeout
+                for the shared tier.
+            namespace (str, optional): If set this overrides the currently configured namespace
+                for the shared tier.
+        """
+
+        def _decorator(func):
+            if not callable(func):
+                raise SlycacheException(
+                    f"Decorator must be used on a function: {func!r}"
+                )
+            compute = func
+            if keys is not None:
+                compute = self.cache_result(
+                    keys, cache_name=cache_name, timeout=timeout, namespace=namespace
+                )(func)
+            return method_cache(func, compute)
+
+        return _decorator
 
     def cache_put(
         self,
@@ -243,8 +743,11 @@ class Slycache:
         *,
         cache_value: Optional[str] = None,
         cache_name: Optional[str] = None,
-        timeout: Union[int, NotSet] = NOTSET,
+        timeout: Union[int, TTLPolicy, NotSet] = NOTSET,
         namespace: Union[str, NotSet] = NOTSET,
+        max_value_size: Union[int, None, NotSet] = NOTSET,
+        large_value: Union[str, None, NotSet] = NOTSET,
+        dedupe: bool = False,
     ):
         """
         This is a function level decorator used to mark function where one of the function arguments
@@ -277,14 +780,31 @@ class Slycache:
                 if the function only has a single argument (excluding ``self``).
             cache_name (str, optional): If set this overrides the currently configured cache for this specific
                 operation.
-            timeout (int, optional): If set this overrides the currently configured timeout for this specific
-                operation.
+            timeout (int or TTLPolicy, optional): If set this overrides the currently configured timeout
+                for this specific operation. See :class:`slycache.ttl.TTLPolicy`.
             namespace (str, optional): If set this overrides the currently configured namespace for this specific
                 operation.
+            max_value_size (int, optional): If set this overrides the maximum serialized size of
+                values for this specific operation.
+            large_value (str, optional): If set this overrides the cache that oversized values
+                are redirected to for this specific operation.
+            dedupe (bool, optional): If set and there are multiple keys the value is stored once
+                under a key derived from its content with each key holding a small pointer to it.
         """
         if isinstance(keys, str):
             keys = [keys]
-        return self.caching(CachePut(keys, cache_name, namespace, cache_value, timeout))
+        return self.caching(
+            CachePut(
+                keys,
+                cache_name,
+                namespace,
+                cache_value,
+                timeout,
+                max_value_size=max_value_size,
+                large_value=large_value,
+                dedupe=dedupe,
+            )
+        )
 
     def cache_remove(
         self,
@@ -368,27 +888,43 @@ class Slycache:
                     f"Decorator must be used on a function: {func!r}"
                 )
 
-            action = ActionExecutor(func, actions, self._key_generator, self._proxy)
+            action = ActionExecutor(
+                func, actions, self._key_generator, self._proxy, self._lookup
+            )
             action.validate()
 
             @wraps(func)
             def _inner(*args, **kwargs):
                 call_args = inspect.signature(func).bind(*args, **kwargs).arguments
 
-                with action:
-                    result = action.get_cached(call_args)
-                    if result is not NOTSET:
-                        return result
+                key_cache = {}
+                result = action.get_cached(call_args, key_cache)
+                computed = result is NOTSET
+                if computed:
+                    result = action.compute(args, kwargs, call_args, key_cache)
 
-                    result = func(*args, **kwargs)
-                    action.call(result, call_args)
-                    return result
+                if action.refresher is not None:
+                    action.refresher.record(action, args, kwargs, call_args, computed)
+                return result
 
             def _clear(*args, **kwargs):
                 call_args = inspect.signature(func).bind(*args, **kwargs).arguments
                 action.clear_cache(call_args)
 
+            def _defer(*args, **kwargs):
+                batch = current_batch()
+                if batch is None:
+                    return DeferredResult.completed(_inner(*args, **kwargs))
+                call_args = inspect.signature(func).bind(*args, **kwargs).arguments
+                return batch.load(action, args, kwargs, call_args)
+
+            def _warm(arguments, **kwargs):
+                return warm(action, func, arguments, **kwargs)
+
             _inner.clear_cache = _clear
+            _inner.defer = _defer
+            _inner.warm = _warm
+            _inner.compute_stats = action.compute_stats
             return _inner
 
         return _decorator
@@ -0,0 +1,198 @@
+"""Snapshots of in-process caches for warm restarts.
+
+A snapshot is a stream of ``(key, pickled value, remaining timeout)`` records written to a
+temporary file which then atomically replaces the previous snapshot:
+
+```python
+cache.snapshot("/var/cache/app/local.snapshot")
+...
+cache.restore("/var/cache/app/local.snapshot")
+```
+
+Restoring memory maps the file and only indexes the keys. Values are unpickled on first
+access, so a large snapshot does not delay startup. The time between writing and restoring
+the snapshot is deducted from the remaining timeouts.
+
+:class:`PeriodicSnapshot` writes snapshots on an interval and / or at interpreter exit.
+"""
+
+import atexit
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Tuple
+
+from .serialization import dumps, loads
+
+if TYPE_CHECKING:
+    from .local import LocalCache
+
+log = logging.getLogger("slycache")
+
+MAGIC = b"SLYSNAP1\n"
+
+# time the snapshot was written
+FILE_HEADER = struct.Struct("<d")
+# key length, value length, remaining timeout (negative for none)
+RECORD = struct.Struct("<IId")
+
+
+class SnapshotValue:
+    """A pickled value in a memory mapped snapshot, unpickled by :meth:`load`."""
+
+    __slots__ = ("_buffer", "_offset", "_length")
+
+    def __init__(self, buffer: mmap.mmap, offset: int, length: int):
+        self._buffer = buffer
+        self._offset = offset
+        self._length = length
+
+    @property
+    def raw(self) -> bytes:
+        return self._buffer[self._offset : self._offset + self._length]
+
+    def load(self) -> Any:
+        return loads(self.raw)
+
+    def __len__(self):
+        return self._length
+
+
+def write_snapshot(
+    path: str, entries: Iterable[Tuple[str, Any, Optional[float]]]
+) -> int:
+    """Write ``(key, value, remaining timeout)`` entries to a snapshot file.
+
+    Values that can not be pickled are skipped.
+
+    Returns:
+        int: the number of entries written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix=".slycache-snapshot-", dir=directory)
+    written = 0
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(MAGIC)
+            file.write(FILE_HEADER.pack(time.time()))
+            for key, value, timeout in entries:
+                if isinstance(value, SnapshotValue):
+                    data = value.raw
+                else:
+                    try:
+                        data = dumps(value)
+                    except Exception:  # pylint: disable=broad-except
+                        log.warning("unable to snapshot value, key=%s", key)
+                        continue
+                encoded_key = key.encode("utf8")
+                file.write(
+                    RECORD.pack(
+                        len(encoded_key),
+                        len(data),
+                        -1.0 if timeout is None else timeout,
+                    )
+                )
+                file.write(encoded_key)
+                file.write(data)
+                written += 1
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return written
+
+
+def read_snapshot(path: str) -> Iterator[Tuple[str, SnapshotValue, Optional[float]]]:
+    """Index the entries of a snapshot file without unpickling the values.
+
+    Yields:
+        ``(key, value, remaining timeout)`` tuples. Entries that have expired since the
+        snapshot was written are skipped.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a slycache snapshot file: {path}")
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    position = len(MAGIC)
+    if len(buffer) < position + FILE_HEADER.size:
+        raise ValueError(f"Truncated slycache snapshot file: {path}")
+    (written_at,) = FILE_HEADER.unpack_from(buffer, position)
+    elapsed = max(0.0, time.time() - written_at)
+    position += FILE_HEADER.size
+    while position < len(buffer):
+        if position + RECORD.size > len(buffer):
+            log.warning("truncated snapshot file: %s", path)
+            return
+        key_length, value_length, timeout = RECORD.unpack_from(buffer, position)
+        position += RECORD.size
+        end = position + key_length + value_length
+        if end > len(buffer):
+            log.warning("truncated snapshot file: %s", path)
+            return
+        key = buffer[position : position + key_length].decode("utf8")
+        value = SnapshotValue(buffer, position + key_length, value_length)
+        position = end
+        if timeout < 0:
+            yield key, value, None
+        elif timeout > elapsed:
+            yield key, value, timeout - elapsed
+
+
+class PeriodicSnapshot:
+    """Write snapshots of a cache on an interval and / or at interpreter exit.
+
+    Arguments:
+        cache: the cache to snapshot
+        path: the snapshot file
+        interval: seconds between snapshots, ``None`` to only snapshot at exit
+        at_exit: write a snapshot when the interpreter exits
+    """
+
+    def __init__(
+        self,
+        cache: "LocalCache",
+        path: str,
+        interval: Optional[float] = None,
+        at_exit: bool = True,
+    ):
+        self.cache = cache
+        self.path = path
+        self.interval = interval
+        self.at_exit = at_exit
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "PeriodicSnapshot":
+        if self.at_exit:
+            atexit.register(self.write)
+        if self.interval and self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="slycache-snapshot", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the periodic snapshots. Does not write a final snapshot."""
+        if self.at_exit:
+            atexit.unregister(self.write)
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def write(self) -> int:
+        return self.cache.snapshot(self.path)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except Exception:  # pylint: disable=broad-except
+                log.exception("unable to write cache snapshot: %s", self.path)
@@ -0,0 +1,77 @@
+"""Runtime statistics for registered caches."""
+
+import threading
+from collections import Counter
+from typing import Callable, Dict
+
+
+class CacheStats:
+    """Thread safe counters for a single registered cache.
+
+    Components that need to report more than simple counters (e.g. the circuit breaker state)
+    can register a provider which is called when a snapshot is taken.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = Counter()
+        self._providers = {}
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def add_provider(self, name: str, provider: Callable[[], Dict]):
+        """Register a callable whose return value is included in the snapshot under ``name``."""
+        self._providers[name] = provider
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            snapshot = dict(self._counters)
+        for name, provider in self._providers.items():
+            snapshot[name] = provider()
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+class ComputeStats:
+    """Timing statistics for the invocations of a decorated function."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, elapsed: float, stored: bool):
+        with self._lock:
+            self.count += 1
+            self.total += elapsed
+            self.min = elapsed if self.min is None else min(self.min, elapsed)
+            self.max = max(self.max, elapsed)
+            if stored:
+                self.stored += 1
+            else:
+                self.skipped += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "count": self.count,
+                "total": self.total,
+                "mean": self.total / self.count if self.count else 0.0,
+                "min": self.min,
+                "max": self.max,
+                "stored": self.stored,
+                "skipped": self.skipped,
+            }
+
+    def reset(self):
+        with self._lock:
+            self.count = 0
+            self.total = 0.0
+            self.min = None
+            self.max = 0.0
+            self.stored = 0
+            self.skipped = 0
@@ -0,0 +1,240 @@
+"""Recording of cache access traces for offline analysis.
+
+:class:`TraceRecorder` registers :data:`slycache.hooks` callbacks and writes a compact binary
+record for each cache lookup (hit or miss) and store of decorated functions. Records are
+queued and written by a background thread so that the recording overhead on the calling
+thread is small; if the queue is full records are dropped rather than blocking.
+
+```python
+recorder = TraceRecorder("cache.trace").start()
+...
+recorder.stop()
+
+for record in read_trace("cache.trace"):
+    ...
+```
+
+Keys are recorded as 64 bit hashes. Value sizes (the pickled size of the stored value) are
+computed on the calling thread for the sampled stores only, so that the queue does not keep
+the values alive.
+
+The trace can be replayed against different cache configurations with
+:mod:`slycache.simulator`.
+"""
+
+import hashlib
+import logging
+import queue
+import random
+import struct
+import threading
+import time
+from typing import BinaryIO, Dict, Iterator, NamedTuple, Optional
+
+from .serialization import dumps
+from .tracing import CacheEvent, Hooks, hooks
+
+log = logging.getLogger("slycache")
+
+MAGIC = b"SLYTRACE1\n"
+
+MISS = 0
+HIT = 1
+SET = 2
+FUNCTION = 3
+
+# kind, timestamp, function id, key hash, value size, compute time
+RECORD = struct.Struct("<BdIQIf")
+# kind, function id, name length
+FUNCTION_HEADER = struct.Struct("<BIH")
+
+_STOP = object()
+
+
+class TraceRecord(NamedTuple):
+    kind: int
+    timestamp: float
+    function: str
+    key_hash: int
+    size: int
+    compute_time: float
+
+    @property
+    def is_access(self) -> bool:
+        return self.kind in (HIT, MISS)
+
+    @property
+    def hit(self) -> bool:
+        return self.kind == HIT
+
+
+def key_hash(key: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(key.encode("utf8"), digest_size=8).digest(), "little"
+    )
+
+
+class TraceRecorder:
+    """Record cache accesses of decorated functions to a binary trace file.
+
+    Arguments:
+        path: the file to write the trace to
+        sample_rate: fraction of lookups to record. Sampling is done per key so that all
+            the accesses of a sampled key are recorded.
+        max_queue: maximum number of records waiting to be written. Records are dropped
+            when the queue is full.
+        registry: the hooks registry to record events from
+    """
+
+    EVENTS = ("hit", "miss", "after_compute", "set")
+
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = 1.0,
+        max_queue: int = 100_000,
+        registry: Hooks = hooks,
+    ):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.registry = registry
+        self.dropped = 0
+        self.written = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._local = threading.local()
+        self._thread = None
+        self._seed = random.getrandbits(64)
+
+    def start(self) -> "TraceRecorder":
+        if self._thread is not None:
+            return self
+        file = open(self.path, "wb")  # pylint: disable=consider-using-with
+        file.write(MAGIC)
+        self._thread = threading.Thread(
+            target=self._write, args=(file,), name="slycache-trace", daemon=True
+        )
+        self._thread.start()
+        self.registry.register(self, self.EVENTS)
+        return self
+
+    def stop(self):
+        """Stop recording and wait for all queued records to be written."""
+        if self._thread is None:
+            return
+        self.registry.unregister(self)
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __call__(self, event: CacheEvent):
+        if event.name == "after_compute":
+            self._local.compute_time = event.elapsed
+            return
+        if self.sample_rate < 1 and not self._sampled(event.key):
+            return
+
+        if event.name == "set":
+            compute_time = getattr(self._local, "compute_time", None) or 0.0
+            self._local.compute_time = None
+            record = (
+                SET,
+                time.time(),
+                event.function,
+                event.key,
+                self._size(event),
+                compute_time,
+            )
+        else:
+            kind = HIT if event.name == "hit" else MISS
+            self._local.compute_time = None
+            record = (kind, time.time(), event.function, event.key, 0, 0.0)
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    @staticmethod
+    def _size(event: CacheEvent) -> int:
+        try:
+            return min(len(dumps(event.value)), 0xFFFFFFFF)
+        except Exception:  # pylint: disable=broad-except
+            log.debug("unable to size value for trace, key=%s", event.key)
+            return 0
+
+    def _sampled(self, key: str) -> bool:
+        return (hash(key) ^ self._seed) % 10_000 < self.sample_rate * 10_000
+
+    def _write(self, file: BinaryIO):
+        functions: Dict[object, int] = {}
+        with file:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                batch = [item]
+                while len(batch) < 1000:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _STOP:
+                        self._write_batch(file, functions, batch)
+                        return
+                    batch.append(item)
+                self._write_batch(file, functions, batch)
+
+    def _write_batch(self, file: BinaryIO, functions: Dict, batch):
+        chunks = []
+        for kind, timestamp, function, key, size, compute_time in batch:
+            function_id = functions.get(function)
+            if function_id is None:
+                function_id = functions[function] = len(functions)
+                name = f"{function.__module__}.{function.__qualname__}".encode("utf8")
+                chunks.append(FUNCTION_HEADER.pack(FUNCTION, function_id, len(name)))
+                chunks.append(name)
+            chunks.append(
+                RECORD.pack(
+                    kind, timestamp, function_id, key_hash(key), size, compute_time
+                )
+            )
+        file.write(b"".join(chunks))
+        self.written += len(batch)
+
+
+def read_trace(path: str, function: Optional[str] = None) -> Iterator[TraceRecord]:
+    """Read the records of a trace file.
+
+    Arguments:
+        path: the trace file
+        function: only return records of the function with this qualified name
+            (``module.qualname``)
+    """
+    functions = {}
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a slycache trace file: {path}")
+        while True:
+            kind = file.read(1)
+            if not kind:
+                return
+            if kind[0] == FUNCTION:
+                header = kind + file.read(FUNCTION_HEADER.size - 1)
+                _, function_id, length = FUNCTION_HEADER.unpack(header)
+                functions[function_id] = file.read(length).decode("utf8")
+                continue
+
+            data = kind + file.read(RECORD.size - 1)
+            if len(data) < RECORD.size:
+                return  # truncated trace
+            kind, timestamp, function_id, hashed, size, compute_time = RECORD.unpack(
+                data
+            )
+            name = functions[function_id]
+            if function is None or name == function:
+                yield TraceRecord(kind, timestamp, name, hashed, size, compute_time)
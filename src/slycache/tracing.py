@@ -0,0 +1,189 @@
+"""Instrumentation hooks for cache operations.
+
+Callbacks registered with :data:`hooks` are called with a :class:`CacheEvent` for each
+cache operation performed by decorated functions:
+
+* ``before_get``: before a key is looked up
+* ``hit`` / ``miss``: after a key is looked up, with the time taken by the lookup
+* ``after_compute``: after the decorated function was executed, with the time it took
+* ``set`` / ``delete``: after a key was stored or removed, with the time taken
+
+```python
+def log_misses(event):
+    print(event.function.__name__, event.key)
+
+slycache.hooks.register(log_misses, events=["miss"])
+```
+
+When no callbacks are registered the only cost to the cache operations is a single
+attribute check. :class:`TracingHook` adapts the events to spans of a tracer such as
+OpenTelemetry's.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Protocol
+
+log = logging.getLogger("slycache")
+
+EVENTS = ("before_get", "hit", "miss", "after_compute", "set", "delete")
+
+
+@dataclass(frozen=True)
+class CacheEvent:
+    """A cache operation.
+
+    Attributes:
+        name: the event name, one of ``before_get``, ``hit``, ``miss``, ``after_compute``,
+            ``set`` or ``delete``
+        function: the decorated function
+        cache_name: the name of the cache or None for ``after_compute``
+        key: the cache key or None for ``after_compute``
+        elapsed: time taken by the operation in seconds or None for ``before_get``
+        start_ns: wall clock time the operation started at, in nanoseconds since the epoch
+        value: the value stored for ``set`` events, otherwise None
+    """
+
+    name: str
+    function: Callable
+    cache_name: Optional[str]
+    key: Optional[str]
+    elapsed: Optional[float]
+    start_ns: int
+    value: Any = None
+
+
+HookCallback = Callable[[CacheEvent], Any]
+
+
+class Hooks:
+    """Registry of event callbacks. Exceptions raised by callbacks are logged and ignored."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._callbacks: Dict[str, List[HookCallback]] = {event: [] for event in EVENTS}
+        self.active = False
+
+    def register(
+        self, callback: HookCallback, events: Optional[Iterable[str]] = None
+    ) -> HookCallback:
+        """Register a callback for the given events (default all events)."""
+        events = EVENTS if events is None else list(events)
+        unknown = set(events) - set(EVENTS)
+        if unknown:
+            raise ValueError(f"Unknown events: {', '.join(sorted(unknown))}")
+        with self._lock:
+            for event in events:
+                self._callbacks[event] = [*self._callbacks[event], callback]
+            self.active = True
+        return callback
+
+    def unregister(self, callback: HookCallback):
+        with self._lock:
+            for event, callbacks in self._callbacks.items():
+                self._callbacks[event] = [cb for cb in callbacks if cb is not callback]
+            self.active = any(self._callbacks.values())
+
+    def clear(self):
+        with self._lock:
+            self._callbacks = {event: [] for event in EVENTS}
+            self.active = False
+
+    def emit(
+        self,
+        name: str,
+        function: Callable,
+        cache_name: Optional[str] = None,
+        key: Optional[str] = None,
+        elapsed: Optional[float] = None,
+        value: Any = None,
+    ):
+        callbacks = self._callbacks[name]
+        if not callbacks:
+            return
+        start_ns = time.time_ns() - int((elapsed or 0) * 1e9)
+        event = CacheEvent(name, function, cache_name, key, elapsed, start_ns, value)
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:  # pylint: disable=broad-except
+                log.exception("cache hook failed for event %s", name)
+
+    @contextmanager
+    def timed(
+        self,
+        name: str,
+        function: Callable,
+        cache_name: str,
+        key: str,
+        value: Any = None,
+    ):
+        """Emit an event with the time taken by the body of the ``with`` block."""
+        start = time.perf_counter()
+        yield
+        self.emit(name, function, cache_name, key, time.perf_counter() - start, value)
+
+
+hooks = Hooks()
+
+
+class Span(Protocol):
+    def set_attribute(self, key: str, value: Any): ...
+
+    def end(self, end_time: Optional[int] = None): ...
+
+
+class Tracer(Protocol):
+    """The subset of the OpenTelemetry ``Tracer`` API used by :class:`TracingHook`."""
+
+    def start_span(
+        self,
+        name: str,
+        attributes: Optional[Dict] = None,
+        start_time: Optional[int] = None,
+    ) -> Span: ...
+
+
+SPAN_NAMES = {
+    "hit": "cache lookup",
+    "miss": "cache lookup",
+    "after_compute": "compute",
+    "set": "cache store",
+    "delete": "cache delete",
+}
+
+
+class TracingHook:
+    """Hook callback that records a span for each timed event.
+
+    ```python
+    from opentelemetry import trace
+
+    TracingHook(trace.get_tracer("slycache")).register()
+    ```
+    """
+
+    def __init__(self, tracer: Tracer):
+        self.tracer = tracer
+
+    def __call__(self, event: CacheEvent):
+        span_name = SPAN_NAMES.get(event.name)
+        if span_name is None:
+            return
+        attributes = {"slycache.function": event.function.__qualname__}
+        if event.cache_name is not None:
+            attributes["slycache.cache"] = event.cache_name
+            attributes["slycache.key"] = event.key
+        if event.name in ("hit", "miss"):
+            attributes["slycache.hit"] = event.name == "hit"
+        span = self.tracer.start_span(
+            span_name, attributes=attributes, start_time=event.start_ns
+        )
+        span.end(end_time=event.start_ns + int(event.elapsed * 1e9))
+
+    def register(self, registry: Hooks = hooks) -> "TracingHook":
+        registry.register(self, SPAN_NAMES)
+        return self
@@ -0,0 +1,125 @@
+"""Policies used to choose the timeout of cache entries.
+
+A policy can be used anywhere a ``timeout`` is accepted:
+
+```python
+@slycache.cache_result("{user_id}", timeout=JitteredTTL(300, jitter=0.1))
+def get_user(user_id):
+    ...
+```
+"""
+
+import hashlib
+import random
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .serialization import dumps
+
+
+class TTLPolicy:
+    """Base class for timeout policies."""
+
+    def get_timeout(self, key: str, value: Any) -> Optional[int]:
+        """Return the timeout in seconds for the value being stored under the key."""
+        raise NotImplementedError
+
+    def min_timeout(self, key: str) -> Optional[float]:
+        """Return a lower bound for the timeout of the entry stored under the key, or None if
+        it is not known. Used to schedule refresh-ahead."""
+        return None
+
+
+class FixedTTL(TTLPolicy):
+    """The same timeout for every entry. Equivalent to passing an ``int``."""
+
+    def __init__(self, timeout: Optional[int]):
+        self.timeout = timeout
+
+    def get_timeout(self, key: str, value: Any) -> Optional[int]:
+        return self.timeout
+
+    def min_timeout(self, key: str) -> Optional[float]:
+        return self.timeout
+
+    def __repr__(self):
+        return f"FixedTTL({self.timeout})"
+
+
+class JitteredTTL(TTLPolicy):
+    """A random timeout within ``timeout * (1 ± jitter)``.
+
+    Spreads the expiry of entries that were written together (e.g. while warming a cache)
+    so that they are not all recomputed at the same time.
+
+    Arguments:
+        timeout: the nominal timeout in seconds
+        jitter: the maximum deviation from the nominal timeout as a fraction of it
+    """
+
+    def __init__(self, timeout: int, jitter: float = 0.1):
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in the range [0, 1)")
+        self.timeout = timeout
+        self.jitter = jitter
+
+    def get_timeout(self, key: str, value: Any) -> int:
+        spread = self.timeout * self.jitter
+        return max(1, round(self.timeout + random.uniform(-spread, spread)))
+
+    def min_timeout(self, key: str) -> float:
+        return max(1, self.timeout * (1 - self.jitter))
+
+    def __repr__(self):
+        return f"JitteredTTL({self.timeout}, jitter={self.jitter})"
+
+
+class AdaptiveTTL(TTLPolicy):
+    """A timeout that grows for keys whose value does not change when recomputed.
+
+    A hash of the last value stored for each key is kept in process (bounded to ``max_entries``
+    keys). When a key is stored with the same value as before its timeout is multiplied by
+    ``factor`` up to ``max_timeout``. When the value changes the timeout is reset to
+    ``timeout``.
+
+    Arguments:
+        timeout: the initial timeout in seconds
+        max_timeout: the upper bound for the timeout in seconds
+        factor: multiplier applied each time the value is unchanged
+        max_entries: maximum number of keys to track
+    """
+
+    def __init__(
+        self,
+        timeout: int,
+        max_timeout: int,
+        factor: float = 2.0,
+        max_entries: int = 10000,
+    ):
+        self.timeout = timeout
+        self.max_timeout = max_timeout
+        self.factor = factor
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get_timeout(self, key: str, value: Any) -> int:
+        digest = hashlib.blake2b(dumps(value), digest_size=8).digest()
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            timeout = self.timeout
+            if previous is not None and previous[0] == digest:
+                timeout = min(round(previous[1] * self.factor), self.max_timeout)
+            self._entries[key] = (digest, timeout)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return timeout
+
+    def min_timeout(self, key: str) -> int:
+        with self._lock:
+            entry = self._entries.get(key)
+        return self.timeout if entry is None else entry[1]
+
+    def __repr__(self):
+        return f"AdaptiveTTL({self.timeout}, max_timeout={self.max_timeout}, factor={self.factor})"
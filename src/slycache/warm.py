@@ -0,0 +1,171 @@
+"""Pre-populate the cache for a decorated function.
+
+```python
+report = get_user.warm([(1,), (2,), {"user_id": 3}], max_workers=8)
+```
+
+Each item in the arguments iterable is either a tuple of positional arguments or a dict of
+keyword arguments. Items whose value is already cached are skipped (checked with one
+``get_many`` per cache for each chunk of items), the rest are computed on a thread or process
+pool and stored in the cache.
+"""
+
+import importlib
+import inspect
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .batch import first_hit, get_many_candidates
+from .const import NOTSET
+from .exceptions import SlycacheException
+
+if TYPE_CHECKING:
+    from .actions import ActionExecutor
+
+log = logging.getLogger("slycache")
+
+WarmArguments = Union[tuple, Dict[str, Any]]
+
+
+@dataclass
+class WarmReport:
+    """Progress and timing information for a cache warming run."""
+
+    total: int = 0
+    skipped: int = 0
+    computed: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    compute_time: float = 0.0
+    errors: List[BaseException] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.skipped + self.computed + self.failed
+
+
+def warm(
+    executor: "ActionExecutor",
+    func: Callable,
+    arguments: Iterable[WarmArguments],
+    *,
+    use_processes: bool = False,
+    max_workers: int = 4,
+    chunk_size: int = 100,
+    progress: Optional[Callable[[WarmReport], None]] = None,
+) -> WarmReport:
+    """Compute and cache the results for the given arguments.
+
+    Arguments:
+        executor: the executor of the decorated function
+        func: the undecorated function
+        arguments: iterable of argument tuples or keyword argument dicts
+        use_processes: use a process pool instead of a thread pool. The function must be
+            importable by its qualified name. Results are returned to the current process
+            to be cached.
+        max_workers: maximum number of concurrent computations
+        chunk_size: number of items checked for existence (and computed) at a time
+        progress: callable that is passed the :class:`WarmReport` after each chunk
+
+    Returns:
+        WarmReport: counts and timings of the run
+    """
+    if use_processes and "<locals>" in func.__qualname__:
+        raise SlycacheException(
+            f"Function must be importable to warm using processes: {func.__qualname__}"
+        )
+
+    report = WarmReport()
+    start = time.perf_counter()
+    pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with pool_class(max_workers=max_workers) as pool:
+        for chunk in _chunks(arguments, chunk_size):
+            calls = [_bind(func, item) for item in chunk]
+            report.total += len(calls)
+            missing = _missing(executor, calls)
+            report.skipped += len(calls) - len(missing)
+
+            futures = {}
+            for args, kwargs, call_args in missing:
+                if use_processes:
+                    future = pool.submit(
+                        _compute_in_process,
+                        func.__module__,
+                        func.__qualname__,
+                        args,
+                        kwargs,
+                    )
+                else:
+                    future = pool.submit(
+                        _timed, executor.compute, args, kwargs, call_args
+                    )
+                futures[future] = call_args
+
+            for future in as_completed(futures):
+                try:
+                    result, compute_time = future.result()
+                    if use_processes:
+                        executor.call(result, futures[future], compute_time)
+                except Exception as e:  # pylint: disable=broad-except
+                    log.warning("cache warming failed: %r", e)
+                    report.failed += 1
+                    report.errors.append(e)
+                else:
+                    report.computed += 1
+                    report.compute_time += compute_time
+
+            report.elapsed = time.perf_counter() - start
+            if progress is not None:
+                progress(report)
+
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def _chunks(items: Iterable, size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _bind(func: Callable, item: WarmArguments):
+    if isinstance(item, dict):
+        args, kwargs = (), item
+    else:
+        args, kwargs = tuple(item), {}
+    call_args = inspect.signature(func).bind(*args, **kwargs).arguments
+    return args, kwargs, call_args
+
+
+def _missing(executor: "ActionExecutor", calls: List) -> List:
+    candidates = [
+        list(executor.iter_candidates(call_args)) for _, _, call_args in calls
+    ]
+    found = get_many_candidates(candidates)
+    return [
+        call
+        for call, call_candidates in zip(calls, candidates)
+        if not call_candidates or first_hit(call_candidates, found) is NOTSET
+    ]
+
+
+def _timed(func: Callable, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _compute_in_process(module: str, qualname: str, args: tuple, kwargs: dict):
+    target = importlib.import_module(module)
+    for name in qualname.split("."):
+        target = getattr(target, name)
+    target = inspect.unwrap(target)
+    return _timed(target, *args, **kwargs)
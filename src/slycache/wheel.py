@@ -0,0 +1,149 @@
+"""Hierarchical timing wheel for expiring entries of in-process caches.
+
+Deadlines are rounded up to a coarse tick (``resolution`` seconds). Each level of the wheel
+is a ring of ``slots`` buckets: level 0 holds the deadlines within the current rotation of
+single ticks, level 1 those within the current rotation of ``slots`` ticks and so on. When a
+higher level bucket comes due its keys are cascaded down to the lower levels. Scheduling and
+cancelling a key are O(1) and the cost of expiring keys is spread over the ticks.
+
+```python
+wheel = TimingWheel(resolution=1.0)
+wheel.schedule("key", time.monotonic() + 30)
+...
+for key in wheel.advance(time.monotonic()):
+    ...
+```
+
+Keys are returned by :meth:`TimingWheel.advance` once the tick containing their deadline has
+passed, so they may be returned up to one tick late, never early.
+"""
+
+import math
+import time
+from typing import Dict, Hashable, List, Optional
+
+
+class TimingWheel:
+    """Hierarchical timing wheel.
+
+    Arguments:
+        resolution: length of a tick in seconds
+        slots: number of buckets per level, must be a power of two
+        levels: number of levels. Deadlines further away than ``slots ** levels`` ticks
+            are kept in an overflow bucket which is cascaded once per full rotation.
+        start: the current time, defaults to ``time.monotonic()``
+
+    The wheel is not thread safe, callers must hold their own lock.
+    """
+
+    def __init__(
+        self,
+        resolution: float = 1.0,
+        slots: int = 64,
+        levels: int = 4,
+        start: Optional[float] = None,
+    ):
+        if slots < 2 or slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self._bits = slots.bit_length() - 1
+        self._mask = slots - 1
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._overflow: Dict[Hashable, int] = {}
+        self._buckets: Dict[Hashable, Dict[Hashable, int]] = {}
+        self._tick = self.to_tick(time.monotonic() if start is None else start)
+
+    def to_tick(self, now: float) -> int:
+        return math.floor(now / self.resolution)
+
+    def schedule(self, key: Hashable, deadline: float):
+        """Schedule (or reschedule) a key to expire at ``deadline`` seconds."""
+        self.cancel(key)
+        tick = max(math.ceil(deadline / self.resolution), self._tick + 1)
+        self._insert(key, tick)
+
+    def cancel(self, key: Hashable):
+        bucket = self._buckets.pop(key, None)
+        if bucket is not None:
+            del bucket[key]
+
+    def advance(self, now: float) -> List[Hashable]:
+        """Move the wheel forward to ``now`` and return the keys whose deadline has passed."""
+        target = self.to_tick(now)
+        if target <= self._tick:
+            return []
+        if not self._buckets:
+            self._tick = target
+            return []
+        if target - self._tick > len(self._buckets) + self.slots * self.levels:
+            # re-inserting every key is cheaper than walking the elapsed ticks
+            return self._rebuild(target)
+
+        expired: List[Hashable] = []
+        while self._tick < target:
+            self._tick += 1
+            tick = self._tick
+            for level in range(1, self.levels):
+                if tick & ((1 << (self._bits * level)) - 1):
+                    break
+                index = (tick >> (self._bits * level)) & self._mask
+                self._cascade(self._wheels[level][index], tick, expired)
+            else:
+                if not tick & ((1 << (self._bits * self.levels)) - 1):
+                    self._cascade(self._overflow, tick, expired)
+
+            bucket = self._wheels[0][tick & self._mask]
+            if bucket:
+                for key in bucket:
+                    del self._buckets[key]
+                expired.extend(bucket)
+                bucket.clear()
+        return expired
+
+    def clear(self):
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._overflow.clear()
+        self._buckets.clear()
+
+    def _insert(self, key: Hashable, tick: int):
+        bucket = self._overflow
+        for level in range(self.levels):
+            shift = self._bits * (level + 1)
+            if tick >> shift == self._tick >> shift:
+                bucket = self._wheels[level][
+                    (tick >> (shift - self._bits)) & self._mask
+                ]
+                break
+        bucket[key] = tick
+        self._buckets[key] = bucket
+
+    def _cascade(self, bucket: Dict[Hashable, int], now: int, expired: List[Hashable]):
+        entries = list(bucket.items())
+        bucket.clear()
+        for key, tick in entries:
+            if tick <= now:
+                del self._buckets[key]
+                expired.append(key)
+            else:
+                self._insert(key, tick)
+
+    def _rebuild(self, target: int) -> List[Hashable]:
+        entries = [(key, bucket[key]) for key, bucket in self._buckets.items()]
+        self.clear()
+        self._tick = target
+        expired = []
+        for key, tick in entries:
+            if tick <= target:
+                expired.append(key)
+            else:
+                self._insert(key, tick)
+        return expired
+
+    def __len__(self):
+        return len(self._buckets)
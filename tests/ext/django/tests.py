@@ -4,6 +4,8 @@ import pytest
 
 from slycache import caches
 from slycache.ext.django.apps import DjangoCacheAdapter
+from slycache.ext.django.middleware import RequestScopeMiddleware
+from slycache.scope import current_scope
 from tests.ext.services import UserServiceMultiple
 
 # import test cases
@@ -41,3 +43,12 @@ def test_django_caches():
     assert {"default", "other"} == set(caches.registered_names())
     assert isinstance(caches["default"], DjangoCacheAdapter)
     assert isinstance(caches["other"], DjangoCacheAdapter)
+
+
+def test_request_scope_middleware():
+    def view(request):
+        assert current_scope() is not None
+        return "response"
+
+    assert RequestScopeMiddleware(view)(None) == "response"
+    assert current_scope() is None
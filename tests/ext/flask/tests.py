@@ -1,7 +1,8 @@
 import pytest
 
 from slycache import caches
-from slycache.ext.flask import FlaskCacheAdapter, register_cache
+from slycache.ext.flask import FlaskCacheAdapter, init_request_scope, register_cache
+from slycache.scope import current_scope
 from tests.ext.services import UserServiceSingle
 
 # import test cases
@@ -35,3 +36,15 @@ service_under_test = UserServiceSingle
 def test_flask_caches():
     assert {"default"} == set(caches.registered_names())
     assert isinstance(caches["default"], FlaskCacheAdapter)
+
+
+def test_request_scope():
+    app = flask.Flask(__name__)
+    init_request_scope(app)
+
+    @app.route("/")
+    def index():
+        return "scoped" if current_scope() is not None else "unscoped"
+
+    assert app.test_client().get("/").data == b"scoped"
+    assert current_scope() is None
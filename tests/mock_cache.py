@@ -40,12 +40,24 @@ class DictCache:
         )
         self._cache[key] = entry
 
+    def get_many(self, keys):
+        entries = [self._cache[key] for key in keys if key in self._cache]
+        return {entry.key: entry.value for entry in entries if not entry.expired}
+
+    def set_many(self, mapping, timeout=None):
+        for key, value in mapping.items():
+            self.set(key, value, timeout)
+
     def delete(self, key: str):
         try:
             del self._cache[key]
         except KeyError:
             pass
 
+    def delete_many(self, keys):
+        for key in keys:
+            self.delete(key)
+
     def __repr__(self):
         return f"DictCache({self._alias}, {self._cache})"
 
@@ -1,4 +1,6 @@
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
@@ -187,3 +189,36 @@ def test_clear_cache_multiple(default_cache, other_cache):
     assert ".:other_1" not in other_cache
     assert ".:put_1" not in default_cache
     assert ".:other_put_1" not in other_cache
+
+
+def test_concurrent_calls_use_their_own_keys(default_cache):
+    barrier = threading.Barrier(4)
+
+    @slycache.cache_result("{value}")
+    def compute(value):
+        barrier.wait(timeout=5)
+        return value * 10
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        assert list(pool.map(compute, range(4))) == [0, 10, 20, 30]
+    for value in range(4):
+        assert default_cache.get(f"compute:value:{value}") == value * 10
+
+
+def test_recursive_calls(default_cache):
+    @slycache.cache_result("{n}")
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(10) == 55
+    assert default_cache.get("fib:n:10") == 55
+    assert default_cache.get("fib:n:9") == 34
+
+
+def test_concurrent_lazy_init(default_cache):
+    @slycache.cache_result("{value}")
+    def compute(value):
+        return value
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        assert list(pool.map(compute, range(100))) == list(range(100))
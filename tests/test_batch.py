@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+
+from slycache import CacheResult, batching, slycache
+from tests.mock_cache import DictCache
+
+
+class CountingCache(DictCache):
+    def __init__(self, alias):
+        super().__init__(alias)
+        self.gets = 0
+        self.get_manys = 0
+
+    def get(self, key, default=None):
+        self.gets += 1
+        return super().get(key, default)
+
+    def get_many(self, keys):
+        self.get_manys += 1
+        return super().get_many(keys)
+
+
+@pytest.fixture
+def counting_caches(clean_caches):
+    default, other = CountingCache("default"), CountingCache("other")
+    clean_caches.register("default", default)
+    clean_caches.register("other", other)
+    return default, other
+
+
+def test_batching(counting_caches):
+    default, other = counting_caches
+    ns = slycache.with_defaults(namespace="user")
+    calls = []
+
+    @ns.caching(
+        CacheResult(["{user_id}"]), CacheResult(["{user_id}"], cache_name="other")
+    )
+    def get_user(user_id):
+        calls.append(user_id)
+        return f"user {user_id}"
+
+    default.set("user:1", "cached 1")
+    other.set("user:2", "cached 2")
+
+    with batching():
+        results = [get_user.defer(user_id) for user_id in [1, 2, 3, 3]]
+        assert not any(result.done for result in results)
+        values = [result.result() for result in results]
+
+    assert values == ["cached 1", "cached 2", "user 3", "user 3"]
+    assert calls == [3]
+    assert (default.gets, default.get_manys) == (0, 1)
+    assert (other.gets, other.get_manys) == (0, 1)
+    assert default.get("user:3") == "user 3"
+
+
+def test_batch_flushed_on_exit(default_cache):
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        if arg is None:
+            raise ValueError
+        return arg
+
+    with batching():
+        result = compute.defer(1)
+        error = compute.defer(None)
+    assert result.result() == 1
+    with pytest.raises(ValueError):
+        error.result()
+
+
+def test_defer_without_batch(default_cache):
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        return arg
+
+    result = compute.defer(1)
+    assert result.done
+    assert result.result() == 1
+
+
+class FailingCache(DictCache):
+    def get_many(self, keys):
+        raise ConnectionError("backend down")
+
+
+def test_failed_flush_resolves_all_results(clean_caches):
+    clean_caches.register("default", FailingCache("default"))
+
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        return arg
+
+    with pytest.raises(ConnectionError):
+        with batching():
+            first = compute.defer(1)
+            second = compute.defer(2)
+            first.result()
+
+    assert second.done
+    with pytest.raises(ConnectionError):
+        second.result()
+
+
+class BlockingCache(DictCache):
+    def __init__(self, alias):
+        super().__init__(alias)
+        self.fetching = threading.Event()
+        self.release = threading.Event()
+
+    def get_many(self, keys):
+        self.fetching.set()
+        self.release.wait(5)
+        return super().get_many(keys)
+
+
+def test_result_waits_for_flush_in_other_thread(clean_caches):
+    cache = BlockingCache("default")
+    clean_caches.register("default", cache)
+
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        return arg * 2
+
+    with batching() as batch:
+        deferred = compute.defer(1)
+        flusher = threading.Thread(target=batch.flush)
+        flusher.start()
+        assert cache.fetching.wait(5)
+
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(deferred.result()))
+        waiter.start()
+        waiter.join(0.05)
+        assert results == []
+
+        cache.release.set()
+        waiter.join(5)
+        flusher.join(5)
+    assert results == [2]
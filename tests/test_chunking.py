@@ -0,0 +1,102 @@
+import pytest
+
+from slycache import caches, slycache
+from slycache.chunking import ChunkManifest, chunk_key
+from slycache.const import DEFAULT_CACHE_NAME
+from tests.mock_cache import DictCache
+
+
+@pytest.fixture
+def chunked_cache(clean_caches):
+    cache = DictCache("chunked")
+    caches.register(DEFAULT_CACHE_NAME, cache, chunk_size=100)
+    yield cache
+
+
+@pytest.fixture
+def proxy(chunked_cache):
+    return caches.get_proxy(DEFAULT_CACHE_NAME)
+
+
+def test_small_values_are_not_chunked(chunked_cache, proxy):
+    proxy.set("small", "x")
+    assert chunked_cache.get("small") == "x"
+
+
+def test_chunked_round_trip(chunked_cache, proxy):
+    value = {"data": "x" * 1000}
+    proxy.set("big", value)
+
+    manifest = chunked_cache.get("big")
+    assert isinstance(manifest, ChunkManifest)
+    assert manifest.count > 1
+    assert all(key in chunked_cache for key in manifest.chunk_keys("big"))
+    assert proxy.get("big") == value
+
+
+def test_missing_chunk_is_a_miss(chunked_cache, proxy):
+    proxy.set("big", "x" * 1000)
+    chunked_cache.delete(chunk_key("big", 1))
+    assert proxy.get("big") is None
+    assert caches.stats(DEFAULT_CACHE_NAME)["chunk_misses"] == 1
+
+
+def test_torn_write_is_a_miss(chunked_cache, proxy):
+    proxy.set("big", "x" * 1000)
+    manifest = chunked_cache.get("big")
+    proxy.set("big", "y" * 1000)
+    chunked_cache.set("big", manifest)
+    assert proxy.get("big") is None
+
+
+def test_get_many(chunked_cache, proxy):
+    proxy.set("a", "a" * 1000)
+    proxy.set("b", "b" * 1000)
+    proxy.set("c", "c")
+    chunked_cache.delete(chunk_key("b", 0))
+    assert proxy.get_many(["a", "b", "c", "d"]) == {"a": "a" * 1000, "c": "c"}
+
+
+def test_delete_removes_chunks(chunked_cache, proxy):
+    proxy.set("big", "x" * 1000)
+    manifest = chunked_cache.get("big")
+    proxy.delete("big")
+    assert "big" not in chunked_cache
+    assert not any(key in chunked_cache for key in manifest.chunk_keys("big"))
+
+
+def test_cache_result(chunked_cache):
+    calls = []
+
+    @slycache.cache_result("{size}")
+    def make(size):
+        calls.append(size)
+        return "x" * size
+
+    assert make(1000) == make(1000) == "x" * 1000
+    assert calls == [1000]
+
+
+def test_overwrite_removes_surplus_chunks(chunked_cache, proxy):
+    proxy.set("big", "x" * 1000)
+    old_chunks = chunked_cache.get("big").chunk_keys("big")
+    proxy.set("big", "y" * 300)
+    new_chunks = chunked_cache.get("big").chunk_keys("big")
+    assert len(new_chunks) < len(old_chunks)
+    assert [chunk in chunked_cache for chunk in old_chunks] == [
+        chunk in new_chunks for chunk in old_chunks
+    ]
+    assert proxy.get("big") == "y" * 300
+
+    proxy.set("big", "small")
+    assert not any(chunk in chunked_cache for chunk in old_chunks)
+    assert proxy.get("big") == "small"
+
+
+def test_delete_is_batched(chunked_cache, proxy):
+    deleted = []
+    chunked_cache.delete_many = deleted.append
+    proxy.set("big", "x" * 1000)
+    chunks = chunked_cache.get("big").chunk_keys("big")
+    proxy.delete("big")
+    assert deleted == [["big", *chunks]]
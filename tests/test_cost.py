@@ -0,0 +1,56 @@
+from slycache import CacheResult, slycache
+
+cost_cache = slycache.with_defaults(namespace="cost")
+
+
+def test_min_compute_time_skips_cheap_results(default_cache):
+    calls = []
+
+    @cost_cache.cache_result(
+        "{value}", cost=lambda result, elapsed: result, min_compute_time=10
+    )
+    def compute(value):
+        calls.append(value)
+        return value
+
+    assert compute(1) == 1
+    assert compute(1) == 1
+    assert calls == [1, 1]
+    assert "cost:1" not in default_cache
+
+    assert compute(20) == 20
+    assert compute(20) == 20
+    assert calls == [1, 1, 20]
+    assert default_cache.get("cost:20") == 20
+
+    stats = compute.compute_stats.snapshot()
+    assert (stats["count"], stats["stored"], stats["skipped"]) == (3, 1, 2)
+    assert stats["min"] <= stats["mean"] <= stats["max"]
+
+
+def test_timeout_for_cost(default_cache):
+    @cost_cache.cache_result(
+        "{value}",
+        cost=lambda result, elapsed: result,
+        timeout_for_cost=lambda cost: cost * 60,
+    )
+    def compute(value):
+        return value
+
+    compute(2)
+    compute(5)
+    assert default_cache.get_entry("cost:2").timeout == 120
+    assert default_cache.get_entry("cost:5").timeout == 300
+
+
+def test_admission_is_per_action(default_cache):
+    @cost_cache.caching(
+        CacheResult(["{value}"], min_compute_time=60),
+        CacheResult(["put_{value}"]),
+    )
+    def compute(value):
+        return value
+
+    compute(1)
+    assert "cost:1" not in default_cache
+    assert default_cache.get("cost:put_1") == 1
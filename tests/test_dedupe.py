@@ -0,0 +1,131 @@
+from dataclasses import dataclass
+
+from slycache import caches, request_scope, slycache
+from slycache.const import DEFAULT_CACHE_NAME
+from slycache.slycache import DIGEST_KEY_PREFIX, ValueRef
+from tests.mock_cache import DictCache
+
+
+@dataclass
+class User:
+    username: str
+    user_id: int
+
+
+@slycache.cache_put(["{user.username}", "{user.user_id}"], dedupe=True)
+def save_user(user):
+    pass
+
+
+def test_value_stored_once(default_cache):
+    user = User("bob", 1)
+    save_user(user)
+
+    refs = [
+        default_cache.get("save_user:user:bob"),
+        default_cache.get("save_user:user:1"),
+    ]
+    assert refs[0] == refs[1]
+    assert isinstance(refs[0], ValueRef)
+    assert refs[0].key.startswith(DIGEST_KEY_PREFIX)
+    assert default_cache.get(refs[0].key) == user
+
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    assert proxy.get("save_user:user:bob") == user
+
+
+def test_get_many_follows_pointers(default_cache):
+    save_user(User("bob", 1))
+    save_user(User("alice", 2))
+    default_cache.set("plain", "value")
+
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    assert proxy.get_many(
+        ["save_user:user:bob", "save_user:user:2", "plain", "missing"]
+    ) == {
+        "save_user:user:bob": User("bob", 1),
+        "save_user:user:2": User("alice", 2),
+        "plain": "value",
+    }
+
+
+def test_missing_digest_entry_is_a_miss(default_cache):
+    save_user(User("bob", 1))
+    ref = default_cache.get("save_user:user:bob")
+    default_cache.delete(ref.key)
+
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    assert proxy.get("save_user:user:bob") is None
+    assert proxy.get_many(["save_user:user:bob"]) == {}
+
+
+def test_cache_result_dedupe(default_cache):
+    calls = []
+
+    @slycache.cache_result(["{user_id}", "id_{user_id}"], dedupe=True)
+    def get_user(user_id):
+        calls.append(user_id)
+        return User("bob", user_id)
+
+    with request_scope():
+        assert get_user(1) == User("bob", 1)
+    assert get_user(1) == User("bob", 1)
+    assert calls == [1]
+
+
+def test_digest_key_is_namespaced(default_cache):
+    users = slycache.with_defaults(namespace="users")
+
+    @users.cache_put(["{user.username}", "{user.user_id}"], dedupe=True)
+    def save(user):
+        pass
+
+    save(User("bob", 1))
+    ref = default_cache.get("users:bob")
+    assert ref.key.startswith(f"users:{DIGEST_KEY_PREFIX}")
+    assert default_cache.get(ref.key) == User("bob", 1)
+
+
+def test_digest_keeps_longest_timeout(default_cache):
+    def saver(timeout):
+        @slycache.cache_put(
+            ["{user.username}", "{user.user_id}"], dedupe=True, timeout=timeout
+        )
+        def save(user):
+            pass
+
+        return save
+
+    user = User("bob", 1)
+    saver(600)(user)
+    saver(60)(user)
+    digest_key = default_cache.get("save:user:1").key
+    assert default_cache.get_entry("save:user:1").timeout == 60
+    assert 599 <= default_cache.get_entry(digest_key).timeout <= 600
+
+    saver(None)(user)
+    saver(60)(user)
+    assert default_cache.get_entry(digest_key).timeout is None
+
+
+def test_pointers_release_previous_values(clean_caches):
+    backend, large = DictCache("default"), DictCache("large")
+    clean_caches.register("large", large)
+    clean_caches.register(
+        DEFAULT_CACHE_NAME,
+        backend,
+        max_value_size=200,
+        large_value="large",
+        chunk_size=100,
+    )
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    proxy.set("redirected", "x" * 500)
+    proxy.set("chunked", "y" * 150)
+    assert large.get("redirected") is not None
+    chunk_keys = backend.get("chunked").chunk_keys("chunked")
+    assert all(backend.get(key) is not None for key in chunk_keys)
+
+    proxy.set_deduped(["redirected", "chunked"], "small")
+    assert large.get("redirected") is None
+    assert all(backend.get(key) is None for key in chunk_keys)
+    assert proxy.get("redirected") == proxy.get("chunked") == "small"
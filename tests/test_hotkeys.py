@@ -0,0 +1,90 @@
+import pytest
+
+from slycache import HotKeyTracker, caches, slycache
+from slycache.const import DEFAULT_CACHE_NAME
+from slycache.hotkeys import CountMinSketch
+from tests.mock_cache import DictCache
+
+
+def test_count_min_sketch():
+    sketch = CountMinSketch(width=64, depth=4)
+    for _ in range(10):
+        sketch.add("a")
+    sketch.add("b", 3)
+    assert sketch.estimate("a") >= 10
+    assert sketch.estimate("b") >= 3
+    sketch.halve()
+    assert sketch.estimate("a") >= 5
+
+
+def test_top_k():
+    tracker = HotKeyTracker(sample_rate=1, top_k=3, window=None)
+    for count, key in enumerate(["a", "b", "c", "d", "e"], start=1):
+        for _ in range(count * 10):
+            tracker.record(key)
+
+    hot = tracker.hot_keys()
+    assert [item["key"] for item in hot] == ["e", "d", "c"]
+    assert hot[0]["count"] >= 50
+
+
+def test_decay():
+    tracker = HotKeyTracker(sample_rate=1, top_k=3, window=10)
+    for _ in range(9):
+        tracker.record("a")
+    assert tracker.hot_keys() == [{"key": "a", "count": 9}]
+    tracker.record("a")
+    assert tracker.hot_keys()[0]["count"] < 10
+
+
+def test_sampling_scales_counts():
+    tracker = HotKeyTracker(sample_rate=0.5, window=None)
+    for _ in range(2000):
+        tracker.record("a")
+    assert 1600 < tracker.hot_keys()[0]["count"] < 2400
+
+
+def test_invalid_sample_rate():
+    with pytest.raises(ValueError):
+        HotKeyTracker(sample_rate=0)
+
+
+def test_stats(clean_caches):
+    caches.register(
+        DEFAULT_CACHE_NAME,
+        DictCache("hot"),
+        hot_keys=HotKeyTracker(sample_rate=1),
+    )
+
+    @slycache.cache_result("{value}")
+    def compute(value):
+        return value
+
+    for _ in range(5):
+        compute(1)
+    compute(2)
+
+    hot = caches.stats(DEFAULT_CACHE_NAME)["hot_keys"]
+    assert hot == [
+        {"key": "compute:value:1", "count": 5},
+        {"key": "compute:value:2", "count": 1},
+    ]
+
+
+def test_internal_reads_not_counted(clean_caches):
+    tracker = HotKeyTracker(sample_rate=1)
+    caches.register(
+        DEFAULT_CACHE_NAME, DictCache("hot"), chunk_size=64, hot_keys=tracker
+    )
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+
+    proxy.set("big", "x" * 500)
+    proxy.set("big", "y" * 500)
+    assert tracker.hot_keys() == []
+
+    assert proxy.get("big") == "y" * 500
+    assert proxy.get_many(["big", "missing"]) == {"big": "y" * 500}
+    assert tracker.hot_keys() == [
+        {"key": "big", "count": 2},
+        {"key": "missing", "count": 1},
+    ]
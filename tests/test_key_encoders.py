@@ -0,0 +1,94 @@
+import array
+import enum
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import pytest
+
+from slycache.key_encoders import KeyEncoderRegistry
+from slycache.key_generator import StringFormatKeyGenerator
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class Pair(NamedTuple):
+    left: int
+    right: int
+
+
+class Base:
+    def __init__(self, ident):
+        self.ident = ident
+
+
+class Child(Base):
+    pass
+
+
+def func(arg):
+    pass
+
+
+def _key(arg, generator=None):
+    generator = generator or StringFormatKeyGenerator()
+    return generator.generate("ns", "{arg}", func, {"arg": arg})
+
+
+def test_enum():
+    assert _key(Color.RED) == f"ns:{__name__}.Color.RED"
+
+
+def test_enum_name_clash():
+    Other = enum.Enum("Color", {"RED": "red"})
+    Other.__module__ = "other.module"
+    assert _key(Other.RED) == "ns:other.module.Color.RED"
+    assert _key(Other.RED) != _key(Color.RED)
+
+
+def test_dataclass():
+    assert _key(Point(1, 2)) == _key(Point(1, 2))
+    assert _key(Point(1, 2)) != _key(Point(2, 1))
+    assert _key([Point(1, 2)]) != _key([Point(2, 1)])
+
+
+def test_namedtuple():
+    assert _key(Pair(1, 2)) != _key(Pair(2, 1))
+    # named tuples keep the plain tuple encoding at every depth
+    assert _key(Pair(1, 2)) == _key((1, 2))
+    assert _key([Pair(1, 2)]) == _key([(1, 2)])
+
+
+def test_buffers():
+    data = array.array("i", [1, 2, 3])
+    assert _key(data) == _key(array.array("i", [1, 2, 3]))
+    assert _key(data).startswith("ns:buffer:")
+    assert _key(data) != _key(array.array("i", [1, 2, 4]))
+    assert _key(array.array("b", [1])) != _key(array.array("B", [1]))
+    assert _key(memoryview(bytes(range(10)))[::2]) == _key(
+        memoryview(bytes(range(0, 10, 2)))
+    )
+
+
+def test_register_resolves_mro():
+    generator = StringFormatKeyGenerator()
+    with pytest.raises(ValueError):
+        _key(Child(1), generator)
+
+    generator.register_encoder(Base, lambda obj: f"base-{obj.ident}")
+    assert _key(Child(1), generator) == "ns:base-1"
+    assert _key({"a": Child(1)}, generator) == _key({"a": "base-1"}, generator)
+
+
+def test_registry_cache():
+    registry = KeyEncoderRegistry(builtins=False)
+    assert registry.resolve(Color.RED) is None
+    registry.register(Color, str)
+    assert registry.resolve(Color.RED) is str
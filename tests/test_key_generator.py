@@ -6,7 +6,7 @@ from decimal import Decimal, ROUND_UP
 import pytest
 
 from slycache.exceptions import KeyFormatException
-from slycache.key_generator import StringFormatKeyGenerator, StringFormatter
+from slycache.key_generator import KeyHasher, StringFormatKeyGenerator, StringFormatter
 
 now = datetime.now()
 now_utc = datetime.now(timezone.utc)
@@ -108,3 +108,61 @@ def test_key_formatting(template, call_args, expected):
         "ns", template, something_to_cache, call_args
     )
     assert key == expected
+
+
+@pytest.mark.parametrize(
+    "arg",
+    [
+        list(range(20_000)),
+        {f"key{i}": [i, fixed_now] for i in range(10_000)},
+    ],
+)
+def test_large_values_hashed_in_chunks(arg):
+    expected = StringFormatter().format("{arg}", arg=arg)
+    hasher = KeyHasher()
+    hasher.chunk_size = 100
+    assert StringFormatter(hasher).format("{arg}", arg=arg) == expected
+
+
+def test_hash_algorithm():
+    generator = StringFormatKeyGenerator(hash_algorithm="blake2b", hash_digest_size=8)
+    key = generator.generate("ns", "{arg1}", something_to_cache, {"arg1": [1, 2, 3]})
+    assert key == "ns:" + KeyHasher("blake2b", 8).hash([1, 2, 3])
+    assert len(key) == len("ns:") + 11  # 8 bytes base64 encoded
+
+
+def test_invalid_hash_algorithm():
+    with pytest.raises(ValueError):
+        StringFormatKeyGenerator(hash_algorithm="bogus")
+
+
+def test_key_cache():
+    generator = StringFormatKeyGenerator(key_cache_size=2)
+    uncached = StringFormatKeyGenerator()
+
+    def generate(gen, template, **call_args):
+        return gen.generate("ns", template, something_to_cache, call_args)
+
+    for template, call_args in [
+        ("{arg1}", {"arg1": 1}),
+        ("{arg1}", {"arg1": True}),
+        ("{arg1}", {"arg1": (1, "a")}),
+        ("{arg1}-{kw_arg}", {"arg1": "a", "kw_arg": None}),
+    ]:
+        expected = generate(uncached, template, **call_args)
+        assert generate(generator, template, **call_args) == expected
+        assert generate(generator, template, **call_args) == expected
+    info = generator.key_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 4, 2)
+
+    # mutable and unknown arguments are not memoised
+    assert generate(generator, "{arg1}", arg1=[1]) == generate(
+        uncached, "{arg1}", arg1=[1]
+    )
+    generate(generator, "{arg1}", arg1=now)
+    assert generator.key_cache_info().misses == 4
+
+    # unreferenced arguments are ignored
+    generate(generator, "{arg1}-{kw_arg}", arg1="a", kw_arg=None, arg2=[1])
+    assert generator.key_cache_info().hits == 5
+    assert StringFormatKeyGenerator().key_cache_info() is None
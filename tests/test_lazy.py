@@ -0,0 +1,155 @@
+import json
+import pickle
+
+import pytest
+
+from slycache import LocalCache, caches, slycache
+from slycache.const import DEFAULT_CACHE_NAME, NOTSET
+from slycache.serialization import LazyValue, SerializedValue, unwrap
+from tests.mock_cache import DictCache
+
+
+class Report:
+    loads = 0
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __setstate__(self, state):
+        Report.loads += 1
+        self.__dict__.update(state)
+
+    def __eq__(self, other):
+        return isinstance(other, Report) and other.rows == self.rows
+
+
+@pytest.fixture(autouse=True)
+def reset_loads():
+    Report.loads = 0
+
+
+@pytest.fixture
+def lazy_cache(clean_caches):
+    cache = DictCache("lazy")
+    caches.register(DEFAULT_CACHE_NAME, cache, lazy_values=True)
+    yield cache
+
+
+@pytest.fixture
+def proxy(lazy_cache):
+    return caches.get_proxy(DEFAULT_CACHE_NAME)
+
+
+def test_stored_serialized(lazy_cache, proxy):
+    proxy.set("a", Report([1, 2]))
+    assert isinstance(lazy_cache.get("a"), SerializedValue)
+
+
+def test_loaded_on_first_access(proxy):
+    proxy.set("a", Report([1, 2]))
+    value = proxy.get("a")
+    assert isinstance(value, LazyValue)
+    assert Report.loads == 0
+    assert value.rows == [1, 2]
+    assert value.rows[0] == 1
+    assert Report.loads == 1
+    assert unwrap(value) == Report([1, 2])
+
+
+def test_item_access(proxy):
+    proxy.set("a", {"name": "bob", "roles": ["admin"]})
+    value = proxy.get("a")
+    assert value["name"] == "bob"
+    assert "roles" in value
+    assert len(value) == 2
+    assert value == {"name": "bob", "roles": ["admin"]}
+
+
+def test_get_many(proxy):
+    proxy.set("a", [1])
+    proxy.set("b", [2])
+    found = proxy.get_many(["a", "b", "c"])
+    assert {key: unwrap(value) for key, value in found.items()} == {
+        "a": [1],
+        "b": [2],
+    }
+    assert all(isinstance(value, LazyValue) for value in found.values())
+
+
+def test_decorated_function(lazy_cache):
+    calls = []
+
+    @slycache.cache_result("{rows}")
+    def make(rows):
+        calls.append(rows)
+        return Report([rows])
+
+    assert make(1).rows == [1]
+    value = make(1)
+    assert isinstance(value, LazyValue)
+    assert value.rows == [1]
+    assert calls == [1]
+
+
+def test_local_tier_reuses_decoded_value(clean_caches):
+    slycache.register_backend("local", LocalCache(), lazy_values=True)
+    proxy = caches.get_proxy("local")
+    proxy.set("a", Report([1]))
+    assert proxy.get("a").rows == [1]
+    assert proxy.get("a").rows == [1]
+    assert Report.loads == 1
+    assert unwrap(proxy.get("a")) is unwrap(proxy.get("a"))
+
+
+def test_pickling_proxy_stores_value(proxy):
+    proxy.set("a", Report([1]))
+    value = proxy.get("a")
+    assert pickle.loads(pickle.dumps(value)) == Report([1])
+    assert type(pickle.loads(pickle.dumps(value))) is Report
+
+
+def test_set_lazy_value_does_not_reserialize(lazy_cache, proxy):
+    proxy.set("a", Report([1]))
+    value = proxy.get("a")
+    proxy.set("b", value)
+    assert lazy_cache.get("b").data is lazy_cache.get("a").data
+
+
+@pytest.mark.parametrize("value", [None, 1, 1.5, True, "text", b"data"])
+def test_scalars_stored_as_is(lazy_cache, proxy, value):
+    proxy.set("a", value)
+    assert lazy_cache.get("a") == value
+    assert type(proxy.get("a")) is type(value)
+
+
+def test_decorated_scalar_result(lazy_cache):
+    @slycache.cache_result("{value}")
+    def count(value):
+        return value
+
+    assert count(1) + 1 == 2
+    assert count(1) + 1 == 2
+    assert count(1) < 2
+    assert json.dumps(count(1)) == "1"
+
+
+def test_operators_forwarded(proxy):
+    proxy.set("a", [1, 2])
+    value = proxy.get("a")
+    assert value + [3] == [1, 2, 3]
+    assert [0] + value == [0, 1, 2]
+    assert value * 2 == [1, 2, 1, 2]
+    assert value < [2]
+    assert value >= [1, 2]
+    assert sorted([proxy.get("a"), [0]]) == [[0], [1, 2]]
+
+
+def test_budgeted_local_cache_does_not_keep_decoded_value(clean_caches):
+    local = LocalCache(max_bytes=10_000)
+    slycache.register_backend("local", local, lazy_values=True)
+    proxy = caches.get_proxy("local")
+    proxy.set("a", Report([1]))
+    assert proxy.get("a").rows == [1]
+    assert proxy.get("a").rows == [1]
+    assert Report.loads == 2
+    assert local.get("a")._value is NOTSET
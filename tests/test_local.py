@@ -0,0 +1,159 @@
+import random
+import time
+
+import pytest
+
+from slycache import LocalCache, caches, slycache
+
+
+@pytest.fixture(params=["lru", "w-tinylfu"])
+def cache(request):
+    return LocalCache(max_entries=100, policy=request.param)
+
+
+def test_get_set_delete(cache):
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    cache.set("a", 2)
+    assert cache.get("a") == 2
+    cache.delete("a")
+    assert "a" not in cache
+    cache.delete("a")
+
+
+def test_get_many_set_many(cache):
+    cache.set_many({"a": 1, "b": 2})
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "b": 2}
+
+
+def test_timeout(cache):
+    cache.set("a", 1, timeout=0.05)
+    cache.set("b", 1, timeout=0)
+    assert cache.get("a") == 1
+    assert "b" not in cache
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.info()["expirations"] == 1
+
+
+def test_max_entries(cache):
+    for i in range(500):
+        cache.set(i, i)
+        cache.get(i)
+    assert len(cache) <= 100
+    assert cache.info()["evictions"] == 500 - len(cache)
+
+
+def test_lru_eviction_order():
+    cache = LocalCache(max_entries=2, policy="lru")
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        LocalCache(policy="fifo")
+
+
+def hit_ratio(cache, keys):
+    hits = 0
+    for key in keys:
+        if cache.get(key) is None:
+            cache.set(key, key)
+        else:
+            hits += 1
+    return hits / len(keys)
+
+
+def test_wtinylfu_resists_scans():
+    rng = random.Random(1)
+    keys = []
+    for i in range(20_000):
+        keys.append(f"hot{int(rng.paretovariate(1.0)) % 200}")
+        if i % 2:
+            keys.append(f"scan{i}")
+
+    lru = hit_ratio(LocalCache(max_entries=100, policy="lru"), keys)
+    tinylfu = hit_ratio(LocalCache(max_entries=100, policy="w-tinylfu"), keys)
+    assert tinylfu > lru
+
+
+def test_registered_stats(clean_caches):
+    slycache.register_backend("local", LocalCache(max_entries=10))
+
+    @slycache.with_defaults(cache_name="local").cache_result("{value}")
+    def compute(value):
+        return value
+
+    compute(1)
+    compute(1)
+    stats = caches.stats("local")["local"]
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.fixture(params=["lru", "w-tinylfu"])
+def sized_cache(request):
+    return LocalCache(max_bytes=1000, sizer=len, policy=request.param)
+
+
+def test_max_bytes(sized_cache):
+    for i in range(100):
+        key = f"ns{i % 2}:{i:03}"
+        sized_cache.set(key, "x" * 93)
+        sized_cache.get(key)
+
+    info = sized_cache.info()
+    assert info["bytes"] <= 1000
+    assert info["bytes"] == 100 * len(sized_cache)
+    assert sum(info["namespaces"].values()) == info["bytes"]
+    assert set(info["namespaces"]) <= {"ns0", "ns1"}
+    assert info["evicted_bytes"] == 100 * info["evictions"]
+
+
+def test_max_bytes_replace_and_delete(sized_cache):
+    sized_cache.set("a:1", "x" * 99)
+    sized_cache.set("a:1", "x" * 9)
+    assert sized_cache.info()["bytes"] == 12
+    sized_cache.delete("a:1")
+    assert sized_cache.info()["bytes"] == 0
+    assert sized_cache.info()["namespaces"] == {}
+
+
+def test_too_large_is_rejected(sized_cache):
+    sized_cache.set("a", "small")
+    sized_cache.set("a", "x" * 2000)
+    assert "a" not in sized_cache
+    assert sized_cache.info()["rejected"] == 1
+
+
+def test_default_sizer():
+    cache = LocalCache(max_bytes=10_000)
+    cache.set("a", {"values": list(range(100))})
+    assert 100 < cache.info()["bytes"] < 10_000
+
+
+def test_expired_entries_reclaimed_without_reads(cache):
+    cache = LocalCache(
+        max_entries=100, policy=cache.policy_name, expiry_resolution=0.01
+    )
+    for i in range(10):
+        cache.set(f"old:{i}", i, timeout=0.02)
+    cache.set("kept", 1, timeout=10)
+    time.sleep(0.05)
+    cache.set("new", 1)
+    assert len(cache) == 2
+    assert cache.info()["expirations"] == 10
+
+
+def test_wheel_advances_while_idle():
+    cache = LocalCache(expiry_resolution=0.001)
+    time.sleep(0.02)
+    before = cache._wheel.to_tick(time.monotonic())
+    cache.get("missing")
+    assert cache._wheel._tick >= before
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from slycache import CacheResult, ParallelLookup, slycache
+from slycache.const import NOTSET
+
+
+class BarrierCache:
+    """Cache whose gets only return once ``barrier.parties`` gets are in progress."""
+
+    def __init__(self, barrier, data=None):
+        self.barrier = barrier
+        self.data = data or {}
+        self.threads = set()
+
+    def get(self, key, default=None):
+        self.threads.add(threading.get_ident())
+        self.barrier.wait(timeout=5)
+        return self.data.get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def test_parallel_lookup_priority():
+    lookup = ParallelLookup()
+    values = {"a": NOTSET, "b": "b", "c": "c"}
+
+    def fetch(candidate):
+        if candidate == "b":
+            time.sleep(0.02)  # lower priority hit arrives first
+        return values[candidate]
+
+    assert lookup.lookup(["a", "b", "c"], fetch) == ("b", "b")
+    assert lookup.lookup(["a"], fetch) == (None, NOTSET)
+    lookup.shutdown()
+
+
+@pytest.fixture
+def parallel_lookup():
+    lookup = ParallelLookup()
+    yield lookup
+    lookup.shutdown()
+
+
+@pytest.mark.parametrize("hit", [True, False])
+def test_parallel_lookup_decorator(clean_caches, parallel_lookup, hit):
+    # all 4 lookups must be in progress at the same time for the barrier to release them
+    barrier = threading.Barrier(4)
+    default = BarrierCache(barrier)
+    other = BarrierCache(barrier)
+    clean_caches.register("default", default)
+    clean_caches.register("other", other)
+    if hit:
+        other.data["ns:b_1"] = "cached"
+
+    parallel = slycache.with_defaults(namespace="ns", lookup=parallel_lookup)
+
+    @parallel.caching(
+        CacheResult(["a_{arg}", "b_{arg}"]),
+        CacheResult(["a_{arg}", "b_{arg}"], cache_name="other"),
+    )
+    def compute(arg):
+        return "computed"
+
+    assert compute(1) == ("cached" if hit else "computed")
+    assert len(default.threads | other.threads) == 4
@@ -0,0 +1,91 @@
+import gc
+
+from slycache import slycache
+
+
+class Report:
+    def __init__(self, report_id):
+        self.id = report_id
+        self.calls = []
+
+    @slycache.cache_method()
+    def total(self, year, scale=1):
+        self.calls.append(year)
+        return year * scale
+
+    @slycache.with_defaults(namespace="report").cache_method("{self.id}_{year}")
+    def summary(self, year):
+        self.calls.append(year)
+        return f"{self.id} {year}"
+
+    @slycache.cache_method()
+    def nothing(self):
+        self.calls.append(None)
+
+
+class SlottedReport:
+    __slots__ = ("calls", "_slycache_memo")
+
+    def __init__(self):
+        self.calls = 0
+
+    @slycache.cache_method()
+    def value(self):
+        self.calls += 1
+        return 1
+
+
+def test_per_instance():
+    report, other = Report(1), Report(2)
+    assert report.total(2020) == 2020
+    assert report.total(2020) == 2020
+    assert report.total(2020, scale=2) == 4040
+    assert report.calls == [2020, 2020]
+
+    assert other.total(2020) == 2020
+    assert other.calls == [2020]
+
+    Report.total.clear_cache(report, 2020)
+    report.total(2020)
+    assert report.calls == [2020, 2020, 2020]
+
+
+def test_none_not_cached():
+    report = Report(1)
+    report.nothing()
+    report.nothing()
+    assert report.calls == [None, None]
+
+
+def test_memory_released():
+    store = Report.total.instance_store
+    report = Report(1)
+    report.total(2020)
+    assert store.get(report, create=False) is not None
+    size = len(store)
+    del report
+    gc.collect()
+    assert len(store) == size - 1
+
+
+def test_shared_tier(default_cache):
+    report = Report(1)
+    assert report.summary(2020) == "1 2020"
+    assert default_cache.get("report:1_2020") == "1 2020"
+
+    # a new instance is served from the shared tier
+    same_report = Report(1)
+    assert same_report.summary(2020) == "1 2020"
+    assert same_report.calls == []
+
+    Report.summary.clear_cache(report, 2020)
+    assert "report:1_2020" not in default_cache
+    assert report.summary(2020) == "1 2020"
+    assert report.calls == [2020, 2020]
+
+
+def test_slotted_instance():
+    report = SlottedReport()
+    assert report.value() == 1
+    assert report.value() == 1
+    assert report.calls == 1
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+
+from slycache import JitteredTTL, RefreshAhead, slycache
+
+
+@pytest.fixture
+def refresher():
+    scheduler = RefreshAhead(max_workers=2, lead=0.5, idle_timeout=5)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for condition")
+        time.sleep(0.01)
+
+
+def test_refresh_ahead(default_cache, refresher):
+    calls = []
+
+    @slycache.cache_result("{value}", timeout=1, refresh_ahead=refresher)
+    def compute(value):
+        calls.append(value)
+        return len(calls)
+
+    assert compute(1) == 1
+    assert refresher.snapshot()["entries"] == 1
+
+    wait_for(lambda: refresher.snapshot()["refreshed"] >= 1)
+    assert default_cache.get("compute:value:1") >= 2
+    assert compute(1) >= 2
+
+
+def test_hit_is_refreshed_immediately(default_cache, refresher):
+    default_cache.set("compute:value:1", "cached")
+
+    @slycache.cache_result("{value}", timeout=60, refresh_ahead=refresher)
+    def compute(value):
+        return "fresh"
+
+    assert compute(1) == "cached"
+    wait_for(lambda: refresher.snapshot()["refreshed"] == 1)
+    assert default_cache.get("compute:value:1") == "fresh"
+
+
+def test_idle_entries_expire(default_cache):
+    refresher = RefreshAhead(lead=0.5, idle_timeout=0)
+    try:
+
+        @slycache.cache_result("{value}", timeout=0.1, refresh_ahead=refresher)
+        def compute(value):
+            return value
+
+        compute(1)
+        wait_for(lambda: refresher.snapshot()["expired"] == 1)
+        assert refresher.snapshot()["entries"] == 0
+        assert refresher.snapshot()["refreshed"] == 0
+    finally:
+        refresher.shutdown()
+
+
+def test_no_timeout_is_not_registered(default_cache, refresher):
+    @slycache.cache_result("{value}", refresh_ahead=refresher)
+    def compute(value):
+        return value
+
+    compute(1)
+    assert refresher.snapshot()["entries"] == 0
+
+
+def test_failed_refresh(default_cache, refresher):
+    calls = []
+
+    @slycache.cache_result("{value}", timeout=0.2, refresh_ahead=refresher)
+    def compute(value):
+        calls.append(value)
+        if len(calls) > 1:
+            raise ValueError
+        return value
+
+    compute(1)
+    wait_for(lambda: refresher.snapshot()["failed"] >= 1)
+
+
+def test_refresh_scheduled_from_minimum_jittered_timeout(default_cache, refresher):
+    @slycache.cache_result(
+        "{value}", timeout=JitteredTTL(100, jitter=0.5), refresh_ahead=refresher
+    )
+    def compute(value):
+        return value
+
+    start = time.monotonic()
+    compute(1)
+    (when, _, _) = refresher._schedule[0]
+    # lower bound of the timeout (50s) less the lead (0.5)
+    assert when - start == pytest.approx(25, abs=1)
@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+from slycache import Resilience, caches, slycache
+from slycache.resilience import CircuitBreaker, ResilientBackend
+from tests.mock_cache import DictCache
+
+
+class FlakyCache(DictCache):
+    def __init__(self, alias):
+        super().__init__(alias)
+        self.fail = False
+        self.delay = 0
+        self.calls = 0
+
+    def get(self, key, default=None):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("down")
+        return super().get(key, default)
+
+    def set(self, key, value, timeout=None):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        super().set(key, value, timeout)
+
+
+@pytest.fixture
+def flaky_cache(clean_caches):
+    cache = FlakyCache("default")
+    caches.register(
+        "default",
+        cache,
+        resilience=Resilience(failure_threshold=2, reset_timeout=60, timeout=0.05),
+    )
+    yield cache
+
+
+def test_breaker_transitions():
+    now = [0.0]
+    breaker = CircuitBreaker(2, 10, clock=lambda: now[0])
+    assert breaker.allow()
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+    now[0] = 10
+    assert breaker.allow()  # probe
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # only a single probe
+    assert breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    now[0] = 20
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_errors_are_misses(flaky_cache):
+    calls = []
+
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        calls.append(arg)
+        return arg
+
+    flaky_cache.fail = True
+    assert compute(1) == 1
+    assert calls == [1]
+
+    stats = caches.stats("default")
+    assert stats["errors"] == 2  # get & set
+    assert stats["breaker_opened"] == 1
+    assert stats["breaker"] == CircuitBreaker.OPEN
+
+    backend_calls = flaky_cache.calls
+    assert compute(1) == 1
+    assert calls == [1, 1]
+    assert flaky_cache.calls == backend_calls  # bypassed
+    assert caches.stats("default")["bypassed_gets"] == 1
+    assert caches.stats("default")["bypassed_sets"] == 1
+
+
+def test_timeout(flaky_cache):
+    flaky_cache.delay = 0.2
+    backend = caches["default"]
+    assert isinstance(backend, ResilientBackend)
+    assert backend.get("key", "default") == "default"
+    assert caches.stats("default")["timeouts"] == 1
+
+
+def test_slow_calls_count_as_failures(clean_caches):
+    cache = FlakyCache("default")
+    cache.delay = 0.01
+    caches.register(
+        "default",
+        cache,
+        resilience=Resilience(slow_call_threshold=0.001, failure_threshold=1),
+    )
+    cache.set("key", "value")
+    backend = caches["default"]
+    assert backend.get("key") == "value"
+    assert caches.stats("default")["slow_calls"] == 1
+    assert backend.breaker.state == CircuitBreaker.OPEN
+    assert caches.stats("default")["latency"]["count"] == 1
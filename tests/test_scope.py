@@ -0,0 +1,84 @@
+from slycache import request_scope, slycache
+from slycache.scope import current_scope
+from tests.mock_cache import DictCache
+
+
+class CountingCache(DictCache):
+    def __init__(self, alias):
+        super().__init__(alias)
+        self.gets = 0
+
+    def get(self, key, default=None):
+        self.gets += 1
+        return super().get(key, default)
+
+
+def test_scope_memoises_gets(clean_caches):
+    cache = CountingCache("default")
+    clean_caches.register("default", cache)
+    calls = []
+
+    @slycache.cache_result("{arg}")
+    def compute(arg):
+        calls.append(arg)
+        return arg
+
+    with request_scope():
+        assert compute(1) == 1
+        assert compute(1) == 1
+        assert compute(1) == 1
+    assert calls == [1]
+    assert cache.gets == 1
+
+    # outside the scope the backend is used again
+    assert compute(1) == 1
+    assert cache.gets == 2
+
+
+def test_scope_updated_by_put_and_remove(clean_caches):
+    cache = CountingCache("default")
+    clean_caches.register("default", cache)
+    ns = slycache.with_defaults(namespace="ns")
+
+    @ns.cache_result("{key}")
+    def get(key):
+        return None
+
+    @ns.cache_put("{key}", cache_value="value")
+    def put(key, value):
+        pass
+
+    @ns.cache_remove("{key}")
+    def remove(key):
+        pass
+
+    with request_scope():
+        assert get("a") is None
+        put("a", "value")
+        assert get("a") == "value"
+        remove("a")
+        assert get("a") is None
+    assert cache.gets == 1
+
+
+def test_scope_key_memo(default_cache):
+    with request_scope() as scope:
+
+        @slycache.cache_result("{arg}")
+        def compute(arg, other=None):
+            return arg
+
+        compute(1)
+        compute(True)
+        compute("1", other=[])  # mutable args are not memoised
+        keys = sorted(keys[0] for keys in scope.keys.values())
+        assert keys == ["compute:arg,other:1", "compute:arg,other:True"]
+
+
+def test_nested_scope():
+    assert current_scope() is None
+    with request_scope() as outer:
+        with request_scope() as inner:
+            assert inner is outer
+        assert current_scope() is outer
+    assert current_scope() is None
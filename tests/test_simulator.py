@@ -0,0 +1,73 @@
+import random
+
+from slycache import slycache
+from slycache.simulator import (
+    LFU,
+    LRU,
+    TTL,
+    Access,
+    TinyLFU,
+    load_accesses,
+    miss_ratio_curves,
+    simulate,
+)
+from slycache.trace import TraceRecorder
+
+
+def accesses(keys, size=1, step=1.0):
+    return [Access(i * step, key, size) for i, key in enumerate(keys)]
+
+
+def test_lru():
+    result = simulate(accesses([1, 2, 1, 3, 2, 1]), LRU(2))
+    assert (result.accesses, result.hits) == (6, 1)
+
+
+def test_lfu():
+    result = simulate(accesses([1, 1, 2, 3, 1, 2]), LFU(2))
+    assert result.hits == 2
+
+
+def test_weigh_by_size():
+    policy = LRU(10, weigh_by_size=True)
+    simulate(accesses([1, 2, 3], size=4), policy)
+    assert policy.used == 8
+
+
+def test_ttl():
+    result = simulate(accesses([1, 1, 1, 1], step=10), TTL(15))
+    assert result.hits == 2
+    assert result.capacity is None
+
+
+def test_tinylfu_resists_scans():
+    rng = random.Random(1)
+    hot = list(range(10))
+    keys = []
+    for i in range(5000):
+        keys.append(rng.choice(hot))
+        keys.append(1000 + i)  # scan of keys that are never reused
+    trace = accesses(keys)
+
+    lru = simulate(trace, LRU(20))
+    tinylfu = simulate(trace, TinyLFU(20))
+    assert tinylfu.miss_ratio < lru.miss_ratio
+
+
+def test_curves_from_trace(default_cache, tmp_path):
+    @slycache.cache_result("{value}", skip_get=False)
+    def compute(value):
+        return value
+
+    path = tmp_path / "cache.trace"
+    with TraceRecorder(str(path)):
+        for value in [1, 2, 3, 1, 2, 3]:
+            default_cache._cache.clear()
+            compute(value)
+
+    trace = load_accesses(str(path))
+    assert len(trace) == 6
+    curves = miss_ratio_curves(trace, [1, 3], ttl=60)
+    assert set(curves) == {"lru", "lfu", "tinylfu", "ttl"}
+    assert curves["lru"][0].miss_ratio == 1
+    assert curves["lru"][1].miss_ratio == 0.5
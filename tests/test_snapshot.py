@@ -0,0 +1,160 @@
+import threading
+import time
+
+import pytest
+
+from slycache import LocalCache
+from slycache.const import NOTSET
+from slycache.serialization import SerializedValue
+from slycache.snapshot import PeriodicSnapshot, SnapshotValue, read_snapshot
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "local.snapshot")
+
+
+def test_snapshot_restore(path):
+    cache = LocalCache()
+    cache.set("a", {"value": 1})
+    cache.set("b", [1, 2], timeout=60)
+    cache.set("expired", 1, timeout=0.01)
+    time.sleep(0.02)
+    assert cache.snapshot(path) == 2
+
+    restored = LocalCache()
+    restored.set("a", "newer")
+    assert restored.restore(path) == 1
+    assert restored.get("a") == "newer"
+    assert restored.get("b") == [1, 2]
+    assert "expired" not in restored
+    assert restored._data["b"].expires_at - time.monotonic() == pytest.approx(60, abs=1)
+
+
+def test_values_loaded_on_first_access(path):
+    cache = LocalCache()
+    cache.set("a", {"value": 1})
+    cache.snapshot(path)
+
+    restored = LocalCache()
+    restored.restore(path)
+    assert isinstance(restored._data["a"].value, SnapshotValue)
+    assert restored.get("a") == {"value": 1}
+    assert restored.get("a") is restored.get("a")
+
+
+def test_snapshot_of_restored_cache(path, tmp_path):
+    cache = LocalCache()
+    cache.set("a", 1)
+    cache.snapshot(path)
+    restored = LocalCache()
+    restored.restore(path)
+
+    other_path = str(tmp_path / "other.snapshot")
+    assert restored.snapshot(other_path) == 1
+    assert [key for key, _, _ in read_snapshot(other_path)] == ["a"]
+
+
+def test_elapsed_time_deducted(path):
+    cache = LocalCache()
+    cache.set("a", 1, timeout=0.05)
+    cache.set("b", 1, timeout=60)
+    cache.snapshot(path)
+    time.sleep(0.06)
+    assert [key for key, _, _ in read_snapshot(path)] == ["b"]
+
+
+def test_unpicklable_values_skipped(path):
+    cache = LocalCache()
+    cache.set("a", threading.Lock())
+    cache.set("b", 1)
+    assert cache.snapshot(path) == 1
+
+
+def test_truncated_snapshot(path):
+    cache = LocalCache()
+    cache.set("a", 1)
+    cache.set("b", "x" * 100)
+    cache.snapshot(path)
+    with open(path, "r+b") as file:
+        file.truncate(file.seek(0, 2) - 10)
+
+    restored = LocalCache()
+    assert restored.restore(path) == 1
+    assert restored.get("a") == 1
+
+
+def test_not_a_snapshot(path):
+    with open(path, "wb") as file:
+        file.write(b"not a snapshot")
+    with pytest.raises(ValueError):
+        LocalCache().restore(path)
+
+
+def test_periodic_snapshot(path):
+    cache = LocalCache()
+    cache.set("a", 1)
+    snapshots = PeriodicSnapshot(cache, path, interval=0.01, at_exit=False).start()
+    time.sleep(0.05)
+    snapshots.stop()
+    assert [key for key, _, _ in read_snapshot(path)] == ["a"]
+
+
+class Slow:
+    loading = None
+    release = None
+
+    def __reduce__(self):
+        return _load_slow, ()
+
+
+def _load_slow():
+    Slow.loading.set()
+    Slow.release.wait(timeout=5)
+    return "slow"
+
+
+def test_values_loaded_outside_the_lock(path):
+    cache = LocalCache()
+    cache.set("slow", Slow())
+    cache.snapshot(path)
+    restored = LocalCache()
+    restored.restore(path)
+
+    Slow.loading, Slow.release = threading.Event(), threading.Event()
+    reader = threading.Thread(target=lambda: restored.get("slow"))
+    reader.start()
+    assert Slow.loading.wait(timeout=5)
+    # other keys can be used while the value is being loaded
+    restored.set("other", 1)
+    assert restored.get("other") == 1
+    restored.set("slow", "newer")
+    Slow.release.set()
+    reader.join()
+    assert restored.get("slow") == "newer"
+
+
+def test_restored_serialized_values_not_memoized_when_budgeted(path):
+    cache = LocalCache(max_bytes=10_000)
+    cache.set("k", SerializedValue.of({"value": 1}))
+    cache.snapshot(path)
+
+    budgeted = LocalCache(max_bytes=10_000)
+    budgeted.restore(path)
+    assert budgeted.get("k").memoize is False
+    assert budgeted.get("k").load() == {"value": 1}
+    assert budgeted.get("k")._value is NOTSET
+
+    unbounded = LocalCache()
+    unbounded.restore(path)
+    assert unbounded.get("k").memoize is True
+
+
+def test_restore_counts_retained_entries(path):
+    cache = LocalCache()
+    for index in range(10):
+        cache.set(f"k{index}", index)
+    cache.snapshot(path)
+
+    small = LocalCache(max_entries=2, policy="lru")
+    assert small.restore(path) == len(small) == 2
@@ -0,0 +1,77 @@
+import pytest
+
+from slycache import hooks, slycache
+from slycache.serialization import dumps
+from slycache.trace import HIT, MISS, SET, TraceRecorder, key_hash, read_trace
+from slycache.tracing import CacheEvent
+
+
+@slycache.cache_result("{value}")
+def compute(value):
+    return "x" * value
+
+
+def test_record_trace(default_cache, tmp_path):
+    path = tmp_path / "cache.trace"
+    with TraceRecorder(str(path)):
+        compute(10)
+        compute(10)
+        compute(20)
+    assert not hooks.active
+
+    records = list(read_trace(str(path)))
+    assert [record.kind for record in records] == [MISS, SET, HIT, MISS, SET]
+    assert records[0].key_hash == key_hash("compute:value:10")
+    assert records[0].function == "tests.test_trace.compute"
+    assert records[1].size > 10
+    assert records[4].size > records[1].size
+    assert all(record.compute_time >= 0 for record in records)
+    assert records[0].timestamp <= records[-1].timestamp
+
+
+def test_filter_by_function(default_cache, tmp_path):
+    @slycache.cache_result("{value}")
+    def other(value):
+        return value
+
+    path = tmp_path / "cache.trace"
+    with TraceRecorder(str(path)):
+        compute(1)
+        other(1)
+
+    records = list(read_trace(str(path), function="tests.test_trace.compute"))
+    assert len(records) == 2
+
+
+def test_sampling_is_per_key(default_cache, tmp_path):
+    path = tmp_path / "cache.trace"
+    recorder = TraceRecorder(str(path), sample_rate=0.5)
+    with recorder:
+        for _ in range(3):
+            for value in range(40):
+                compute(value)
+
+    counts = {}
+    for record in read_trace(str(path)):
+        if record.is_access:
+            counts[record.key_hash] = counts.get(record.key_hash, 0) + 1
+    assert 0 < len(counts) < 40
+    assert set(counts.values()) == {3}
+
+
+def test_value_sized_when_recorded(tmp_path):
+    recorder = TraceRecorder(str(tmp_path / "cache.trace"))
+    value = ["x"] * 10
+    recorder(CacheEvent("set", compute, "default", "key", 0.0, 0, value))
+    value.extend(["y"] * 100)
+
+    record = recorder._queue.get_nowait()
+    assert record[4] == len(dumps(["x"] * 10))
+    assert all(item is not value for item in record)
+
+
+def test_invalid_file(tmp_path):
+    path = tmp_path / "bad.trace"
+    path.write_bytes(b"nope")
+    with pytest.raises(ValueError):
+        list(read_trace(str(path)))
@@ -0,0 +1,112 @@
+import pytest
+
+from slycache import TracingHook, hooks, slycache
+
+
+@pytest.fixture
+def events():
+    received = []
+    hooks.register(received.append)
+    yield received
+    hooks.clear()
+
+
+@slycache.cache_result("{value}")
+def compute(value):
+    return value
+
+
+@slycache.cache_remove("{value}")
+def remove(value):
+    pass
+
+
+def test_events(default_cache, events):
+    compute(1)
+    compute(1)
+    remove(1)
+
+    assert [(e.name, e.key) for e in events] == [
+        ("before_get", "compute:value:1"),
+        ("miss", "compute:value:1"),
+        ("after_compute", None),
+        ("set", "compute:value:1"),
+        ("before_get", "compute:value:1"),
+        ("hit", "compute:value:1"),
+        ("after_compute", None),
+        ("delete", "remove:value:1"),
+    ]
+    assert all(e.function.__name__ in ("compute", "remove") for e in events)
+    assert all(e.cache_name == "default" for e in events if e.key)
+    assert all(e.elapsed >= 0 for e in events if e.name != "before_get")
+
+
+def test_inactive_without_callbacks():
+    assert not hooks.active
+    callback = hooks.register(lambda event: None, events=["hit"])
+    assert hooks.active
+    hooks.unregister(callback)
+    assert not hooks.active
+
+
+def test_unknown_event():
+    with pytest.raises(ValueError):
+        hooks.register(lambda event: None, events=["nope"])
+
+
+def test_failing_hook_is_ignored(default_cache):
+    def fail(event):
+        raise ValueError
+
+    hooks.register(fail)
+    try:
+        assert compute(2) == 2
+    finally:
+        hooks.clear()
+
+
+class FakeSpan:
+    def __init__(self, name, attributes, start_time):
+        self.name = name
+        self.attributes = attributes
+        self.start_time = start_time
+        self.end_time = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, end_time=None):
+        self.end_time = end_time
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None, start_time=None):
+        span = FakeSpan(name, attributes, start_time)
+        self.spans.append(span)
+        return span
+
+
+def test_tracing_hook(default_cache):
+    tracer = FakeTracer()
+    TracingHook(tracer).register()
+    try:
+        compute(3)
+    finally:
+        hooks.clear()
+
+    assert [span.name for span in tracer.spans] == [
+        "cache lookup",
+        "compute",
+        "cache store",
+    ]
+    lookup = tracer.spans[0]
+    assert lookup.attributes == {
+        "slycache.function": "compute",
+        "slycache.cache": "default",
+        "slycache.key": "compute:value:3",
+        "slycache.hit": False,
+    }
+    assert all(span.end_time >= span.start_time for span in tracer.spans)
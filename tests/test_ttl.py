@@ -0,0 +1,73 @@
+import pytest
+
+from slycache import AdaptiveTTL, FixedTTL, JitteredTTL, slycache
+
+
+def test_fixed_ttl():
+    assert FixedTTL(60).get_timeout("key", "value") == 60
+
+
+def test_jittered_ttl():
+    policy = JitteredTTL(100, jitter=0.2)
+    timeouts = {policy.get_timeout("key", "value") for _ in range(200)}
+    assert min(timeouts) >= 80
+    assert max(timeouts) <= 120
+    assert len(timeouts) > 1
+
+
+def test_jittered_ttl_validation():
+    with pytest.raises(ValueError):
+        JitteredTTL(100, jitter=1)
+
+
+def test_adaptive_ttl():
+    policy = AdaptiveTTL(10, max_timeout=35)
+    assert policy.get_timeout("a", 1) == 10
+    assert policy.get_timeout("a", 1) == 20
+    assert policy.get_timeout("b", 1) == 10
+    assert policy.get_timeout("a", 1) == 35
+    assert policy.get_timeout("a", 2) == 10
+
+
+def test_adaptive_ttl_bounded():
+    policy = AdaptiveTTL(10, max_timeout=100, max_entries=2)
+    policy.get_timeout("a", 1)
+    policy.get_timeout("b", 1)
+    policy.get_timeout("c", 1)
+    assert policy.get_timeout("a", 1) == 10
+    assert policy.get_timeout("c", 1) == 20
+
+
+def test_policy_as_timeout(default_cache):
+    @slycache.cache_result(
+        "{value}", timeout=AdaptiveTTL(10, max_timeout=100), skip_get=True
+    )
+    def compute(value):
+        return value
+
+    compute(1)
+    assert default_cache.get_entry("compute:value:1").timeout == 10
+    compute(1)
+    assert default_cache.get_entry("compute:value:1").timeout == 20
+
+
+def test_policy_as_default(default_cache):
+    jittered = slycache.with_defaults(timeout=JitteredTTL(100, jitter=0.5))
+
+    @jittered.cache_result("{value}")
+    def compute(value):
+        return value
+
+    compute(1)
+    assert 50 <= default_cache.get_entry("compute:value:1").timeout <= 150
+
+
+def test_min_timeout():
+    assert FixedTTL(60).min_timeout("a") == 60
+    assert JitteredTTL(100, jitter=0.2).min_timeout("a") == 80
+
+    policy = AdaptiveTTL(10, max_timeout=100)
+    assert policy.min_timeout("a") == 10
+    policy.get_timeout("a", 1)
+    policy.get_timeout("a", 1)
+    assert policy.min_timeout("a") == 20
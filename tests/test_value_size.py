@@ -0,0 +1,116 @@
+import pytest
+
+from slycache import CacheResult, caches, slycache
+from slycache.const import DEFAULT_CACHE_NAME
+from slycache.slycache import LargeValueRef
+from tests.mock_cache import DictCache
+
+
+@pytest.fixture
+def limited_cache(clean_caches):
+    cache = DictCache("limited")
+    large = DictCache("large")
+    caches.register(DEFAULT_CACHE_NAME, cache, max_value_size=100)
+    caches.register("large", large)
+    yield cache, large
+
+
+def test_oversized_values_are_skipped(limited_cache):
+    cache, _ = limited_cache
+
+    @slycache.cache_result("{size}")
+    def make(size):
+        return "x" * size
+
+    make(10)
+    assert cache.get("make:size:10") == "x" * 10
+
+    make(1000)
+    assert "make:size:1000" not in cache
+    assert caches.stats(DEFAULT_CACHE_NAME)["oversized_skipped"] == 1
+
+
+def test_oversized_value_removes_stale_value(limited_cache):
+    cache, _ = limited_cache
+
+    @slycache.cache_put("{key}", cache_value="value")
+    def save(key, value):
+        pass
+
+    save("k", "small")
+    assert cache.get("save:key,value:k") == "small"
+    save("k", "x" * 1000)
+    assert "save:key,value:k" not in cache
+
+
+def test_invocation_override(limited_cache):
+    cache, _ = limited_cache
+
+    @slycache.cache_result("{size}", max_value_size=None)
+    def make(size):
+        return "x" * size
+
+    make(1000)
+    assert cache.get("make:size:1000") == "x" * 1000
+
+
+def test_large_value_redirect(limited_cache):
+    cache, large = limited_cache
+    calls = []
+
+    @slycache.caching(CacheResult(["{size}"], large_value="large"))
+    def make(size):
+        calls.append(size)
+        return "x" * size
+
+    assert make(1000) == "x" * 1000
+    assert cache.get("make:size:1000") == LargeValueRef("large")
+    assert large.get("make:size:1000") == "x" * 1000
+    assert caches.stats(DEFAULT_CACHE_NAME)["oversized_redirected"] == 1
+
+    assert make(1000) == "x" * 1000
+    assert calls == [1000]
+
+    large.delete("make:size:1000")
+    assert make(1000) == "x" * 1000
+    assert calls == [1000, 1000]
+
+
+def test_large_value_get_many(limited_cache):
+    cache, large = limited_cache
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    proxy = proxy.__class__(DEFAULT_CACHE_NAME, large_value="large")
+    proxy = proxy.merge_with_global_defaults()
+
+    proxy.set("small", "x")
+    proxy.set("big", "x" * 1000)
+    assert proxy.get_many(["small", "big", "missing"]) == {
+        "small": "x",
+        "big": "x" * 1000,
+    }
+
+
+@pytest.fixture
+def redirect_proxy(limited_cache):
+    proxy = caches.get_proxy(DEFAULT_CACHE_NAME)
+    return proxy.__class__(
+        DEFAULT_CACHE_NAME, large_value="large"
+    ).merge_with_global_defaults()
+
+
+def test_delete_removes_redirected_value(limited_cache, redirect_proxy):
+    cache, large = limited_cache
+    redirect_proxy.set("big", "x" * 1000)
+    assert "big" in large
+
+    caches.get_proxy(DEFAULT_CACHE_NAME).delete("big")
+    assert "big" not in cache
+    assert "big" not in large
+
+
+def test_small_value_replaces_redirected_value(limited_cache, redirect_proxy):
+    cache, large = limited_cache
+    redirect_proxy.set("big", "x" * 1000)
+    redirect_proxy.set("big", "small")
+    assert cache.get("big") == "small"
+    assert "big" not in large
@@ -0,0 +1,90 @@
+import threading
+import time
+
+import pytest
+
+from slycache import slycache
+from slycache.exceptions import SlycacheException
+
+warm_cache = slycache.with_defaults(namespace="warm")
+
+
+@warm_cache.cache_result("{a}_{b}")
+def add(a, b):
+    return a + b
+
+
+def test_warm(default_cache):
+    default_cache.set("warm:1_0", "cached")
+    progress = []
+
+    report = add.warm(
+        [(1, 0), (2, 0), (3, 4), {"a": 5, "b": 6}],
+        chunk_size=2,
+        progress=lambda r: progress.append(r.processed),
+    )
+    assert (report.total, report.skipped, report.computed, report.failed) == (
+        4,
+        1,
+        3,
+        0,
+    )
+    assert progress == [2, 4]
+    assert default_cache.get("warm:1_0") == "cached"
+    assert default_cache.get("warm:2_0") == 2
+    assert default_cache.get("warm:3_4") == 7
+    assert default_cache.get("warm:5_6") == 11
+
+
+class Concurrency:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __enter__(self):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        with self.lock:
+            self.running -= 1
+
+
+def test_warm_concurrency_limit(default_cache):
+    concurrency = Concurrency()
+
+    @warm_cache.cache_result("slow_{a}")
+    def slow(a):
+        with concurrency:
+            time.sleep(0.05)
+        return a
+
+    default_cache.set("warm:slow_0", 0)
+    report = slow.warm([(a,) for a in range(7)], max_workers=2, chunk_size=7)
+    assert (report.skipped, report.computed, report.failed) == (1, 6, 0)
+    assert concurrency.peak == 2
+    assert report.elapsed < report.compute_time
+
+
+def test_warm_failures(default_cache):
+    report = add.warm([(1, "a")])
+    assert report.failed == 1
+    assert isinstance(report.errors[0], TypeError)
+
+
+def test_warm_processes(default_cache):
+    report = add.warm([(1, 2), (3, 4)], use_processes=True, max_workers=2)
+    assert report.computed == 2
+    assert default_cache.get("warm:1_2") == 3
+    assert default_cache.get("warm:3_4") == 7
+
+
+def test_warm_processes_local_function(default_cache):
+    @slycache.cache_result("{a}")
+    def local(a):
+        return a
+
+    with pytest.raises(SlycacheException):
+        local.warm([(1,)], use_processes=True)
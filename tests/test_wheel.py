@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from slycache.wheel import TimingWheel
+
+
+def test_expires_after_deadline():
+    wheel = TimingWheel(resolution=1.0, slots=4, levels=2, start=0)
+    wheel.schedule("a", 2.5)
+    wheel.schedule("b", 3)
+    assert len(wheel) == 2
+    assert wheel.advance(2.9) == []
+    assert wheel.advance(3) == ["a", "b"]
+    assert len(wheel) == 0
+
+
+def test_cancel_and_reschedule():
+    wheel = TimingWheel(resolution=1.0, slots=4, levels=2, start=0)
+    wheel.schedule("a", 2)
+    wheel.schedule("b", 2)
+    wheel.cancel("a")
+    wheel.schedule("b", 10)
+    assert wheel.advance(5) == []
+    assert wheel.advance(10) == ["b"]
+
+
+def test_past_deadline_expires_on_next_tick():
+    wheel = TimingWheel(resolution=1.0, start=10)
+    wheel.schedule("a", 5)
+    assert wheel.advance(10.5) == []
+    assert wheel.advance(11) == ["a"]
+
+
+@pytest.mark.parametrize("levels", [1, 2, 3])
+def test_cascading(levels):
+    rng = random.Random(levels)
+    wheel = TimingWheel(resolution=1.0, slots=4, levels=levels, start=0)
+    deadlines = {key: rng.randint(1, 200) for key in range(500)}
+    for key, deadline in deadlines.items():
+        wheel.schedule(key, deadline)
+
+    now = 0
+    while now < 210:
+        now += rng.randint(1, 7)
+        for key in wheel.advance(now):
+            assert deadlines.pop(key) <= now
+        assert all(deadline > now for deadline in deadlines.values())
+    assert not deadlines
+
+
+def test_large_jump():
+    wheel = TimingWheel(resolution=1.0, slots=4, levels=2, start=0)
+    wheel.schedule("a", 5)
+    wheel.schedule("b", 1000)
+    assert wheel.advance(500) == ["a"]
+    assert wheel.advance(1000) == ["b"]
+
+
+def test_slots_power_of_two():
+    with pytest.raises(ValueError):
+        TimingWheel(slots=10)
+
+
+def test_idle_wheel_keeps_up_with_time():
+    wheel = TimingWheel(resolution=0.001, start=0)
+    assert wheel.advance(3600) == []
+    wheel.schedule("a", 3600.5)
+    assert wheel.advance(3600.4) == []
+    assert wheel.advance(3600.5) == ["a"]
+
+
+def test_long_gap_with_entries():
+    wheel = TimingWheel(resolution=0.001, start=0)
+    wheel.schedule("a", 1)
+    wheel.schedule("b", 7200)
+    assert wheel.advance(3600) == ["a"]
+    assert wheel._tick == 3_600_000
+    assert wheel.advance(7200) == ["b"]